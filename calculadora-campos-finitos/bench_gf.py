@@ -0,0 +1,393 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from gf import GF
+from gf_poly import GFPolynomial
+
+# GF(2^16): x^16 + x^12 + x^3 + x + 1
+GF16_POLY = 0x1100B
+
+# Campos y operaciones de la suite de regresión
+SUITE_DEGREES = (2, 4, 8, 16, 32, 64, 128, 163, 233)
+SUITE_OPERATIONS = ("suma", "multiplicacion", "division", "potencia", "inverso")
+# Los arreglos de NumPy solo admiten campos de grado a lo más 32
+ARRAY_MAX_DEGREE = 32
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+# Fracción de pérdida de rendimiento tolerada antes de marcar una regresión
+DEFAULT_THRESHOLD = 0.25
+# Tiempo aproximado por ejecución de cada caso; las operaciones lentas usan menos operandos
+CASE_TIME_BUDGET = 0.05
+
+
+def bench_working_set(field, n):
+    """
+    Mide la memoria por elemento de un conjunto de trabajo de n elementos y el
+    tiempo por multiplicación al recorrerlo.
+
+    :return: Diccionario con bytes por elemento y nanosegundos por operación.
+    """
+    tracemalloc.start()
+    elements = [field.element((i * 40503) & (field.order - 1)) for i in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for a, b in zip(elements, elements[1:]):
+        a * b
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes_per_element": current / n,
+        "ns_per_mul": elapsed / max(n - 1, 1) * 1e9,
+    }
+
+
+def bench_batch_inverse(field, n):
+    """
+    Compara la inversión elemento a elemento (1 / a) contra GF.batch_inverse.
+
+    :return: Diccionario con los microsegundos por elemento de cada variante.
+    """
+    rng = random.Random(0)
+    elements = [field.element(rng.randrange(1, field.order)) for _ in range(n)]
+    one = field.element(1)
+
+    start = time.perf_counter()
+    for a in elements:
+        one / a
+    elementwise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    field.batch_inverse(elements)
+    batch = time.perf_counter() - start
+    return {
+        "us_elementwise": elementwise / n * 1e6,
+        "us_batch": batch / n * 1e6,
+        "speedup": elementwise / batch,
+    }
+
+
+def bench_polynomials(field, degree):
+    """
+    Mide multiplicación, evaluación en degree + 1 puntos e interpolación de
+    polinomios de grado 'degree'. Si el campo tiene menos elementos, se usan
+    todos sus elementos como puntos.
+
+    :return: Diccionario con los milisegundos de cada operación.
+    """
+    rng = random.Random(0)
+    field.tables()  # Las tablas se construyen fuera de la medición
+    a = GFPolynomial(field, [rng.randrange(field.order) for _ in range(degree + 1)])
+    b = GFPolynomial(field, [rng.randrange(field.order) for _ in range(degree + 1)])
+    points = [field.element(v) for v in rng.sample(range(field.order), min(degree + 1, field.order))]
+    timings = {}
+
+    start = time.perf_counter()
+    a * b
+    timings["ms_mul"] = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    values = a.evaluate(points)
+    timings["ms_evaluate"] = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    GFPolynomial.interpolate(field, points, values)
+    timings["ms_interpolate"] = (time.perf_counter() - start) * 1e3
+    return timings
+
+
+def bench_matrices(field, n):
+    """
+    Mide el producto, la inversa, la solución de un sistema y el rango de una
+    matriz aleatoria de n x n.
+
+    :return: Diccionario con los segundos de cada operación.
+    """
+    from gf_matrix import GFMatrix  # Requiere NumPy
+
+    rng = random.Random(0)
+    a = GFMatrix(field, [[rng.randrange(field.order) for _ in range(n)] for _ in range(n)])
+    b = field.array([rng.randrange(field.order) for _ in range(n)])
+    timings = {}
+    for name, operation in (("s_matmul", lambda: a @ a), ("s_inverse", a.inverse),
+                            ("s_solve", lambda: a.solve(b)), ("s_rank", a.rank)):
+        start = time.perf_counter()
+        operation()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def _suite_case(field, operation, workload, n, rng):
+    """
+    Prepara los operandos de un caso de la suite y devuelve una función que
+    ejecuta la operación sobre todos ellos y regresa los resultados.
+    """
+    xs = [rng.randrange(1, field.order) for _ in range(n)]
+    ys = [rng.randrange(1, field.order) for _ in range(n)]
+    exponents = [rng.randrange(field.order) for _ in range(n)]
+    if workload == "elemento":
+        a = [field.element(v) for v in xs]
+        b = [field.element(v) for v in ys]
+        return {
+            "suma": lambda: [x + y for x, y in zip(a, b)],
+            "multiplicacion": lambda: [x * y for x, y in zip(a, b)],
+            "division": lambda: [x / y for x, y in zip(a, b)],
+            "potencia": lambda: [x ** e for x, e in zip(a, exponents)],
+            "inverso": lambda: [x ** -1 for x in a],
+        }[operation]
+    a, b = field.array(xs), field.array(ys)
+    exponent = exponents[0]
+    return {
+        "suma": lambda: a + b,
+        "multiplicacion": lambda: a * b,
+        "division": lambda: a / b,
+        "potencia": lambda: a ** exponent,
+        "inverso": lambda: a.batch_inverse(),
+    }[operation]
+
+
+def _autorange(function):
+    """
+    Segundos por llamada de 'function', repitiéndola hasta que la medición
+    dure al menos CASE_TIME_BUDGET (como timeit.autorange).
+    """
+    loops = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= CASE_TIME_BUDGET:
+            return elapsed / loops
+
+
+def _calibration_loop():
+    """Ciclo fijo de 10 000 operaciones de enteros en Python puro."""
+    value = 0x1234567
+    for i in range(10_000):
+        value = ((value << 1) ^ i) & 0xFFFFFFFF
+    return value
+
+
+def bench_suite_case(field, operation, workload, n, repeat=5):
+    """
+    Mide una operación sobre n operandos. Con elementos individuales el costo
+    por operación no depende de n, así que una ejecución corta lo estima y, si
+    n operandos tardarían más de CASE_TIME_BUDGET, se usan menos (al menos 20).
+    Con arreglos n se respeta, porque el tamaño del lote cambia el rendimiento.
+
+    - ops_per_sec: la mejor de 'repeat' mediciones.
+    - relative: mediana, entre las rondas, de las operaciones por cada
+      iteración de un ciclo de calibración medido justo antes en la misma
+      ronda. Así una máquina más lenta (o más ocupada en ese momento) no se
+      confunde con una regresión del código.
+    - allocs_per_op: bloques de memoria que siguen reservados al terminar una
+      ejecución, por operación (los objetos resultado y lo que estos retienen).
+
+    :return: Diccionario con ops_per_sec, relative y allocs_per_op.
+    """
+    if workload == "elemento":
+        run = _suite_case(field, operation, workload, 20, random.Random(field.degree))
+        start = time.perf_counter()
+        run()
+        estimate = (time.perf_counter() - start) / 20
+        n = max(20, min(n, int(CASE_TIME_BUDGET / max(estimate, 1e-9))))
+    run = _suite_case(field, operation, workload, n, random.Random(field.degree))
+    run()  # Calentamiento: tablas, cachés e internado de elementos
+    gc.disable()
+    try:
+        blocks = sys.getallocatedblocks()
+        result = run()
+        allocs = sys.getallocatedblocks() - blocks
+        del result
+        best, ratios = float("inf"), []
+        for _ in range(repeat):
+            calibration = 10_000 / _autorange(_calibration_loop)
+            seconds = _autorange(run)
+            best = min(best, seconds)
+            ratios.append(n / seconds / calibration)
+    finally:
+        gc.enable()
+    return {"ops_per_sec": n / best, "relative": statistics.median(ratios),
+            "allocs_per_op": max(allocs, 0) / n}
+
+
+def run_suite(n, degrees=SUITE_DEGREES, progress=None):
+    """
+    Ejecuta la suite completa: cada operación de SUITE_OPERATIONS en cada
+    campo, elemento por elemento y (si hay NumPy y el grado lo permite) con
+    GFArray.
+
+    :return: Diccionario {"GF(2^n)/carga/operación": medición}.
+    """
+    try:
+        import numpy  # noqa: F401
+        workloads = ("elemento", "arreglo")
+    except ImportError:
+        workloads = ("elemento",)
+    results = {}
+    for degree in degrees:
+        field = GF(degree)
+        for workload in workloads:
+            if workload == "arreglo" and degree > ARRAY_MAX_DEGREE:
+                continue
+            for operation in SUITE_OPERATIONS:
+                key = f"GF(2^{degree})/{workload}/{operation}"
+                results[key] = bench_suite_case(field, operation, workload, n)
+                if progress is not None:
+                    progress(key, results[key])
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara una ejecución contra la línea base.
+
+    Hay regresión si el rendimiento relativo a la calibración cae más de
+    'threshold' (fracción) o si las reservas por operación crecen más de esa
+    fracción (con medio bloque de tolerancia, porque suelen ser números
+    pequeños).
+
+    :return: Lista de tuplas (caso, base, actual, métrica) con las regresiones.
+    """
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        if current["relative"] < reference["relative"] * (1 - threshold):
+            regressions.append((key, reference["relative"], current["relative"], "ops/calibración"))
+        if current["allocs_per_op"] > reference["allocs_per_op"] * (1 + threshold) + 0.5:
+            regressions.append((key, reference["allocs_per_op"], current["allocs_per_op"], "reservas/op"))
+    return regressions
+
+
+def load_baseline(path):
+    """Lee la línea base; devuelve None si no existe."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path, results, n):
+    """Guarda los resultados como línea base junto con datos del entorno."""
+    data = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "n": n,
+        "resultados": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def run_regression(args):
+    baseline = None if args.save else load_baseline(args.baseline)
+    reference = baseline["resultados"] if baseline else {}
+    print(f"Suite de regresión con {args.n} operandos por caso\n")
+    print(f"{'Caso':<33} | {'ops/s':>12} | {'Base ops/s':>12} | {'Reservas/op':>11}")
+    print("-" * 77)
+
+    def progress(key, result):
+        base = reference.get(key, {}).get("ops_per_sec")
+        base_text = f"{base:>12.0f}" if base else f"{'-':>12}"
+        print(f"{key:<33} | {result['ops_per_sec']:>12.0f} | {base_text} | {result['allocs_per_op']:>11.2f}")
+
+    results = run_suite(args.n, progress=progress)
+    if baseline is None:
+        save_baseline(args.baseline, results, args.n)
+        print(f"\nLínea base guardada en {args.baseline}")
+        return 0
+    regressions = compare_with_baseline(results, reference, args.threshold)
+    if not regressions:
+        print(f"\nSin regresiones (umbral {args.threshold:.0%}).")
+        return 0
+    print(f"\nRegresiones (umbral {args.threshold:.0%}):")
+    for key, before, after, metric in regressions:
+        print(f"  {key}: {metric} {before:.4g} -> {after:.4g}")
+    return 1
+
+
+def run_memory(args):
+    print(f"Conjunto de trabajo de {args.n} elementos en GF(2^16)\n")
+    print(f"{'Variante':<20} | {'Bytes/elemento':>15} | {'ns/multiplicación':>18}")
+    print("-" * 59)
+    for name, intern in (("Sin flyweight", False), ("Con flyweight", True)):
+        field = GF(16, GF16_POLY, intern_elements=intern)
+        result = bench_working_set(field, args.n)
+        print(f"{name:<20} | {result['bytes_per_element']:>15.1f} | {result['ns_per_mul']:>18.1f}")
+
+
+def run_inverse(args):
+    print(f"Inversión de {args.n} elementos: 1 / a contra batch_inverse\n")
+    print(f"{'Campo':<12} | {'us/elem (1/a)':>14} | {'us/elem (lote)':>14} | {'Aceleración':>11}")
+    print("-" * 61)
+    for degree in (8, 32, 128, 233):
+        result = bench_batch_inverse(GF(degree), args.n)
+        print(f"{f'GF(2^{degree})':<12} | {result['us_elementwise']:>14.2f} | "
+              f"{result['us_batch']:>14.2f} | {result['speedup']:>10.1f}x")
+
+
+def run_polynomials(args):
+    print("Polinomios sobre GF(2^n): tiempos en milisegundos\n")
+    print(f"{'Campo':<10} | {'Grado':>6} | {'Producto':>9} | {'Evaluación':>10} | {'Interpolación':>13}")
+    print("-" * 60)
+    for degree_field in (8, 16):
+        for degree in (255, 1023):
+            result = bench_polynomials(GF(degree_field), degree)
+            print(f"{f'GF(2^{degree_field})':<10} | {degree:>6} | {result['ms_mul']:>9.1f} | "
+                  f"{result['ms_evaluate']:>10.1f} | {result['ms_interpolate']:>13.1f}")
+
+
+def run_matrices(args):
+    n = args.n
+    print(f"Matrices de {n} x {n}: tiempos en segundos\n")
+    print(f"{'Campo':<10} | {'Producto':>9} | {'Inversa':>9} | {'Sistema':>9} | {'Rango':>9}")
+    print("-" * 57)
+    for degree in (8, 16):
+        result = bench_matrices(GF(degree), n)
+        print(f"{f'GF(2^{degree})':<10} | {result['s_matmul']:>9.2f} | {result['s_inverse']:>9.2f} | "
+              f"{result['s_solve']:>9.2f} | {result['s_rank']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de aritmética en GF(2^n).")
+    parser.add_argument("benchmark", nargs="?", choices=["memoria", "inversion", "polinomios", "matrices", "regresion"], default="memoria",
+                        help="Benchmark a ejecutar (por defecto memoria).")
+    parser.add_argument("-n", type=int, default=None,
+                        help="Número de elementos (por defecto 10M para memoria y 10k para inversión) "
+                             "o tamaño de las matrices (por defecto 1000).")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="Archivo JSON con la línea base de la suite de regresión.")
+    parser.add_argument("--save", action="store_true",
+                        help="Guarda la ejecución como nueva línea base en lugar de compararla.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Pérdida de rendimiento tolerada, como fracción (por defecto 0.25).")
+    args = parser.parse_args()
+
+    if args.benchmark == "memoria":
+        args.n = args.n or 10_000_000
+        run_memory(args)
+    elif args.benchmark == "inversion":
+        args.n = args.n or 10_000
+        run_inverse(args)
+    elif args.benchmark == "regresion":
+        args.n = args.n or 2000
+        sys.exit(run_regression(args))
+    elif args.benchmark == "matrices":
+        args.n = args.n or 1000
+        run_matrices(args)
+    else:
+        run_polynomials(args)
+
+if __name__ == "__main__":
+    main()
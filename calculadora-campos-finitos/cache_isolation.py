@@ -0,0 +1,35 @@
+"""
+Aísla las cachés en disco durante las pruebas.
+
+Cada módulo de pruebas importa setUpModule y tearDownModule de aquí, así que
+la caché de polinomios de irreducible.py y las tablas de gf_tables.py apuntan
+a un directorio temporal mientras se ejecutan sus pruebas y nunca se escribe
+en el HOME del usuario.
+"""
+import os
+import tempfile
+
+import gf_tables
+import irreducible
+
+_saved = []
+
+
+def setUpModule():
+    tmpdir = tempfile.TemporaryDirectory()
+    _saved.append((tmpdir, {name: os.environ.get(name) for name in ("GF_POLY_CACHE", "GF_TABLE_DIR")},
+                   irreducible.POLY_CACHE_PATH, irreducible._cache, gf_tables.TABLE_DIR))
+    os.environ["GF_POLY_CACHE"] = irreducible.POLY_CACHE_PATH = os.path.join(tmpdir.name, "polinomios.json")
+    os.environ["GF_TABLE_DIR"] = os.path.join(tmpdir.name, "tablas")
+    irreducible._cache = None
+    gf_tables.TABLE_DIR = os.environ["GF_TABLE_DIR"]
+
+
+def tearDownModule():
+    tmpdir, environ, irreducible.POLY_CACHE_PATH, irreducible._cache, gf_tables.TABLE_DIR = _saved.pop()
+    for name, value in environ.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    tmpdir.cleanup()
@@ -1,8 +1,22 @@
+import argparse
+import csv
+import json
+import sys
+from functools import lru_cache
+from json.encoder import encode_basestring
+
+import gf_tables
 from gf import GF, GFElement
+from gf_expr import ExpressionEvaluator
+from irreducible import find_irreducible
+
+# Número de potencias que muestra por defecto la tabla de exponenciación
+TABLE_DEFAULT_ROWS = 64
 
 class Calculator:
     def __init__(self):
-        # Polinomios irreducibles para cada campo como enteros
+        # Polinomios irreducibles para cada campo como enteros; los demás
+        # grados se buscan con find_irreducible al agregarlos
         self.irreducible_polys = {
             2: 0b11,        # GF(2): x + 1
             4: 0b111,       # GF(4): x^2 + x + 1
@@ -28,11 +42,12 @@ class Calculator:
         print("4. GF(16)")
         print("5. GF(32)")
         print("6. GF(64)")
+        print("7. Otro GF(2^n)")
         choice = input("Ingresa el número correspondiente: ").strip()
 
         field_map = {'1': 2, '2': 4, '3': 8, '4': 16, '5': 32, '6': 64}
-        if choice in field_map:
-            field_size = field_map[choice]
+        field_size = self.add_field() if choice == '7' else field_map.get(choice)
+        if field_size is not None:
             self.current_field = self.fields[field_size]
             poly = self.irreducible_polys[field_size]
             print(f"\nCampo finito seleccionado: GF({field_size})")
@@ -41,6 +56,23 @@ class Calculator:
             print("Selección inválida. Por favor, intenta de nuevo.\n")
             self.select_field()
 
+    def add_field(self):
+        """Pide un grado n y agrega GF(2^n) con su polinomio irreducible de menor peso."""
+        degree_input = input("Ingresa el grado n del campo GF(2^n): ").strip()
+        try:
+            degree = int(degree_input)
+            if degree <= 0:
+                raise ValueError
+        except ValueError:
+            print("Grado inválido. Debe ser un entero positivo.\n")
+            return None
+        field_size = 1 << degree
+        if field_size not in self.fields:
+            poly = find_irreducible(degree)
+            self.irreducible_polys[field_size] = poly
+            self.fields[field_size] = GF(degree=degree, irreducible_poly=poly)
+        return field_size
+
     def main_menu(self):
         while True:
             print("--- Menú de Operaciones ---")
@@ -115,30 +147,30 @@ class Calculator:
         print("Define el elemento para generar su tabla de exponenciación:")
         element = self.get_element()
 
-        exponent = 1
-        current = element
-        table = []
-
-        while True:
-            table.append((exponent, current))
-            # Multiplicar por el elemento para obtener la siguiente potencia
-            try:
-                current = current * element
-            except Exception as e:
-                print(f"Error al multiplicar: {e}")
-                break
-
-            exponent += 1
+        try:
+            order = element.order()
+        except ValueError as e:
+            print(f"Error: {e}\n")
+            return
+        print(f"Orden multiplicativo del elemento: {order}")
 
-            # Detenerse si hemos llegado al elemento neutro
-            if current.value == 1:
-                table.append((exponent, current))
-                break
+        # Por defecto se muestra el ciclo completo si es corto
+        default_end = min(order, TABLE_DEFAULT_ROWS)
+        range_input = input(f"Rango de exponentes a mostrar (inicio fin) [1 {default_end}]: ").strip()
+        try:
+            start, end = (int(x) for x in range_input.split()) if range_input else (1, default_end)
+            if start > end:
+                raise ValueError
+        except ValueError:
+            print("Rango inválido. Debe ser dos enteros con inicio <= fin.\n")
+            return
 
-            # Prevenir bucles infinitos: en GF(2^n), el máximo exponente es 2^n -1
-            if exponent >= self.current_field.order:
-                print("Se alcanzó el máximo exponente sin encontrar el elemento neutro.")
-                break
+        # Solo se calcula la potencia inicial; el resto se obtiene multiplicando
+        current = element ** start
+        table = []
+        for exponent in range(start, end + 1):
+            table.append((exponent, current))
+            current = current * element
 
         # Mostrar la tabla
         print(f"\nTabla de Exponenciación para {element}:\n")
@@ -180,20 +212,103 @@ class Calculator:
 
     def poly_to_string(self, poly):
         """Convierte un polinomio binario a su representación polinómica."""
-        if poly == 0:
-            return "0"
-        degree = poly.bit_length() -1
-        terms = []
-        for i in range(degree, -1, -1):
-            if (poly >> i) &1:
-                if i ==0:
-                    terms.append("1")
-                elif i ==1:
-                    terms.append("x")
-                else:
-                    terms.append(f"x^{i}")
-        return " + ".join(terms)
+        return poly_to_string(poly)
+
+
+@lru_cache(maxsize=1 << 16)
+def poly_to_string(poly):
+    """Convierte un polinomio binario a su representación polinómica."""
+    if poly == 0:
+        return "0"
+    degree = poly.bit_length() -1
+    terms = []
+    for i in range(degree, -1, -1):
+        if (poly >> i) &1:
+            if i ==0:
+                terms.append("1")
+            elif i ==1:
+                terms.append("x")
+            else:
+                terms.append(f"x^{i}")
+    return " + ".join(terms)
+
+
+def run_batch(lines, output, output_format="text", default_degree=None):
+    """
+    Modo por lotes: evalúa cada línea 'GF(2^n): expresión' y escribe el
+    resultado en cuanto se obtiene. Las líneas vacías y las que empiezan con
+    '#' se ignoran; un error en una línea se reporta y no detiene el lote.
+
+    :param lines: Iterable de líneas (archivo abierto o sys.stdin).
+    :param output: Archivo de salida.
+    :param output_format: "text", "csv" o "jsonl".
+    :return: Número de líneas con error.
+    """
+    evaluator = ExpressionEvaluator(default_degree)
+    writer = csv.writer(output) if output_format == "csv" else None
+    if writer is not None:
+        writer.writerow(["campo", "expresion", "valor", "polinomio", "error"])
+    # Inicio de cada línea JSONL por grado del campo; el resto se arma con el mismo
+    # formato que json.dumps(..., ensure_ascii=False) sin pasar por un dict
+    jsonl_prefixes = {}
+    errors = 0
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            field, value = evaluator.evaluate(line)
+        except (ValueError, ZeroDivisionError) as e:
+            errors += 1
+            if output_format == "text":
+                output.write(f"{line} = Error: {e}\n")
+            elif output_format == "jsonl":
+                output.write(json.dumps({"campo": None, "expresion": line, "valor": None,
+                                         "polinomio": None, "error": str(e)}, ensure_ascii=False) + "\n")
+            else:
+                writer.writerow([None, line, None, None, str(e)])
+            continue
+        polinomio = poly_to_string(value)
+        if output_format == "text":
+            output.write(f"{line} = {polinomio}\n")
+        elif output_format == "jsonl":
+            prefix = jsonl_prefixes.get(field.degree)
+            if prefix is None:
+                prefix = jsonl_prefixes[field.degree] = f'{{"campo": "GF(2^{field.degree})", "expresion": '
+            # poly_to_string solo produce x, ^, dígitos, espacios y +: no hay nada que escapar
+            output.write(f'{prefix}{encode_basestring(line)}, "valor": {value}, '
+                         f'"polinomio": "{polinomio}", "error": null}}\n')
+        else:
+            writer.writerow([f"GF(2^{field.degree})", line, value, polinomio, None])
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculadora de campos finitos GF(2^n).")
+    parser.add_argument("--batch", metavar="ARCHIVO",
+                        help="Evalúa las expresiones de ARCHIVO ('-' para la entrada estándar) "
+                             "en lugar de usar el menú interactivo.")
+    parser.add_argument("--format", choices=["text", "csv", "jsonl"], default="text",
+                        help="Formato de salida del modo por lotes (por defecto text).")
+    parser.add_argument("--degree", type=int, default=None,
+                        help="Grado n del campo para las líneas sin encabezado 'GF(2^n):'.")
+    parser.add_argument("--table-dir", metavar="DIR", nargs="?", const=gf_tables.DEFAULT_TABLE_DIR, default=None,
+                        help="Guarda en DIR (por defecto ~/.cache/cripto-tareas/tablas) las tablas completas de "
+                             "los campos de grado a lo más 8 para compartirlas entre procesos.")
+    args = parser.parse_args()
+    if args.table_dir is not None:
+        gf_tables.use_table_dir(args.table_dir)
+
+    if args.batch is None:
+        calc = Calculator()
+        calc.run()
+        return
+    if args.batch == "-":
+        errors = run_batch(sys.stdin, sys.stdout, args.format, args.degree)
+    else:
+        with open(args.batch, encoding="utf-8") as stream:
+            errors = run_batch(stream, sys.stdout, args.format, args.degree)
+    sys.exit(1 if errors else 0)
 
 if __name__ == "__main__":
-    calc = Calculator()
-    calc.run()
+    main()
@@ -1,62 +1,692 @@
+import math
+from collections import OrderedDict
+
+from gf_tables import load_full_tables
+from irreducible import find_irreducible, is_irreducible, mersenne_factors, poly_square, sparse_terms
+
+# Grado máximo para el que se construyen tablas exp/log (2^16 entradas)
+TABLE_MAX_DEGREE = 16
+
+# Número máximo de candidatos a generador que se prueban al construir las tablas
+GENERATOR_SEARCH_LIMIT = 256
+
+# Grado máximo para el que se usan tablas completas de productos e inversos (64 KB para n = 8)
+FULL_TABLE_MAX_DEGREE = 8
+
+# Grado máximo para el que GF.element reutiliza instancias preasignadas
+INTERN_MAX_DEGREE = 16
+
+# Tamaño máximo de la tabla de pasos pequeños en baby-step/giant-step
+BSGS_MAX_TABLE = 1 << 22
+
+# Entradas de tablas de pasos pequeños que conserva cada campo en total (LRU);
+# se desalojan las menos usadas, pero la tabla en uso siempre se conserva
+BSGS_CACHE_ENTRIES = 1 << 22
+
+# Número de bases fijas con tablas precalculadas que conserva cada campo (LRU)
+FIXED_BASE_CACHE_SIZE = 16
+
+# Ancho de ventana por defecto de las tablas de base fija (bits del exponente por consulta)
+FIXED_BASE_WINDOW = 6
+
+# Tablas exp/log compartidas, indexadas por (grado, polinomio irreducible)
+_TABLE_CACHE = {}
+
+# Tablas por byte de las aplicaciones lineales (raíz cuadrada, semitraza,
+# solución de z^2 + z = c), indexadas por (grado, polinomio irreducible, nombre)
+_LINEAR_MAP_CACHE = {}
+
+
+def _byte_tables(images):
+    """
+    Tablas por byte de una aplicación lineal sobre GF(2) dada por las imágenes
+    de la base x^0, x^1, ..., x^(n-1): la tabla j tiene en la posición v la
+    imagen del polinomio v * x^(8j).
+    """
+    tables = []
+    for start in range(0, len(images), 8):
+        chunk = images[start:start + 8]
+        table = [0] * (1 << len(chunk))
+        for v in range(1, len(table)):
+            low = (v & -v).bit_length() - 1
+            table[v] = table[v & (v - 1)] ^ chunk[low]
+        tables.append(table)
+    return tables
+
+
+def _apply_byte_tables(tables, a):
+    """Aplica una aplicación lineal dada por sus tablas por byte: una consulta por byte de 'a'."""
+    result = 0
+    for table in tables:
+        result ^= table[a & 0xFF]
+        a >>= 8
+    return result
+
+
 class GF:
-    def __init__(self, degree, irreducible_poly):
+    def __init__(self, degree, irreducible_poly=None, intern_elements=True):
         """
         Inicializa el campo finito GF(2^degree).
 
         :param degree: Grado del campo finito (n en GF(2^n)).
         :param irreducible_poly: Polinomio irreducible representado como un entero.
                                  Por ejemplo, x^3 + x + 1 se representa como 0b1011 (11).
+                                 Si se omite, se usa el irreducible de menor peso.
+        :param intern_elements: Si es True y el grado es a lo más INTERN_MAX_DEGREE,
+                                element() devuelve instancias preasignadas y compartidas.
         """
         if degree <= 0:
             raise ValueError("El grado del campo debe ser un entero positivo.")
         
+        if irreducible_poly is None:
+            irreducible_poly = find_irreducible(degree)
+
         # Verificar que el polinomio irreducible tiene el grado correcto
-        if irreducible_poly >> degree == 0:
+        if irreducible_poly.bit_length() != degree + 1:
             raise ValueError(f"El polinomio irreducible debe tener grado {degree}.")
+        if not is_irreducible(irreducible_poly):
+            raise ValueError("El polinomio no es irreducible.")
 
         self.degree = degree
         self.irreducible_poly = irreducible_poly
         self.order = 1 << degree  # 2^degree
+        # Tablas exp/log; se construyen la primera vez que se necesitan
+        self._tables = None
+        self._tables_ready = False
+        # Tablas completas de productos e inversos (n <= 8), cargadas con mmap
+        self._full_tables = None
+        self._full_tables_ready = False
+        # Exponentes de los términos intermedios si el módulo es trinomio o pentanomio
+        self._sparse_terms = sparse_terms(irreducible_poly)
+        # Elementos preasignados (flyweight); se crean la primera vez que se piden
+        self._intern = intern_elements and degree <= INTERN_MAX_DEGREE
+        self._elements = None
+        # Tablas de baby-step/giant-step, indexadas por (base, primo), de la
+        # menos a la más recientemente usada, y su número total de entradas
+        self._bsgs_tables = OrderedDict()
+        self._bsgs_entries = 0
+        # Máscara de la traza: el bit i es Tr(x^i); se calcula la primera vez
+        self._trace_mask = None
+        # Bases fijas con tablas de potencias, de la menos a la más recientemente usada
+        self._fixed_bases = OrderedDict()
 
     def element(self, value):
         """
         Crea un nuevo elemento del campo.
 
+        En campos pequeños con intern_elements activo, devuelve siempre la misma
+        instancia para el mismo valor.
+
         :param value: Valor del elemento como entero.
         :return: Instancia de GFElement.
         """
-        return GFElement(self, value)
+        value &= self.order - 1
+        if self._intern:
+            elements = self._elements
+            if elements is None:
+                elements = self._elements = [_new_element(self, v) for v in range(self.order)]
+            return elements[value]
+        return _new_element(self, value)
+
+    def array(self, values):
+        """
+        Crea un arreglo de elementos del campo respaldado por NumPy.
+
+        :param values: Enteros, GFElement o un arreglo de NumPy con los valores.
+        :return: Instancia de GFArray.
+        """
+        from gf_array import GFArray  # NumPy solo se requiere para arreglos
+        return GFArray(self, values)
+
+    def batch_inverse(self, elements, skip_zeros=False):
+        """
+        Invierte muchos elementos a la vez con el truco de inversión simultánea
+        de Montgomery: una sola inversión y alrededor de 3N multiplicaciones.
+
+        En campos con tablas exp/log cada inverso ya es una consulta, así que se
+        usan las tablas directamente. Para un GFArray usar GFArray.batch_inverse.
+
+        :param elements: Iterable de GFElement del campo.
+        :param skip_zeros: Si es True, los ceros se devuelven como cero; si es
+                           False, un cero lanza ZeroDivisionError.
+        :return: Lista de GFElement con los inversos, en el mismo orden.
+        """
+        values = []
+        for element in elements:
+            if element.field is not self and element.field != self:
+                raise ValueError("Los elementos deben pertenecer al mismo campo para invertir.")
+            if element.value == 0 and not skip_zeros:
+                raise ZeroDivisionError("El cero no tiene inverso multiplicativo.")
+            values.append(element.value)
+
+        if self.tables() is not None:
+            inverse = self._inverse
+            return [self.element(inverse(v) if v else 0) for v in values]
+
+        # prefix[i] es el producto de los valores no nulos hasta la posición i
+        mul = self._mul_windowed
+        prefix = []
+        acc = 1
+        for v in values:
+            if v:
+                acc = mul(acc, v)
+            prefix.append(acc)
+
+        inverses = [0] * len(values)
+        acc_inverse = self._inverse(acc)
+        for i in range(len(values) - 1, -1, -1):
+            v = values[i]
+            if not v:
+                continue
+            inverses[i] = mul(acc_inverse, prefix[i - 1]) if i else acc_inverse
+            acc_inverse = mul(acc_inverse, v)
+        return [self.element(v) for v in inverses]
+
+    def fixed_base(self, base, window=FIXED_BASE_WINDOW):
+        """
+        Devuelve un objeto FixedBase para elevar 'base' a muchos exponentes.
+
+        El campo conserva las tablas de las FIXED_BASE_CACHE_SIZE bases usadas
+        más recientemente; pedir de nuevo una base reutiliza su tabla.
+
+        :param base: GFElement del campo.
+        :param window: Bits del exponente por consulta a la tabla.
+        :return: Instancia de FixedBase.
+        """
+        if not isinstance(base, GFElement):
+            raise TypeError("La base debe ser un GFElement.")
+        if base.field is not self and base.field != self:
+            raise ValueError("La base debe pertenecer al campo.")
+        key = (base.value, window)
+        fixed = self._fixed_bases.get(key)
+        if fixed is not None:
+            self._fixed_bases.move_to_end(key)
+            return fixed
+        fixed = self._fixed_bases[key] = FixedBase(self, base.value, window)
+        if len(self._fixed_bases) > FIXED_BASE_CACHE_SIZE:
+            self._fixed_bases.popitem(last=False)
+        return fixed
+
+    def tables(self):
+        """
+        Devuelve las tablas exp/log del campo, construyéndolas la primera vez.
+
+        Las tablas se comparten entre todas las instancias de GF con el mismo
+        grado y polinomio irreducible.
+
+        :return: Tupla (exp, log) o None si el campo es demasiado grande para
+                 tabularse o no se encontró un generador.
+        """
+        if not self._tables_ready:
+            key = (self.degree, self.irreducible_poly)
+            if key not in _TABLE_CACHE:
+                _TABLE_CACHE[key] = self._build_tables()
+            self._tables = _TABLE_CACHE[key]
+            self._tables_ready = True
+        return self._tables
+
+    def full_tables(self):
+        """
+        Devuelve las tablas completas de productos e inversos del campo,
+        cargándolas la primera vez (ver gf_tables.py).
+
+        mul[(a << n) | b] es a * b e inverse[a] es a^-1 (inverse[0] = 0). Por
+        defecto las tablas quedan en memoria; con GF_TABLE_DIR (o
+        gf_tables.use_table_dir) se guardan en disco y se abren con mmap, así
+        que los procesos de una misma máquina comparten una sola copia.
+
+        :return: Tupla (mul, inverse) de memoryview de bytes, o None si el grado
+                 es mayor a FULL_TABLE_MAX_DEGREE.
+        """
+        if not self._full_tables_ready:
+            if self.degree <= FULL_TABLE_MAX_DEGREE:
+                self._full_tables = load_full_tables(self.degree, self.irreducible_poly,
+                                                     self._mul_bitwise, self._inverse_bitwise)
+            self._full_tables_ready = True
+        return self._full_tables
+
+    def _build_tables(self):
+        """
+        Construye las tablas exp/log a partir de un generador del grupo multiplicativo.
+
+        exp tiene longitud 2 * (orden - 1) para que exp[log[a] + log[b]] no
+        necesite reducirse módulo orden - 1.
+        """
+        if self.degree > TABLE_MAX_DEGREE:
+            return None
+        group_order = self.order - 1
+        for generator in range(2 if self.order > 2 else 1, min(self.order, GENERATOR_SEARCH_LIMIT)):
+            exp = [0] * (2 * group_order)
+            log = [0] * self.order
+            value = 1
+            for i in range(group_order):
+                if i and value == 1:
+                    break  # El ciclo se cerró antes: no es generador
+                exp[i] = value
+                log[value] = i
+                value = self._mul_bitwise(value, generator)
+            else:
+                if value != 1:
+                    continue
+                exp[group_order:] = exp[:group_order]
+                return exp, log
+        return None
+
+    def _mul(self, a, b):
+        """Producto de dos valores enteros del campo."""
+        full = self._full_tables if self._full_tables_ready else self.full_tables()
+        if full is not None:
+            return full[0][(a << self.degree) | b]
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is None:
+            return self._mul_windowed(a, b)
+        if a == 0 or b == 0:
+            return 0
+        exp, log = tables
+        return exp[log[a] + log[b]]
+
+    def _div(self, a, b):
+        """Cociente a / b de dos valores enteros del campo (b distinto de cero)."""
+        full = self._full_tables if self._full_tables_ready else self.full_tables()
+        if full is not None:
+            return full[0][(a << self.degree) | full[1][b]]
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is None:
+            return self._mul_windowed(a, self._inverse_bitwise(b))
+        if a == 0:
+            return 0
+        exp, log = tables
+        return exp[log[a] - log[b] + self.order - 1]
+
+    def _inverse(self, a):
+        """Inverso multiplicativo de un valor entero del campo (distinto de cero)."""
+        full = self._full_tables if self._full_tables_ready else self.full_tables()
+        if full is not None:
+            return full[1][a]
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is None:
+            return self._inverse_bitwise(a)
+        exp, log = tables
+        return exp[self.order - 1 - log[a]]
+
+    def _pow(self, a, exponent):
+        """Potencia a^exponent de un valor entero del campo (exponente no negativo)."""
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is not None:
+            if a == 0:
+                return 0 if exponent else 1
+            exp, log = tables
+            return exp[(log[a] * exponent) % (self.order - 1)]
+        result = 1
+        while exponent > 0:
+            if exponent & 1:
+                result = self._mul_windowed(result, a)
+            a = self._square(a)
+            exponent >>= 1
+        return result
+
+    def _square(self, a):
+        """
+        Cuadrado de un valor entero del campo.
+
+        El cuadrado es lineal en GF(2^n): basta con intercalar ceros entre los
+        bits (con una tabla por byte) y reducir.
+        """
+        full = self._full_tables if self._full_tables_ready else self.full_tables()
+        if full is not None:
+            return full[0][(a << self.degree) | a]
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is not None:
+            if a == 0:
+                return 0
+            exp, log = tables
+            return exp[2 * log[a]]
+        return self._reduce(poly_square(a))
+
+    def _sqrt(self, a):
+        """Raíz cuadrada (única) de un valor entero del campo, con tablas por byte."""
+        return _apply_byte_tables(self._linear_map("sqrt"), a)
+
+    def _frobenius(self, a, k):
+        """a^(2^k): k cuadrados, o n - k raíces cuadradas si son menos."""
+        k %= self.degree
+        if k <= self.degree - k:
+            for _ in range(k):
+                a = self._square(a)
+        else:
+            for _ in range(self.degree - k):
+                a = self._sqrt(a)
+        return a
+
+    def _trace(self, a):
+        """
+        Traza absoluta Tr(a) = a + a^2 + ... + a^(2^(n-1)), que vale 0 o 1.
+
+        La traza es lineal, así que Tr(a) es la paridad de a & máscara, donde el
+        bit i de la máscara es Tr(x^i).
+        """
+        mask = self._trace_mask
+        if mask is None:
+            mask = self._trace_mask = self._build_trace_mask()
+        return bin(a & mask).count("1") & 1
+
+    def _build_trace_mask(self):
+        """
+        Calcula Tr(x^i) para i < n con las identidades de Newton: Tr(x^i) es la
+        suma de las potencias i-ésimas de las raíces del polinomio irreducible
+        X^n + c_1 X^(n-1) + ... + c_n, y en característica 2
+        s_i = c_1 s_(i-1) + ... + c_(i-1) s_1 + i c_i.
+        """
+        n = self.degree
+        coefficients = [k for k in range(1, n + 1) if (self.irreducible_poly >> (n - k)) & 1]
+        sums = [n & 1]  # Tr(1) = n mod 2
+        for i in range(1, n):
+            value = i & 1 & (self.irreducible_poly >> (n - i))
+            for k in coefficients:
+                if k >= i:
+                    break
+                value ^= sums[i - k]
+            sums.append(value)
+        return sum(bit << i for i, bit in enumerate(sums))
+
+    def _half_trace(self, a):
+        """Semitraza H(a) = a + a^4 + ... + a^(4^((n-1)/2)) para n impar."""
+        if self.degree % 2 == 0:
+            raise ValueError("La semitraza solo está definida para campos de grado impar.")
+        return _apply_byte_tables(self._linear_map("half_trace"), a)
+
+    def _solve_quadratic(self, c):
+        """
+        Una solución z de z^2 + z = c (la otra es z + 1).
+
+        Hay solución si y solo si Tr(c) = 0. Con n impar, z es la semitraza de
+        c; con n par se usa una inversa lineal precalculada de z -> z^2 + z.
+
+        :raises ValueError: Si Tr(c) = 1.
+        """
+        if self._trace(c):
+            raise ValueError("z^2 + z = c no tiene solución: la traza de c es 1.")
+        if self.degree % 2:
+            return _apply_byte_tables(self._linear_map("half_trace"), c)
+        return _apply_byte_tables(self._linear_map("quadratic"), c)
+
+    def _linear_map(self, name):
+        """Tablas por byte de una aplicación lineal del campo, construidas una sola vez."""
+        key = (self.degree, self.irreducible_poly, name)
+        tables = _LINEAR_MAP_CACHE.get(key)
+        if tables is None:
+            images = getattr(self, f"_{name}_images")()
+            tables = _LINEAR_MAP_CACHE[key] = _byte_tables(images)
+        return tables
+
+    def _sqrt_images(self):
+        """sqrt(x^i): x^(i/2) si i es par y x^((i-1)/2) * sqrt(x) si es impar."""
+        root_x = self._reduce(2)
+        for _ in range(self.degree - 1):  # sqrt(x) = x^(2^(n-1))
+            root_x = self._square(root_x)
+        return [self._reduce(1 << (i // 2)) if i % 2 == 0 else self._reduce(root_x << (i // 2))
+                for i in range(self.degree)]
+
+    def _half_trace_images(self):
+        """H(x^i); para i par se usa H(a^2) = H(a)^2."""
+        images = []
+        for i in range(self.degree):
+            if i % 2 == 0 and i:
+                images.append(self._square(images[i // 2]))
+                continue
+            a = value = self._reduce(1 << i)
+            for _ in range((self.degree - 1) // 2):
+                a = self._square(self._square(a))
+                value ^= a
+            images.append(value)
+        return images
+
+    def _quadratic_images(self):
+        """
+        Imágenes de una inversa lineal S de L(z) = z^2 + z, con L(S(c)) = c si Tr(c) = 0.
+
+        Se construye una base escalonada reducida de la imagen de L: cada
+        elemento guarda su valor L(z) y el z que lo produce, indexado por su bit
+        más alto. Como la base está reducida, S(x^b) es el z del elemento con
+        bit principal b (y 0 si b no es principal).
+        """
+        basis = {}
+        for i in range(self.degree):
+            z = 1 << i
+            value = self._square(self._reduce(z)) ^ self._reduce(z)
+            z = self._reduce(z)
+            while value:
+                lead = value.bit_length() - 1
+                if lead not in basis:
+                    break
+                value ^= basis[lead][0]
+                z ^= basis[lead][1]
+            if value:
+                basis[value.bit_length() - 1] = (value, z)
+        # Forma reducida: ningún valor contiene el bit principal de otro
+        for lead in sorted(basis):
+            value, z = basis[lead]
+            for other in basis:
+                if other != lead and (basis[other][0] >> lead) & 1:
+                    other_value, other_z = basis[other]
+                    basis[other] = (other_value ^ value, other_z ^ z)
+        return [basis[b][1] if b in basis else 0 for b in range(self.degree)]
+
+    def _group_factors(self):
+        """Factorización de 2^n - 1 como lista de pares (primo, exponente)."""
+        group_order = self.order - 1
+        factors = []
+        for p in mersenne_factors(self.degree):
+            e = 0
+            while group_order % p == 0:
+                group_order //= p
+                e += 1
+            factors.append((p, e))
+        return factors
+
+    def _order(self, a):
+        """Orden multiplicativo de un valor entero del campo (distinto de cero)."""
+        order = self.order - 1
+        for p, e in self._group_factors():
+            for _ in range(e):
+                if self._pow(a, order // p) != 1:
+                    break
+                order //= p
+        return order
+
+    def _log(self, a, base):
+        """
+        Logaritmo discreto de 'a' en base 'base' (valores enteros distintos de cero).
+
+        Con tablas exp/log resuelve la congruencia lineal log(base) * x = log(a).
+        Sin tablas usa Pohlig-Hellman: resuelve x módulo cada potencia de primo
+        que divide al orden de la base con baby-step/giant-step y combina los
+        resultados con el teorema chino del residuo.
+
+        :return: El menor x >= 0 tal que base^x = a.
+        :raises ValueError: Si 'a' no es potencia de 'base'.
+        """
+        tables = self._tables if self._tables_ready else self.tables()
+        if tables is not None:
+            _, log = tables
+            group_order = self.order - 1
+            d = math.gcd(log[base], group_order)
+            if log[a] % d:
+                raise ValueError("El elemento no es potencia de la base.")
+            modulus = group_order // d
+            return (log[a] // d) * pow(log[base] // d, -1, modulus) % modulus if modulus > 1 else 0
+
+        base_order = self._order(base)
+        x, modulus = 0, 1
+        for p, _ in self._group_factors():
+            e = 0
+            while base_order % p ** (e + 1) == 0:
+                e += 1
+            if e == 0:
+                continue
+            prime_power = p ** e
+            g = self._pow(base, base_order // prime_power)
+            h = self._pow(a, base_order // prime_power)
+            gamma = self._pow(g, prime_power // p)  # Generador del subgrupo de orden p
+            g_inverse = self._inverse(g)
+            digits = 0
+            for k in range(e):
+                # Elimina los dígitos ya conocidos y proyecta al subgrupo de orden p
+                h_k = self._mul(self._pow(g_inverse, digits), h)
+                h_k = self._pow(h_k, prime_power // p ** (k + 1))
+                digits += self._bsgs(gamma, h_k, p) * p ** k
+            # Teorema chino del residuo
+            x += modulus * ((digits - x) * pow(modulus, -1, prime_power) % prime_power)
+            modulus *= prime_power
+        if self._pow(base, x) != a:
+            raise ValueError("El elemento no es potencia de la base.")
+        return x
+
+    def _bsgs(self, gamma, h, p):
+        """
+        Resuelve gamma^d = h con 0 <= d < p, donde gamma tiene orden primo p.
+
+        La tabla de pasos pequeños {gamma^j: j} se guarda por (gamma, p) para
+        reutilizarla en logaritmos posteriores con la misma base; el campo
+        conserva a lo más BSGS_CACHE_ENTRIES entradas en total y desaloja las
+        tablas menos usadas.
+        """
+        key = (gamma, p)
+        cached = self._bsgs_tables.get(key)
+        if cached is not None:
+            self._bsgs_tables.move_to_end(key)
+        else:
+            m = math.isqrt(p - 1) + 1
+            if m > BSGS_MAX_TABLE:
+                raise ValueError(f"El subgrupo de orden {p} es demasiado grande para baby-step/giant-step.")
+            table = {}
+            value = 1
+            for j in range(m):
+                table.setdefault(value, j)
+                value = self._mul(value, gamma)
+            cached = self._bsgs_tables[key] = (table, m, self._inverse(self._pow(gamma, m)))
+            self._bsgs_entries += len(table)
+            while self._bsgs_entries > BSGS_CACHE_ENTRIES and len(self._bsgs_tables) > 1:
+                self._bsgs_entries -= len(self._bsgs_tables.popitem(last=False)[1][0])
+        table, m, giant = cached
+        y = h
+        for i in range(m):
+            if y in table:
+                return (i * m + table[y]) % p
+            y = self._mul(y, giant)
+        raise ValueError("El elemento no es potencia de la base.")
+
+    def _mul_windowed(self, a, b):
+        """
+        Multiplicación con ventana de 4 bits para campos sin tablas.
+
+        Precalcula los 16 múltiplos de 'a' por polinomios de grado menor a 4 y
+        recorre 'b' de cuatro en cuatro bits, seguido de una sola reducción.
+        """
+        a2 = a << 1
+        a3 = a2 ^ a
+        a4 = a << 2
+        a8 = a << 3
+        a12 = a8 ^ a4
+        window = (0, a, a2, a3, a4, a4 ^ a, a4 ^ a2, a4 ^ a3,
+                  a8, a8 ^ a, a8 ^ a2, a8 ^ a3, a12, a12 ^ a, a12 ^ a2, a12 ^ a3)
+        result = 0
+        for shift in range((b.bit_length() - 1) & ~3, -1, -4):
+            result = (result << 4) ^ window[(b >> shift) & 15]
+        return self._reduce(result)
+
+    def _mul_bitwise(self, a, b):
+        """Multiplicación por desplazamiento y suma seguida de reducción modular."""
+        result = 0
+        while b:
+            if b & 1:
+                result ^= a  # Suma polinómica (XOR)
+            a <<= 1
+            b >>= 1
+        return self._reduce(result)
+
+    def _reduce(self, poly):
+        """Reduce el polinomio 'poly' usando el polinomio irreducible del campo."""
+        degree = self.degree
+        terms = self._sparse_terms
+        if terms is not None:
+            # Módulo disperso: x^n = suma de x^k, así que la parte alta se pliega
+            # sobre la baja desplazada por cada término, en pocas iteraciones
+            mask = self.order - 1
+            while poly >> degree:
+                high = poly >> degree
+                poly &= mask
+                for k in terms:
+                    poly ^= high << k
+            return poly
+        irreducible = self.irreducible_poly
+        while poly.bit_length() > degree:
+            shift = poly.bit_length() - degree - 1
+            poly ^= irreducible << shift
+        return poly
+
+    def _inverse_bitwise(self, a):
+        """Calcula el inverso multiplicativo de 'a' usando el algoritmo extendido de Euclides."""
+        u, v = a, self.irreducible_poly
+        g1, g2 = 1, 0
+
+        while u != 1:
+            j = u.bit_length() - v.bit_length()
+            if j < 0:
+                u, v = v, u
+                g1, g2 = g2, g1
+                j = -j
+            u = u ^ (v << j)
+            g1 = g1 ^ (g2 << j)
+
+        # g1 es el inverso multiplicativo
+        return g1
 
     def __eq__(self, other):
         """Igualdad entre dos campos finitos."""
+        if self is other:
+            return True
         if not isinstance(other, GF):
             return False
         return (self.degree == other.degree and
-                self.irreducible_poly == other.irreducible_poly and
-                self.order == other.order)
+                self.irreducible_poly == other.irreducible_poly)
+
+    def __hash__(self):
+        return hash((self.degree, self.irreducible_poly))
 
 
 class GFElement:
+    __slots__ = ('field', 'value')
+
     def __init__(self, field, value):
         """
-        Inicializa un elemento del campo finito.
+        Inicializa un elemento del campo finito. Los elementos son inmutables.
 
         :param field: Instancia de GF que representa el campo.
         :param value: Valor del elemento como entero.
         """
         if not isinstance(field, GF):
             raise TypeError("field debe ser una instancia de GF.")
-        self.field = field
-        self.value = value & (field.order - 1)  # Asegura que el valor esté dentro del campo
+        _set_field(self, field)
+        _set_value(self, value & (field.order - 1))  # Asegura que el valor esté dentro del campo
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GFElement es inmutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("GFElement es inmutable.")
+
+    def __reduce__(self):
+        return (GFElement, (self.field, self.value))
 
     def __add__(self, other):
         """Suma de dos elementos del campo utilizando XOR."""
         if not isinstance(other, GFElement):
             return NotImplemented
-        if self.field != other.field:
+        if self.field is not other.field and self.field != other.field:
             raise ValueError("Los elementos deben pertenecer al mismo campo para sumar.")
         result = self.value ^ other.value
-        return GFElement(self.field, result)
+        return self.field.element(result)
 
     def __sub__(self, other):
         """Resta de dos elementos del campo utilizando XOR (igual que la suma)."""
@@ -66,91 +696,118 @@ class GFElement:
         """Multiplicación de dos elementos del campo con reducción modular."""
         if not isinstance(other, GFElement):
             return NotImplemented
-        if self.field != other.field:
+        if self.field is not other.field and self.field != other.field:
             raise ValueError("Los elementos deben pertenecer al mismo campo para multiplicar.")
-        
-        a = self.value
-        b = other.value
-        result = 0
-
-        while b:
-            if b & 1:
-                result ^= a  # Suma polinómica (XOR)
-            a <<= 1
-            b >>= 1
-
-        # Reducción modular
-        result = self._reduce(result)
-        return GFElement(self.field, result)
+        field = self.field
+        full = field._full_tables
+        if full is not None:
+            # Tabla completa: el producto es una sola consulta
+            return field.element(full[0][(self.value << field.degree) | other.value])
+        return field.element(field._mul(self.value, other.value))
 
     def _reduce(self, poly):
         """Reduce el polinomio 'poly' usando el polinomio irreducible del campo."""
-        irreducible = self.field.irreducible_poly
-        degree = self.field.degree
-        while poly.bit_length() > degree:
-            shift = poly.bit_length() - degree - 1
-            poly ^= irreducible << shift
-        return poly
+        return self.field._reduce(poly)
 
     def __truediv__(self, other):
         """División de dos elementos del campo: self / other."""
         if not isinstance(other, GFElement):
             return NotImplemented
-        if self.field != other.field:
+        if self.field is not other.field and self.field != other.field:
             raise ValueError("Los elementos deben pertenecer al mismo campo para dividir.")
         if other.value == 0:
             raise ZeroDivisionError("No se puede dividir por cero en un campo finito.")
-        inverse = self._multiplicative_inverse(other)
-        return self * inverse
+        field = self.field
+        full = field._full_tables
+        if full is not None:
+            return field.element(full[0][(self.value << field.degree) | full[1][other.value]])
+        return field.element(field._div(self.value, other.value))
 
     def _multiplicative_inverse(self, other):
-        """Calcula el inverso multiplicativo de 'other' usando el algoritmo extendido de Euclides."""
-        a = other.value
-        b = self.field.irreducible_poly
-        u, v = a, b
-        g1, g2 = 1, 0
-
-        while u != 1:
-            j = u.bit_length() - v.bit_length()
-            if j < 0:
-                u, v = v, u
-                g1, g2 = g2, g1
-                j = -j
-            u = u ^ (v << j)
-            g1 = g1 ^ (g2 << j)
-        
-        # g1 es el inverso multiplicativo
-        return GFElement(self.field, g1)
+        """Calcula el inverso multiplicativo de 'other'."""
+        if other.value == 0:
+            raise ZeroDivisionError("El cero no tiene inverso multiplicativo.")
+        return self.field.element(self.field._inverse(other.value))
 
     def __pow__(self, exponent):
         """Exponenciación de un elemento del campo."""
         if not isinstance(exponent, int):
             raise TypeError("El exponente debe ser un entero.")
-        
-        if exponent == 0:
-            return self.field.element(1)  # Elemento neutro multiplicativo
-        
-        elif exponent < 0:
-            inverse = self._multiplicative_inverse(self)
-            base = inverse
-            exponent = -exponent
-        else:
-            base = self
 
-        result = self.field.element(1)  # Elemento neutro multiplicativo
-        while exponent > 0:
-            if exponent & 1:
-                result = result * base
-            base = base * base
-            exponent >>= 1
-        return result
+        value = self.value
+        if value == 0:
+            if exponent < 0:
+                raise ZeroDivisionError("El cero no tiene inverso multiplicativo.")
+            return self.field.element(0 if exponent else 1)
+        # a^(2^n - 1) = 1, así que el exponente (también si es negativo) se reduce módulo 2^n - 1
+        return self.field.element(self.field._pow(value, exponent % (self.field.order - 1)))
+
+    def square(self):
+        """Cuadrado del elemento (aplicación lineal, más rápida que self * self)."""
+        return self.field.element(self.field._square(self.value))
+
+    def sqrt(self):
+        """Raíz cuadrada del elemento; en GF(2^n) todo elemento tiene exactamente una."""
+        return self.field.element(self.field._sqrt(self.value))
+
+    def frobenius(self, k=1):
+        """Automorfismo de Frobenius aplicado k veces: self^(2^k)."""
+        return self.field.element(self.field._frobenius(self.value, k))
+
+    def trace(self):
+        """Traza absoluta del elemento, 0 o 1."""
+        return self.field._trace(self.value)
+
+    def half_trace(self):
+        """
+        Semitraza del elemento (solo en campos de grado impar).
+
+        :raises ValueError: Si el grado del campo es par.
+        """
+        return self.field.element(self.field._half_trace(self.value))
+
+    def solve_quadratic(self):
+        """
+        Resuelve z^2 + z = self.
+
+        :return: Una solución z (la otra es z + 1).
+        :raises ValueError: Si la traza de self es 1 (no hay solución).
+        """
+        return self.field.element(self.field._solve_quadratic(self.value))
+
+    def order(self):
+        """
+        Orden multiplicativo del elemento: el menor k > 0 con self^k = 1.
+
+        Se calcula a partir de la factorización de 2^n - 1, sin recorrer el ciclo.
+        """
+        if self.value == 0:
+            raise ValueError("El cero no tiene orden multiplicativo.")
+        return self.field._order(self.value)
+
+    def log(self, base):
+        """
+        Logaritmo discreto: el menor x >= 0 tal que base^x = self.
+
+        :param base: GFElement del mismo campo, distinto de cero.
+        :raises ValueError: Si self no es potencia de la base.
+        """
+        if not isinstance(base, GFElement):
+            raise TypeError("La base debe ser un GFElement.")
+        if self.field is not base.field and self.field != base.field:
+            raise ValueError("Los elementos deben pertenecer al mismo campo para el logaritmo.")
+        if self.value == 0 or base.value == 0:
+            raise ValueError("El logaritmo solo está definido para elementos distintos de cero.")
+        return self.field._log(self.value, base.value)
 
     def __eq__(self, other):
         """Igualdad entre dos elementos del campo."""
+        if self is other:
+            return True
         if not isinstance(other, GFElement):
             return False
         return (self.value == other.value and
-                self.field == other.field)
+                (self.field is other.field or self.field == other.field))
 
     def to_polynomial(self):
         """Convierte el valor del elemento a su representación polinómica."""
@@ -185,11 +842,86 @@ class GFElement:
         return self  # En GF(2^n), -a = a
 
 
-def gf_eq(self, other):
-    if not isinstance(other, GF):
-        return False
-    return (self.degree == other.degree and
-            self.irreducible_poly == other.irreducible_poly and
-            self.order == other.order)
 
-GF.__eq__ = gf_eq
+class FixedBase:
+    def __init__(self, field, base, window=FIXED_BASE_WINDOW):
+        """
+        Exponenciación con base fija y tabla de ventanas precalculada.
+
+        El exponente se reduce módulo 2^n - 1 y se parte en dígitos de 'window'
+        bits. La fila i de la tabla guarda base^(d * 2^(window * i)) para cada
+        dígito d, así que base^e es el producto de una entrada por fila: unas
+        n / window multiplicaciones y ningún cuadrado, contra n cuadrados y
+        hasta n multiplicaciones del método binario.
+
+        En campos con tablas exp/log cada potencia ya es una consulta, así que
+        no se construye ninguna tabla adicional.
+
+        :param field: Instancia de GF.
+        :param base: Valor entero de la base.
+        :param window: Bits del exponente por consulta a la tabla.
+        """
+        if window <= 0:
+            raise ValueError("El ancho de ventana debe ser positivo.")
+        self.field = field
+        self.base = base
+        self.window = window
+        self._rows = None
+        if base != 0 and field.tables() is None:
+            self._rows = self._build_rows()
+
+    def _build_rows(self):
+        field = self.field
+        size = 1 << self.window
+        rows = []
+        power = self.base  # base^(2^(window * i))
+        for _ in range(-(-field.degree // self.window)):
+            row = [1, power]
+            for _ in range(size - 2):
+                row.append(field._mul_windowed(row[-1], power))
+            rows.append(row)
+            power = field._mul_windowed(row[-1], power)
+        return rows
+
+    def pow(self, exponent):
+        """
+        base^exponent como GFElement. Los exponentes negativos se reducen
+        módulo 2^n - 1, sin invertir la base.
+
+        :raises ZeroDivisionError: Si la base es cero y el exponente es negativo.
+        """
+        field = self.field
+        if self.base == 0:
+            if exponent < 0:
+                raise ZeroDivisionError("El cero no tiene inverso multiplicativo.")
+            return field.element(0 if exponent else 1)
+        exponent %= field.order - 1
+        if self._rows is None:
+            return field.element(field._pow(self.base, exponent))
+        mul = field._mul_windowed
+        mask = (1 << self.window) - 1
+        result = 1
+        for row in self._rows:
+            digit = exponent & mask
+            if digit:
+                result = mul(result, row[digit]) if result != 1 else row[digit]
+            exponent >>= self.window
+            if not exponent:
+                break
+        return field.element(result)
+
+    def __repr__(self):
+        return f"FixedBase({bin(self.base)}, GF(2^{self.field.degree}), window={self.window})"
+
+
+# Acceso directo a los slots para construir elementos sin pasar por __setattr__
+_set_field = GFElement.field.__set__
+_set_value = GFElement.value.__set__
+
+
+def _new_element(field, value):
+    """Crea un GFElement con un valor ya reducido, sin validaciones."""
+    element = object.__new__(GFElement)
+    _set_field(element, field)
+    _set_value(element, value)
+    return element
@@ -0,0 +1,322 @@
+import numpy as np
+
+from gf import GF, GFElement
+
+# Tablas exp/log como arreglos de NumPy, indexadas por (grado, polinomio irreducible)
+_NP_TABLE_CACHE = {}
+
+# Vistas de NumPy (sin copia) de las tablas completas de GF.full_tables
+_NP_FULL_TABLE_CACHE = {}
+
+
+def _dtype_for(degree):
+    """Devuelve el tipo entero sin signo más pequeño que almacena elementos de GF(2^degree)."""
+    if degree <= 8:
+        return np.uint8
+    if degree <= 16:
+        return np.uint16
+    if degree <= 32:
+        return np.uint32
+    raise ValueError("GFArray solo admite campos de grado a lo más 32.")
+
+
+def _np_tables(field):
+    """Devuelve las tablas exp/log del campo como arreglos de NumPy, o None."""
+    key = (field.degree, field.irreducible_poly)
+    if key not in _NP_TABLE_CACHE:
+        tables = field.tables()
+        if tables is None:
+            _NP_TABLE_CACHE[key] = None
+        else:
+            exp, log = tables
+            _NP_TABLE_CACHE[key] = (np.array(exp, dtype=_dtype_for(field.degree)),
+                                    np.array(log, dtype=np.int64))
+    return _NP_TABLE_CACHE[key]
+
+
+def _np_full_tables(field):
+    """
+    Devuelve las tablas completas del campo como arreglos de NumPy de solo
+    lectura que comparten memoria con el archivo mapeado: productos de
+    2^n x 2^n e inversos de 2^n entradas. Devuelve None si el grado es mayor a 8.
+    """
+    key = (field.degree, field.irreducible_poly)
+    if key not in _NP_FULL_TABLE_CACHE:
+        full = field.full_tables()
+        if full is None:
+            _NP_FULL_TABLE_CACHE[key] = None
+        else:
+            mul, inverse = full
+            _NP_FULL_TABLE_CACHE[key] = (np.frombuffer(mul, dtype=np.uint8).reshape(field.order, field.order),
+                                         np.frombuffer(inverse, dtype=np.uint8))
+    return _NP_FULL_TABLE_CACHE[key]
+
+
+def _clmul(field, a, b):
+    """Multiplicación sin acarreo seguida de reducción, elemento a elemento (sin tablas)."""
+    a = a.astype(np.uint64)
+    b = b.astype(np.uint64)
+    result = np.zeros(np.broadcast(a, b).shape, dtype=np.uint64)
+    for i in range(field.degree):
+        result ^= (a << np.uint64(i)) * ((b >> np.uint64(i)) & np.uint64(1))
+    # Reducción: elimina los bits de grado >= n empezando por el más alto
+    for bit in range(2 * field.degree - 2, field.degree - 1, -1):
+        shifted = np.uint64(field.irreducible_poly << (bit - field.degree))
+        result ^= ((result >> np.uint64(bit)) & np.uint64(1)) * shifted
+    return result.astype(_dtype_for(field.degree))
+
+
+def _mul(field, a, b):
+    """Producto elemento a elemento de dos arreglos de valores del campo."""
+    full = _np_full_tables(field)
+    if full is not None:
+        return full[0][a, b]
+    tables = _np_tables(field)
+    if tables is None:
+        return _clmul(field, a, b)
+    exp, log = tables
+    result = exp[log[a] + log[b]]
+    return np.where((a == 0) | (b == 0), 0, result).astype(exp.dtype)
+
+
+def _pow(field, a, exponent):
+    """Potencia elemento a elemento con un exponente entero no negativo."""
+    group_order = field.order - 1
+    reduced = exponent % group_order
+    tables = _np_tables(field)
+    if tables is not None:
+        exp, log = tables
+        result = exp[(log[a] * reduced) % group_order]
+    else:
+        result = np.ones_like(a)
+        base = a
+        e = reduced
+        while e:
+            if e & 1:
+                result = _clmul(field, result, base)
+            base = _clmul(field, base, base)
+            e >>= 1
+    zero_value = 0 if exponent else 1
+    return np.where(a == 0, zero_value, result).astype(a.dtype)
+
+
+def _inverse(field, a, skip_zeros=False):
+    """
+    Inverso elemento a elemento.
+
+    Con tablas cada inverso es una consulta. Sin tablas se usa la inversión
+    simultánea de Montgomery en forma de árbol: se multiplican los valores por
+    pares hasta la raíz, se invierte solo la raíz y se desciende repartiendo el
+    inverso, con alrededor de 3N multiplicaciones vectorizadas en total.
+
+    :param skip_zeros: Si es True, los ceros se devuelven como cero; si es
+                       False, un cero lanza ZeroDivisionError.
+    """
+    zeros = a == 0
+    if np.any(zeros):
+        if not skip_zeros:
+            raise ZeroDivisionError("No se puede dividir por cero en un campo finito.")
+        a = np.where(zeros, 1, a).astype(a.dtype)
+    full = _np_full_tables(field)
+    if full is not None:
+        return np.where(zeros, 0, full[1][a]).astype(a.dtype)
+    tables = _np_tables(field)
+    if tables is not None:
+        exp, log = tables
+        result = exp[field.order - 1 - log[a]]
+    else:
+        result = _tree_inverse(field, a.reshape(-1)).reshape(a.shape)
+    return np.where(zeros, 0, result).astype(a.dtype)
+
+
+def _tree_inverse(field, values):
+    """Inversión simultánea de Montgomery sobre un arreglo 1-D sin ceros."""
+    if values.size == 0:
+        return values
+    size = 1 << (values.size - 1).bit_length()
+    levels = [np.concatenate([values, np.ones(size - values.size, dtype=values.dtype)])]
+    while levels[-1].size > 1:
+        level = levels[-1]
+        levels.append(_clmul(field, level[0::2], level[1::2]))
+    inverses = np.array([field._inverse(int(levels[-1][0]))], dtype=values.dtype)
+    for level in reversed(levels[:-1]):
+        # El inverso de cada hijo es el inverso del padre por su hermano
+        children = np.empty_like(level)
+        children[0::2] = _clmul(field, inverses, level[1::2])
+        children[1::2] = _clmul(field, inverses, level[0::2])
+        inverses = children
+    return inverses[:values.size]
+
+
+class GFArray:
+    def __init__(self, field, values):
+        """
+        Inicializa un arreglo de elementos del campo finito respaldado por NumPy.
+
+        :param field: Instancia de GF que representa el campo.
+        :param values: Enteros, GFElement o un arreglo de NumPy con los valores.
+        """
+        if not isinstance(field, GF):
+            raise TypeError("field debe ser una instancia de GF.")
+        dtype = _dtype_for(field.degree)
+        if isinstance(values, np.ndarray):
+            array = values
+        else:
+            array = np.array([v.value if isinstance(v, GFElement) else v for v in values]
+                             if isinstance(values, (list, tuple)) else values, dtype=np.int64)
+        self.field = field
+        # Asegura que los valores estén dentro del campo
+        self.values = (array & (field.order - 1)).astype(dtype, copy=False)
+
+    def _wrap(self, values):
+        """Crea un GFArray del mismo campo sin volver a validar los valores."""
+        result = GFArray.__new__(GFArray)
+        result.field = self.field
+        result.values = values
+        return result
+
+    def _operand(self, other, operation):
+        """Convierte 'other' en valores compatibles por difusión (broadcasting)."""
+        if isinstance(other, GFArray):
+            if self.field is not other.field and self.field != other.field:
+                raise ValueError(f"Los elementos deben pertenecer al mismo campo para {operation}.")
+            return other.values
+        if isinstance(other, GFElement):
+            if self.field is not other.field and self.field != other.field:
+                raise ValueError(f"Los elementos deben pertenecer al mismo campo para {operation}.")
+            return self.values.dtype.type(other.value)
+        return None
+
+    def __add__(self, other):
+        """Suma elemento a elemento utilizando XOR."""
+        values = self._operand(other, "sumar")
+        if values is None:
+            return NotImplemented
+        return self._wrap(self.values ^ values)
+
+    __radd__ = __add__
+    __sub__ = __add__  # En GF(2^n), la resta es igual a la suma
+    __rsub__ = __add__
+
+    def __mul__(self, other):
+        """Multiplicación elemento a elemento."""
+        values = self._operand(other, "multiplicar")
+        if values is None:
+            return NotImplemented
+        return self._wrap(_mul(self.field, self.values, values))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """División elemento a elemento: self / other."""
+        values = self._operand(other, "dividir")
+        if values is None:
+            return NotImplemented
+        return self._wrap(_mul(self.field, self.values, _inverse(self.field, np.asarray(values))))
+
+    def __rtruediv__(self, other):
+        """División elemento a elemento: other / self."""
+        values = self._operand(other, "dividir")
+        if values is None:
+            return NotImplemented
+        return self._wrap(_mul(self.field, values, _inverse(self.field, self.values)))
+
+    def __pow__(self, exponent):
+        """Exponenciación elemento a elemento con un exponente entero."""
+        if not isinstance(exponent, int):
+            raise TypeError("El exponente debe ser un entero.")
+        values = self.values
+        if exponent < 0:
+            values = _inverse(self.field, values)
+            exponent = -exponent
+        return self._wrap(_pow(self.field, values, exponent))
+
+    def batch_inverse(self, skip_zeros=False):
+        """
+        Invierte todos los elementos del arreglo a la vez.
+
+        :param skip_zeros: Si es True, los ceros se devuelven como cero; si es
+                           False, un cero lanza ZeroDivisionError.
+        :return: GFArray con los inversos.
+        """
+        return self._wrap(_inverse(self.field, self.values, skip_zeros))
+
+    def __neg__(self):
+        """Negación elemento a elemento (igual al arreglo en GF(2^n))."""
+        return self
+
+    def sum(self, axis=None):
+        """Suma (XOR) de los elementos del arreglo."""
+        return self._reduced(np.bitwise_xor.reduce(self.values, axis=axis))
+
+    def prod(self, axis=None):
+        """Producto de los elementos del arreglo."""
+        tables = _np_tables(self.field)
+        if tables is not None:
+            exp, log = tables
+            logs = np.sum(log[self.values], axis=axis) % (self.field.order - 1)
+            has_zero = np.any(self.values == 0, axis=axis)
+            return self._reduced(np.where(has_zero, 0, exp[logs]).astype(self.values.dtype))
+        values = self.values.reshape(-1) if axis is None else np.moveaxis(self.values, axis, 0)
+        while values.shape[0] > 1:
+            # Reducción por pares: multiplica la primera mitad por la segunda
+            if values.shape[0] % 2:
+                values = np.concatenate([values, np.ones_like(values[:1])])
+            half = values.shape[0] // 2
+            values = _clmul(self.field, values[:half], values[half:])
+        if values.shape[0] == 0:
+            return self._reduced(np.ones((), dtype=self.values.dtype))
+        return self._reduced(values[0])
+
+    def dot(self, other):
+        """Producto punto a lo largo del último eje."""
+        if not isinstance(other, GFArray):
+            raise TypeError("dot requiere otro GFArray.")
+        return (self * other).sum(axis=-1)
+
+    def _reduced(self, values):
+        """Convierte el resultado de una reducción en GFElement o GFArray."""
+        if np.ndim(values) == 0:
+            return self.field.element(int(values))
+        return self._wrap(values)
+
+    def __getitem__(self, index):
+        """Devuelve un GFElement para índices escalares y un GFArray para rebanadas."""
+        return self._reduced(self.values[index])
+
+    def __setitem__(self, index, value):
+        """Asigna elementos del campo en las posiciones indicadas."""
+        values = self._operand(value, "asignar")
+        if values is None:
+            raise TypeError("Solo se pueden asignar GFElement o GFArray.")
+        self.values[index] = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for value in self.values.tolist():
+            yield self.field.element(value)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def tolist(self):
+        """Convierte el arreglo en una lista de GFElement."""
+        return list(self)
+
+    def __eq__(self, other):
+        """Igualdad elemento a elemento; devuelve un arreglo booleano."""
+        values = self._operand(other, "comparar")
+        if values is None:
+            return NotImplemented
+        return self.values == values
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GFArray({self.values.tolist()}, GF(2^{self.field.degree}))"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,241 @@
+import re
+from functools import lru_cache
+
+from gf import GF
+from irreducible import find_irreducible
+
+# Literales numéricos: binario (0b...), hexadecimal (0x...) o decimal
+_NUMBER = re.compile(r"(0[bB][01]+|0[xX][0-9a-fA-F]+|\d+)")
+# Tokens de la forma de una expresión (los literales ya reemplazados por '#')
+_SHAPE_TOKEN = re.compile(r"\*\*|\S")
+# Encabezado de campo: GF(2^n) o GF(2^n, polinomio)
+_HEADER = re.compile(r"\s*GF\(\s*2\s*\^\s*(\d+)\s*(?:,\s*(0[bB][01]+|0[xX][0-9a-fA-F]+|\d+)\s*)?\)\s*$")
+
+# Número de formas de expresión distintas cuyo plan se conserva
+PLAN_CACHE_SIZE = 4096
+
+# Códigos de operación del plan de evaluación (notación polaca inversa)
+_LITERAL, _X, _ADD, _MUL, _DIV, _POW, _X_POW = range(7)
+
+
+def _parse_int(token):
+    """Convierte un literal binario, hexadecimal o decimal a entero."""
+    if token[:2] in ("0b", "0B", "0x", "0X"):
+        return int(token, 0)
+    return int(token)
+
+
+class _Parser:
+    """
+    Analizador descendente recursivo de la forma de una expresión:
+
+        expr  := term (('+' | '-') term)*
+        term  := unary (('*' | '/') unary)*
+        unary := '-' unary | power
+        power := atom (('^' | '**') ['-'] '#')?
+        atom  := '#' | 'x' | '(' expr ')'
+
+    Produce el plan en notación polaca inversa como una lista de pares
+    (operación, argumento); el argumento de _LITERAL, _X_POW y _POW es el
+    índice del literal en la expresión original (en _POW, desplazado en uno
+    y con el signo del exponente).
+    """
+
+    def __init__(self, shape):
+        self.tokens = _SHAPE_TOKEN.findall(shape)
+        self.pos = 0
+        self.literal = 0
+        self.plan = []
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            found = "el final" if token is None else f"'{token}'"
+            wanted = f"'{expected}'" if expected is not None else "un operando"
+            raise ValueError(f"Expresión inválida: se esperaba {wanted} y se encontró {found}.")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Expresión inválida: la expresión está vacía.")
+        self.expr()
+        if self.peek() is not None:
+            raise ValueError(f"Expresión inválida: sobra '{self.peek()}'.")
+        return tuple(self.plan)
+
+    def expr(self):
+        self.term()
+        while self.peek() in ("+", "-"):
+            self.take()
+            self.term()
+            self.plan.append((_ADD, 0))  # En característica 2, la resta es igual a la suma
+
+    def term(self):
+        self.unary()
+        while self.peek() in ("*", "/"):
+            operation = _MUL if self.take() == "*" else _DIV
+            self.unary()
+            self.plan.append((operation, 0))
+
+    def unary(self):
+        if self.peek() == "-":
+            self.take()
+            self.unary()  # En GF(2^n), -a = a
+        else:
+            self.power()
+
+    def power(self):
+        self.atom()
+        if self.peek() in ("^", "**"):
+            self.take()
+            sign = 1
+            if self.peek() == "-":
+                self.take()
+                sign = -1
+            self.take("#")
+            if sign > 0 and self.plan[-1] == (_X, 0):
+                # x^k es un monomio: basta con reducir 1 << k
+                self.plan[-1] = (_X_POW, self.literal)
+            else:
+                self.plan.append((_POW, sign * (self.literal + 1)))
+            self.literal += 1
+            if self.peek() in ("^", "**"):
+                raise ValueError("Expresión inválida: las potencias encadenadas requieren paréntesis.")
+
+    def atom(self):
+        token = self.take()
+        if token == "#":
+            self.plan.append((_LITERAL, self.literal))
+            self.literal += 1
+        elif token == "x":
+            self.plan.append((_X, 0))
+        elif token == "(":
+            self.expr()
+            self.take(")")
+        else:
+            raise ValueError(f"Expresión inválida: token inesperado '{token}'.")
+
+
+def _generate_source(plan):
+    """
+    Traduce un plan en notación polaca inversa a una función de Python en la
+    que cada posición de la pila es una variable local (s0, s1, ...).
+    """
+    lines = ["def evaluate(field, literals):",
+             "    order = field.order",
+             "    monomial_limit = 2 * field.degree",
+             "    reduce, mul, div, power, inverse = field._reduce, field._mul, field._div, field._pow, field._inverse"]
+    depth = 0
+    for operation, argument in plan:
+        top, below = f"s{depth - 1}", f"s{depth - 2}"
+        if operation == _LITERAL:
+            lines.append(f"    s{depth} = literals[{argument}]")
+            lines.append(f"    if s{depth} >= order: s{depth} = reduce(s{depth})")
+            depth += 1
+        elif operation == _X:
+            lines.append(f"    s{depth} = 2 if order > 2 else 1")  # x, reducido si el campo es GF(2)
+            depth += 1
+        elif operation == _X_POW:
+            lines.append(f"    s{depth} = literals[{argument}]")
+            lines.append(f"    s{depth} = reduce(1 << s{depth}) if s{depth} < monomial_limit "
+                         f"else power(2 if order > 2 else 1, s{depth})")
+            depth += 1
+        elif operation == _ADD:
+            lines.append(f"    {below} ^= {top}")
+            depth -= 1
+        elif operation == _MUL:
+            lines.append(f"    {below} = mul({below}, {top})")
+            depth -= 1
+        elif operation == _DIV:
+            lines.append(f"    if not {top}: raise ZeroDivisionError(_DIVISION_BY_ZERO)")
+            lines.append(f"    {below} = div({below}, {top})")
+            depth -= 1
+        elif argument < 0:
+            lines.append(f"    if not {top}: raise ZeroDivisionError(_ZERO_INVERSE)")
+            lines.append(f"    {top} = power(inverse({top}), literals[{-argument - 1}])")
+        else:
+            lines.append(f"    {top} = power({top}, literals[{argument - 1}])")
+    lines.append("    return s0")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_expression(shape):
+    """
+    Compila la forma de una expresión (literales reemplazados por '#') a un
+    plan de evaluación: una función evaluate(field, literals) que devuelve el
+    valor entero del resultado.
+
+    Las expresiones que solo difieren en sus literales comparten el mismo
+    plan, así que cada forma se analiza y se compila una sola vez. Los
+    literales de elementos se interpretan como polinomios y se reducen módulo
+    el polinomio irreducible; los de exponentes se usan tal cual.
+    """
+    namespace = {"_DIVISION_BY_ZERO": "No se puede dividir por cero en un campo finito.",
+                 "_ZERO_INVERSE": "El cero no tiene inverso multiplicativo."}
+    exec(compile(_generate_source(_Parser(shape).parse()), "<gf_expr>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+def split_literals(expression):
+    """
+    Separa una expresión en su forma y sus literales.
+
+    :return: Tupla (forma, lista de literales como enteros).
+    """
+    parts = _NUMBER.split(expression)
+    tokens = parts[1::2]
+    try:
+        literals = list(map(int, tokens, [0] * len(tokens)))
+    except ValueError:  # Decimales con ceros a la izquierda, como 07
+        literals = [_parse_int(token) for token in tokens]
+    return "#".join(parts[0::2]), literals
+
+
+class ExpressionEvaluator:
+    def __init__(self, default_degree=None):
+        """
+        Evaluador de líneas de la forma 'GF(2^n): expresión'.
+
+        :param default_degree: Grado del campo para las líneas sin encabezado;
+                               si es None, el encabezado es obligatorio.
+        """
+        self.default_degree = default_degree
+        self._fields = {}
+
+    def field_for(self, header):
+        """Campo de un encabezado 'GF(2^n)' o 'GF(2^n, polinomio)', creado una sola vez."""
+        field = self._fields.get(header)
+        if field is None:
+            match = _HEADER.match(header)
+            if match is None:
+                raise ValueError(f"Encabezado de campo inválido: '{header.strip()}'.")
+            degree = int(match.group(1))
+            if degree <= 0:
+                raise ValueError("El grado del campo debe ser un entero positivo.")
+            poly = _parse_int(match.group(2)) if match.group(2) else find_irreducible(degree)
+            field = self._fields[header] = GF(degree, poly)
+        return field
+
+    def evaluate(self, line):
+        """
+        Evalúa una línea.
+
+        :return: Tupla (campo, valor entero del resultado).
+        :raises ValueError: Si el encabezado o la expresión no son válidos.
+        :raises ZeroDivisionError: Si la expresión divide entre cero.
+        """
+        header, separator, expression = line.partition(":")
+        if separator:
+            field = self.field_for(header)
+        elif self.default_degree is not None:
+            field = self.field_for(f"GF(2^{self.default_degree})")
+            expression = header
+        else:
+            raise ValueError("Falta el encabezado del campo, por ejemplo 'GF(2^8):'.")
+        shape, literals = split_literals(expression)
+        return field, compile_expression(shape)(field, literals)
@@ -0,0 +1,246 @@
+import numpy as np
+
+from gf import GF, GFElement
+from gf_array import GFArray, _dtype_for, _mul, _np_full_tables
+
+
+def _mul_table(field):
+    """Tabla completa de productos (2^n x 2^n) para campos de grado a lo más 8, o None."""
+    full = _np_full_tables(field)
+    return None if full is None else full[0]
+
+
+def _outer(field, column, row):
+    """Producto exterior column * row^T: escala la fila por cada valor de la columna."""
+    table = _mul_table(field)
+    if table is not None:
+        # Se calculan los 2^n múltiplos de la fila y luego se copian filas completas
+        return table[:, row][column]
+    return _mul(field, column[:, None], row[None, :])
+
+
+def _scale(field, factor, row):
+    """Multiplica una fila por un escalar (valor entero del campo)."""
+    table = _mul_table(field)
+    if table is not None:
+        return table[factor][row]
+    return _mul(field, row, row.dtype.type(factor))
+
+
+class GFMatrix:
+    def __init__(self, field, rows):
+        """
+        Inicializa una matriz con entradas en GF(2^n), respaldada por NumPy.
+
+        :param field: Instancia de GF que representa el campo.
+        :param rows: Lista de filas (enteros o GFElement), arreglo 2-D de NumPy o GFArray 2-D.
+        """
+        if not isinstance(field, GF):
+            raise TypeError("field debe ser una instancia de GF.")
+        if isinstance(rows, GFArray):
+            rows = rows.values
+        if not isinstance(rows, np.ndarray):
+            rows = np.array([[v.value if isinstance(v, GFElement) else v for v in row] for row in rows],
+                            dtype=np.int64)
+        if rows.ndim != 2:
+            raise ValueError("Una matriz debe tener dos dimensiones.")
+        self.field = field
+        self.values = (rows & (field.order - 1)).astype(_dtype_for(field.degree))
+
+    @classmethod
+    def identity(cls, field, n):
+        """Matriz identidad de n x n."""
+        return cls(field, np.eye(n, dtype=np.int64))
+
+    def _wrap(self, values):
+        """Crea una GFMatrix del mismo campo sin volver a validar los valores."""
+        result = GFMatrix.__new__(GFMatrix)
+        result.field = self.field
+        result.values = values
+        return result
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def _check(self, other, operation):
+        if self.field is not other.field and self.field != other.field:
+            raise ValueError(f"Las matrices deben pertenecer al mismo campo para {operation}.")
+
+    def __add__(self, other):
+        """Suma entrada a entrada utilizando XOR."""
+        if not isinstance(other, GFMatrix):
+            return NotImplemented
+        self._check(other, "sumar")
+        if self.shape != other.shape:
+            raise ValueError("Las matrices deben tener la misma forma para sumar.")
+        return self._wrap(self.values ^ other.values)
+
+    __sub__ = __add__  # En GF(2^n), la resta es igual a la suma
+
+    def __mul__(self, other):
+        """Producto por un escalar GFElement."""
+        if not isinstance(other, GFElement):
+            return NotImplemented
+        self._check(other, "multiplicar")
+        return self._wrap(_scale(self.field, other.value, self.values))
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other):
+        """
+        Producto de matrices (o matriz por vector GFArray).
+
+        Acumula con XOR el producto exterior de cada columna de self con la
+        fila correspondiente de other, de modo que cada paso es vectorizado.
+        """
+        if isinstance(other, GFArray):
+            self._check(other, "multiplicar")
+            column = other.values.reshape(-1, 1)
+            return GFArray(self.field, (self @ self._wrap(column)).values.reshape(-1))
+        if not isinstance(other, GFMatrix):
+            return NotImplemented
+        self._check(other, "multiplicar")
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Las dimensiones no son compatibles para multiplicar.")
+        result = np.zeros((self.shape[0], other.shape[1]), dtype=self.values.dtype)
+        for k in range(self.shape[1]):
+            result ^= _outer(self.field, self.values[:, k], other.values[k])
+        return self._wrap(result)
+
+    def transpose(self):
+        """Matriz transpuesta."""
+        return self._wrap(self.values.T.copy())
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def _eliminate(self, values, full):
+        """
+        Eliminación gaussiana en sitio sobre 'values'.
+
+        Cada pivote se normaliza a 1 y se elimina su columna del resto de las
+        filas con una sola actualización vectorizada (producto exterior).
+
+        :param full: Si es True, elimina también arriba del pivote (forma
+                     escalonada reducida); si es False, solo abajo.
+        :return: Lista de columnas pivote y lista de los valores de los pivotes
+                 antes de normalizarlos.
+        """
+        field = self.field
+        n_rows, n_cols = values.shape
+        pivots, pivot_values = [], []
+        r = 0
+        for c in range(n_cols):
+            if r == n_rows:
+                break
+            nonzero = np.flatnonzero(values[r:, c])
+            if nonzero.size == 0:
+                continue
+            p = r + nonzero[0]
+            if p != r:
+                values[[r, p]] = values[[p, r]]
+            pivot = int(values[r, c])
+            values[r, c:] = _scale(field, field._inverse(pivot), values[r, c:])
+            # Las filas con cero en la columna no cambian (0 * fila = 0)
+            start = 0 if full else r + 1
+            column = values[start:, c].copy()
+            if full:
+                column[r] = 0
+            values[start:, c:] ^= _outer(field, column, values[r, c:])
+            pivots.append(c)
+            pivot_values.append(pivot)
+            r += 1
+        return pivots, pivot_values
+
+    def row_reduce(self):
+        """
+        Forma escalonada reducida por filas.
+
+        :return: Tupla (GFMatrix reducida, lista de columnas pivote).
+        """
+        values = self.values.copy()
+        pivots, _ = self._eliminate(values, full=True)
+        return self._wrap(values), pivots
+
+    def rank(self):
+        """Rango de la matriz."""
+        return len(self._eliminate(self.values.copy(), full=False)[0])
+
+    def determinant(self):
+        """Determinante: producto de los pivotes (el signo no importa en característica 2)."""
+        n_rows, n_cols = self.shape
+        if n_rows != n_cols:
+            raise ValueError("El determinante solo está definido para matrices cuadradas.")
+        pivots, pivot_values = self._eliminate(self.values.copy(), full=False)
+        if len(pivots) < n_rows:
+            return self.field.element(0)
+        result = 1
+        for value in pivot_values:
+            result = self.field._mul(result, value)
+        return self.field.element(result)
+
+    def inverse(self):
+        """Matriz inversa, reduciendo [A | I]."""
+        n_rows, n_cols = self.shape
+        if n_rows != n_cols:
+            raise ValueError("Solo las matrices cuadradas tienen inversa.")
+        augmented = np.concatenate([self.values, np.eye(n_rows, dtype=self.values.dtype)], axis=1)
+        pivots, _ = self._eliminate(augmented, full=True)
+        if len(pivots) < n_rows or pivots[-1] >= n_cols:
+            raise ValueError("La matriz es singular.")
+        return self._wrap(augmented[:, n_cols:].copy())
+
+    def solve(self, b):
+        """
+        Resuelve A x = b, reduciendo la matriz aumentada [A | b].
+
+        :param b: GFArray 1-D, lista de valores o GFMatrix con varios lados derechos.
+        :return: GFArray si b es un vector, GFMatrix si b es una matriz.
+        :raises ValueError: Si el sistema no tiene solución o no es única.
+        """
+        is_vector = not isinstance(b, GFMatrix)
+        if is_vector:
+            b = b if isinstance(b, GFArray) else self.field.array(list(b))
+            rhs = b.values.reshape(-1, 1)
+        else:
+            rhs = b.values
+        self._check(b, "resolver")
+        n_rows, n_cols = self.shape
+        if rhs.shape[0] != n_rows:
+            raise ValueError("El lado derecho debe tener tantas filas como la matriz.")
+        augmented = np.concatenate([self.values, rhs.astype(self.values.dtype)], axis=1)
+        pivots, _ = self._eliminate(augmented, full=True)
+        if any(c >= n_cols for c in pivots):
+            raise ValueError("El sistema no tiene solución.")
+        if len(pivots) < n_cols:
+            raise ValueError("El sistema no tiene solución única.")
+        solution = augmented[:n_cols, n_cols:].copy()
+        if is_vector:
+            return GFArray(self.field, solution.reshape(-1))
+        return self._wrap(solution)
+
+    def __getitem__(self, index):
+        """Devuelve un GFElement para un par de índices escalares y una GFMatrix en otro caso."""
+        values = self.values[index]
+        if np.ndim(values) == 0:
+            return self.field.element(int(values))
+        if values.ndim == 1:
+            return GFArray(self.field, values)
+        return self._wrap(values)
+
+    def __eq__(self, other):
+        """Dos matrices son iguales si tienen el mismo campo, forma y entradas."""
+        if not isinstance(other, GFMatrix):
+            return False
+        return ((self.field is other.field or self.field == other.field) and
+                np.array_equal(self.values, other.values))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GFMatrix({self.values.tolist()}, GF(2^{self.field.degree}))"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,309 @@
+try:
+    import numpy as np
+
+    from gf_array import GFArray
+except ImportError:  # La evaluación en lote usa GFArray solo si NumPy está disponible
+    np = GFArray = None
+
+from gf import GF, GFElement
+
+# Longitud a partir de la cual la multiplicación usa Karatsuba en lugar del método escolar
+KARATSUBA_THRESHOLD = 32
+
+
+def _schoolbook(field, a, b):
+    """Producto escolar de dos listas de coeficientes (enteros, grado menor primero)."""
+    if not a or not b:
+        return []
+    result = [0] * (len(a) + len(b) - 1)
+    tables = field.tables()
+    if tables is not None:
+        exp, log = tables
+        log_b = [(j, log[y]) for j, y in enumerate(b) if y]
+        for i, x in enumerate(a):
+            if x:
+                lx = log[x]
+                for j, ly in log_b:
+                    result[i + j] ^= exp[lx + ly]
+        return result
+    mul = field._mul
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                if y:
+                    result[i + j] ^= mul(x, y)
+    return result
+
+
+def _karatsuba(field, a, b):
+    """Producto de Karatsuba; cambia al método escolar por debajo del umbral."""
+    if min(len(a), len(b)) <= KARATSUBA_THRESHOLD:
+        return _schoolbook(field, a, b)
+    half = max(len(a), len(b)) // 2
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+    z0 = _karatsuba(field, a0, b0)
+    z2 = _karatsuba(field, a1, b1)
+    z1 = _karatsuba(field, _add(a0, a1), _add(b0, b1))
+    result = [0] * (len(a) + len(b) - 1)
+    for i, c in enumerate(z0):
+        result[i] ^= c
+        result[i + half] ^= c
+    for i, c in enumerate(z2):
+        result[i + 2 * half] ^= c
+        result[i + half] ^= c
+    for i, c in enumerate(z1):
+        result[i + half] ^= c
+    return result
+
+
+def _add(a, b):
+    """Suma de dos listas de coeficientes (XOR coeficiente a coeficiente)."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, c in enumerate(b):
+        result[i] ^= c
+    return result
+
+
+def _trim(coeffs):
+    """Elimina los coeficientes cero de mayor grado."""
+    end = len(coeffs)
+    while end and not coeffs[end - 1]:
+        end -= 1
+    return tuple(coeffs[:end])
+
+
+class GFPolynomial:
+    def __init__(self, field, coeffs):
+        """
+        Inicializa un polinomio con coeficientes en GF(2^n).
+
+        :param field: Instancia de GF que representa el campo de coeficientes.
+        :param coeffs: Coeficientes como enteros o GFElement, del término
+                       independiente al de mayor grado.
+        """
+        if not isinstance(field, GF):
+            raise TypeError("field debe ser una instancia de GF.")
+        mask = field.order - 1
+        self.field = field
+        # Los coeficientes se guardan como una tupla de enteros
+        self.coeffs = _trim([(c.value if isinstance(c, GFElement) else c) & mask for c in coeffs])
+
+    @classmethod
+    def _from_coeffs(cls, field, coeffs):
+        """Crea un polinomio a partir de enteros ya reducidos."""
+        poly = cls.__new__(cls)
+        poly.field = field
+        poly.coeffs = _trim(coeffs)
+        return poly
+
+    @property
+    def degree(self):
+        """Grado del polinomio (-1 para el polinomio cero)."""
+        return len(self.coeffs) - 1
+
+    def _check(self, other, operation):
+        if not isinstance(other, GFPolynomial):
+            return False
+        if self.field is not other.field and self.field != other.field:
+            raise ValueError(f"Los polinomios deben tener coeficientes en el mismo campo para {operation}.")
+        return True
+
+    def __add__(self, other):
+        """Suma de polinomios (XOR coeficiente a coeficiente)."""
+        if not self._check(other, "sumar"):
+            return NotImplemented
+        return GFPolynomial._from_coeffs(self.field, _add(self.coeffs, other.coeffs))
+
+    __sub__ = __add__  # En característica 2, la resta es igual a la suma
+
+    def __mul__(self, other):
+        """Producto de polinomios: escolar o Karatsuba según el tamaño."""
+        if isinstance(other, GFElement):
+            other = GFPolynomial._from_coeffs(self.field, [other.value])
+        if not self._check(other, "multiplicar"):
+            return NotImplemented
+        return GFPolynomial._from_coeffs(self.field, _karatsuba(self.field, list(self.coeffs),
+                                                                list(other.coeffs)))
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other):
+        """Cociente y residuo de la división larga."""
+        if not self._check(other, "dividir"):
+            return NotImplemented
+        if other.degree < 0:
+            raise ZeroDivisionError("División entre el polinomio cero.")
+        field = self.field
+        remainder = list(self.coeffs)
+        divisor = other.coeffs
+        d = other.degree
+        lead_inverse = field._inverse(divisor[-1])
+        quotient = [0] * max(len(remainder) - d, 0)
+        mul = field._mul
+        for i in range(len(remainder) - 1, d - 1, -1):
+            c = remainder[i]
+            if not c:
+                continue
+            factor = mul(c, lead_inverse)
+            quotient[i - d] = factor
+            for j, y in enumerate(divisor):
+                if y:
+                    remainder[i - d + j] ^= mul(factor, y)
+        return (GFPolynomial._from_coeffs(field, quotient),
+                GFPolynomial._from_coeffs(field, remainder[:d]))
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    def monic(self):
+        """Devuelve el polinomio dividido entre su coeficiente principal."""
+        if self.degree < 0:
+            return self
+        inverse = self.field._inverse(self.coeffs[-1])
+        mul = self.field._mul
+        return GFPolynomial._from_coeffs(self.field, [mul(c, inverse) for c in self.coeffs])
+
+    def gcd(self, other):
+        """Máximo común divisor mónico (algoritmo de Euclides)."""
+        if not self._check(other, "calcular el mcd"):
+            raise TypeError("gcd requiere otro GFPolynomial.")
+        a, b = self, other
+        while b.degree >= 0:
+            a, b = b, a % b
+        return a.monic()
+
+    def derivative(self):
+        """Derivada formal; en característica 2 solo sobreviven los términos de grado impar."""
+        return GFPolynomial._from_coeffs(
+            self.field, [c if i % 2 else 0 for i, c in enumerate(self.coeffs)][1:])
+
+    def __call__(self, x):
+        """Evalúa el polinomio en un GFElement con el método de Horner."""
+        if not isinstance(x, GFElement):
+            raise TypeError("El punto debe ser un GFElement.")
+        mul = self.field._mul
+        value = x.value
+        result = 0
+        for c in reversed(self.coeffs):
+            result = mul(result, value) ^ c
+        return self.field.element(result)
+
+    def evaluate(self, points):
+        """
+        Evalúa el polinomio en muchos puntos a la vez.
+
+        Con NumPy los puntos se guardan en un GFArray y cada paso de Horner se
+        aplica a todos los puntos juntos.
+
+        :param points: GFArray o cualquier iterable de GFElement (lista, tupla,
+                       generador, ...).
+        :return: GFArray si la entrada es un GFArray; si no, lista de GFElement.
+        """
+        is_array = GFArray is not None and isinstance(points, GFArray)
+        if not is_array:
+            points = list(points)
+        if np is not None and (is_array or self.field.degree <= 32):
+            xs = points if is_array else self.field.array(points)
+            result = self.field.array(np.zeros(xs.shape, dtype=np.int64))
+            for c in reversed(self.coeffs):
+                result = result * xs + self.field.element(c)
+            return result if is_array else result.tolist()
+        return [self(x) for x in points]
+
+    @classmethod
+    def interpolate(cls, field, xs, ys, method="lagrange"):
+        """
+        Polinomio de grado menor a len(xs) que pasa por los puntos (xs[i], ys[i]).
+
+        - "lagrange": construye M(x) = prod(x - xs[i]) y suma ys[i] * M(x) / ((x - xs[i]) M'(xs[i])),
+          invirtiendo todos los denominadores M'(xs[i]) en un solo lote.
+        - "newton": diferencias divididas, invirtiendo cada nivel de diferencias en un lote.
+
+        :param xs: Lista de GFElement distintos.
+        :param ys: Lista de GFElement con los valores.
+        """
+        if len(xs) != len(ys):
+            raise ValueError("xs y ys deben tener la misma longitud.")
+        if len({x.value for x in xs}) != len(xs):
+            raise ValueError("Los puntos de interpolación deben ser distintos.")
+        if method == "lagrange":
+            return cls._interpolate_lagrange(field, xs, ys)
+        if method == "newton":
+            return cls._interpolate_newton(field, xs, ys)
+        raise ValueError(f"Método de interpolación desconocido: {method}.")
+
+    @classmethod
+    def _interpolate_lagrange(cls, field, xs, ys):
+        mul = field._mul
+        master = cls._from_coeffs(field, [1])
+        for x in xs:
+            master = master * cls._from_coeffs(field, [x.value, 1])
+        weights = field.batch_inverse(master.derivative().evaluate(list(xs)))
+        coeffs = master.coeffs
+        if np is not None and field.degree <= 32:
+            # Todas las divisiones sintéticas avanzan juntas, un coeficiente a la vez
+            points = field.array(list(xs))
+            scales = field.array(list(ys)) * field.array(weights)
+            carry = field.array(np.zeros(len(xs), dtype=np.int64))
+            result = [0] * len(xs)
+            for k in range(len(coeffs) - 1, 0, -1):
+                carry = carry * points + field.element(coeffs[k])
+                result[k - 1] = (carry * scales).sum().value
+            return cls._from_coeffs(field, result)
+        result = [0] * len(xs)
+        for x, y, w in zip(xs, ys, weights):
+            scale = mul(y.value, w.value)
+            if not scale:
+                continue
+            # División sintética de M(x) entre (x - xs[i])
+            carry = 0
+            for k in range(len(coeffs) - 1, 0, -1):
+                carry = coeffs[k] ^ mul(carry, x.value)
+                result[k - 1] ^= mul(carry, scale)
+        return cls._from_coeffs(field, result)
+
+    @classmethod
+    def _interpolate_newton(cls, field, xs, ys):
+        mul = field._mul
+        values = [x.value for x in xs]
+        table = [y.value for y in ys]
+        divided = [table[0]]
+        for level in range(1, len(values)):
+            denominators = [field.element(values[i + level] ^ values[i]) for i in range(len(table) - 1)]
+            inverses = field.batch_inverse(denominators)
+            table = [mul(table[i + 1] ^ table[i], inverses[i].value) for i in range(len(table) - 1)]
+            divided.append(table[0])
+        # Forma de Newton evaluada con Horner sobre polinomios
+        result = cls._from_coeffs(field, [divided[-1]])
+        for k in range(len(values) - 2, -1, -1):
+            result = result * cls._from_coeffs(field, [values[k], 1]) + cls._from_coeffs(field, [divided[k]])
+        return result
+
+    def __eq__(self, other):
+        if not isinstance(other, GFPolynomial):
+            return False
+        return self.coeffs == other.coeffs and (self.field is other.field or self.field == other.field)
+
+    def __hash__(self):
+        return hash((self.field, self.coeffs))
+
+    def __repr__(self):
+        if not self.coeffs:
+            return "GFPolynomial(0)"
+        terms = []
+        for i in range(len(self.coeffs) - 1, -1, -1):
+            c = self.coeffs[i]
+            if c:
+                power = "" if i == 0 else ("y" if i == 1 else f"y^{i}")
+                coefficient = hex(c) if c != 1 or i == 0 else ""
+                terms.append("*".join(t for t in (coefficient, power) if t))
+        return f"GFPolynomial({' + '.join(terms)})"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,118 @@
+"""
+Tablas completas de productos e inversos para campos GF(2^n) con n <= 8,
+en memoria u opcionalmente guardadas en disco y cargadas con mmap.
+
+Para n = 8 la tabla de productos ocupa 256 x 256 = 64 KB y la de inversos
+256 bytes. Por defecto las tablas se construyen en memoria. Si se define la
+variable de entorno GF_TABLE_DIR (o se llama a use_table_dir), se guardan en
+ese directorio: cada archivo contiene un encabezado de HEADER_SIZE bytes
+seguido de la tabla de productos (mul[(a << n) | b] = a * b) y la de inversos
+(inverse[a] = a^-1, con inverse[0] = 0). Los archivos se abren en modo de solo
+lectura con mmap, así que varios procesos en la misma máquina comparten las
+mismas páginas de la caché del sistema operativo en lugar de construir cada
+uno sus propias tablas.
+"""
+import mmap
+import os
+import struct
+
+# Directorio que usa use_table_dir si no se indica otro
+DEFAULT_TABLE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cripto-tareas", "tablas")
+
+# Directorio donde se guardan las tablas; con None solo se construyen en memoria
+TABLE_DIR = os.environ.get("GF_TABLE_DIR") or None
+
+# Encabezado: firma, versión, grado y polinomio irreducible
+_HEADER = struct.Struct("<4sBBI6x")
+_MAGIC = b"GFTB"
+_VERSION = 1
+HEADER_SIZE = _HEADER.size
+
+# Tablas ya cargadas en este proceso, indexadas por (grado, polinomio irreducible)
+_LOADED = {}
+
+
+def use_table_dir(path=DEFAULT_TABLE_DIR):
+    """
+    Guarda en 'path' las tablas que se construyan de aquí en adelante (con
+    None, vuelve a dejarlas solo en memoria).
+    """
+    global TABLE_DIR
+    TABLE_DIR = path
+
+
+def table_path(degree, irreducible_poly):
+    """Ruta del archivo de tablas de un campo."""
+    return os.path.join(TABLE_DIR, f"gf2_{degree}_{irreducible_poly:x}.bin")
+
+
+def _split(buffer, degree):
+    """Separa un búfer completo en vistas (sin copias) de las tablas de productos e inversos."""
+    order = 1 << degree
+    view = memoryview(buffer)
+    return (view[HEADER_SIZE:HEADER_SIZE + order * order],
+            view[HEADER_SIZE + order * order:HEADER_SIZE + order * order + order])
+
+
+def _load(path, degree, irreducible_poly):
+    """Abre un archivo de tablas con mmap; devuelve None si no existe o no es válido."""
+    order = 1 << degree
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size != HEADER_SIZE + order * order + order:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if _HEADER.unpack_from(mapped) != (_MAGIC, _VERSION, degree, irreducible_poly):
+        mapped.close()
+        return None
+    return mapped
+
+
+def _save(path, data):
+    """Escribe el archivo de forma atómica; devuelve False si no se pudo escribir."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_full_tables(degree, irreducible_poly, mul, inverse):
+    """
+    Devuelve las tablas completas (productos, inversos) del campo como
+    memoryview de solo lectura.
+
+    Las tablas se construyen con las funciones 'mul' e 'inverse' sobre enteros
+    del campo. Si TABLE_DIR no es None, primero se buscan en su archivo y, si
+    no existe, se guardan ahí; si no se puede escribir en TABLE_DIR, las
+    tablas se quedan en memoria.
+
+    :param mul: Función (a, b) -> a * b.
+    :param inverse: Función a -> a^-1 para a distinto de cero.
+    :return: Tupla (mul_table, inverse_table) de memoryview de bytes.
+    """
+    key = (degree, irreducible_poly)
+    if key in _LOADED:
+        return _LOADED[key]
+    if degree > 8:
+        raise ValueError("Las tablas completas solo están disponibles para campos de grado a lo más 8.")
+    path = table_path(degree, irreducible_poly) if TABLE_DIR is not None else None
+    buffer = _load(path, degree, irreducible_poly) if path is not None else None
+    if buffer is None:
+        order = 1 << degree
+        data = bytearray(_HEADER.pack(_MAGIC, _VERSION, degree, irreducible_poly))
+        for a in range(order):
+            data += bytes(mul(a, b) for b in range(order))
+        data += bytes([0] + [inverse(a) for a in range(1, order)])
+        if path is not None and _save(path, data):
+            buffer = _load(path, degree, irreducible_poly)
+        if buffer is None:
+            buffer = bytes(data)
+    _LOADED[key] = _split(buffer, degree)
+    return _LOADED[key]
@@ -0,0 +1,374 @@
+"""
+Polinomios sobre GF(2): pruebas de irreducibilidad y primitividad, y búsqueda
+del polinomio irreducible o primitivo de menor peso para un grado dado.
+
+Los polinomios se representan como enteros: el bit i es el coeficiente de x^i.
+Por ejemplo, x^3 + x + 1 se representa como 0b1011 (11).
+
+Los resultados de las búsquedas y las factorizaciones de 2^n - 1 se guardan en
+un archivo JSON (ver POLY_CACHE_PATH) para que las consultas repetidas sean
+instantáneas.
+"""
+import json
+import math
+import os
+import random
+from functools import lru_cache
+
+# Archivo donde se guardan los polinomios encontrados y las factorizaciones
+POLY_CACHE_PATH = os.environ.get(
+    "GF_POLY_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "cripto-tareas", "polinomios.json"),
+)
+
+# Número máximo de iteraciones de Pollard rho por factor antes de rendirse
+POLLARD_MAX_ITERATIONS = 2_000_000
+
+# Cada byte con sus bits intercalados con ceros (cuadrado de un polinomio de grado < 8)
+_SPREAD = [sum(((b >> i) & 1) << (2 * i) for i in range(8)).to_bytes(2, "big") for b in range(256)]
+
+_SMALL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, int(p ** 0.5) + 1))]
+
+_cache = None
+
+
+# ---------------------------------------------------------------------------
+# Aritmética en GF(2)[x]
+# ---------------------------------------------------------------------------
+
+def poly_square(a):
+    """Cuadrado de un polinomio: intercala ceros entre sus bits."""
+    if a < 256:
+        return int.from_bytes(_SPREAD[a], "big")
+    data = a.to_bytes((a.bit_length() + 7) // 8, "big")
+    return int.from_bytes(b"".join([_SPREAD[b] for b in data]), "big")
+
+
+def poly_mul(a, b):
+    """Producto de dos polinomios sin reducir."""
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    return result
+
+
+def poly_mod(a, m):
+    """Residuo de a entre m."""
+    degree = m.bit_length()
+    terms = sparse_terms(m)
+    if terms is not None:
+        # Módulo disperso: pliega la parte alta sobre la baja
+        n = degree - 1
+        mask = (1 << n) - 1
+        while a >> n:
+            high = a >> n
+            a &= mask
+            for k in terms:
+                a ^= high << k
+        return a
+    while a.bit_length() >= degree:
+        a ^= m << (a.bit_length() - degree)
+    return a
+
+
+def poly_divmod(a, b):
+    """Cociente y residuo de a entre b."""
+    if b == 0:
+        raise ZeroDivisionError("División entre el polinomio cero.")
+    quotient = 0
+    degree = b.bit_length()
+    while a.bit_length() >= degree:
+        shift = a.bit_length() - degree
+        quotient |= 1 << shift
+        a ^= b << shift
+    return quotient, a
+
+
+def poly_gcd(a, b):
+    """Máximo común divisor de dos polinomios."""
+    while b:
+        a, b = b, poly_divmod(a, b)[1]
+    return a
+
+
+def poly_powmod(a, exponent, m):
+    """Calcula a^exponent mod m."""
+    result = 1
+    a = poly_mod(a, m)
+    for bit in bin(exponent)[2:]:
+        result = poly_mod(poly_square(result), m)
+        if bit == "1":
+            result = poly_mod(poly_mul(result, a), m)
+    return poly_mod(result, m)
+
+
+def sparse_terms(m):
+    """Exponentes de los términos de grado menor al de m si es trinomio o pentanomio."""
+    if bin(m).count("1") not in (3, 5):
+        return None
+    return tuple(k for k in range(m.bit_length() - 1) if (m >> k) & 1)
+
+
+# ---------------------------------------------------------------------------
+# Irreducibilidad y primitividad
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1024)
+def is_irreducible(poly):
+    """
+    Prueba de irreducibilidad de Ben-Or sobre GF(2).
+
+    f de grado n es irreducible si y solo si gcd(x^(2^i) - x, f) = 1 para
+    i = 1, ..., n/2. La mayoría de los polinomios reducibles tienen un factor
+    pequeño, así que se descartan en las primeras iteraciones.
+
+    :param poly: Polinomio representado como entero.
+    :return: True si el polinomio es irreducible.
+    """
+    degree = poly.bit_length() - 1
+    if degree <= 0:
+        return False
+    if degree == 1:
+        return True
+    if not poly & 1:
+        return False  # Divisible entre x
+    h = 0b10  # x
+    for _ in range(degree // 2):
+        h = poly_mod(poly_square(h), poly)
+        if poly_gcd(poly, h ^ 0b10) != 1:
+            return False
+    return True
+
+
+def is_primitive(poly):
+    """
+    Indica si el polinomio es primitivo: irreducible y con x de orden 2^n - 1.
+
+    Usa la factorización de 2^n - 1: x es generador si x^((2^n - 1)/q) != 1
+    para cada primo q que divide a 2^n - 1.
+
+    :param poly: Polinomio representado como entero.
+    :return: True si el polinomio es primitivo.
+    :raises ValueError: Si no se logra factorizar 2^n - 1.
+    """
+    if not is_irreducible(poly):
+        return False
+    degree = poly.bit_length() - 1
+    group_order = (1 << degree) - 1
+    if degree == 1:
+        return poly == 0b11
+    for q in mersenne_factors(degree):
+        if poly_powmod(0b10, group_order // q, poly) == 1:
+            return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Factorización de 2^n - 1
+# ---------------------------------------------------------------------------
+
+def _is_probable_prime(n):
+    """Prueba de primalidad de Miller-Rabin (determinista para n < 3.3e24)."""
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES[:25]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n):
+    """Encuentra un factor no trivial de n compuesto con el método rho de Brent."""
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        iterations = 0
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+            iterations += r
+            if iterations > POLLARD_MAX_ITERATIONS:
+                raise ValueError(f"No se pudo factorizar {n}.")
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _factor(n, factors):
+    """Agrega a 'factors' los factores primos de n."""
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors.add(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if _is_probable_prime(m):
+            factors.add(m)
+            continue
+        d = _pollard_brent(m)
+        stack.extend((d, m // d))
+
+
+def _cyclotomic_at_2(d):
+    """Evalúa el polinomio ciclotómico Φ_d en 2."""
+    numerator, denominator = 1, 1
+    for e in range(1, d + 1):
+        if d % e:
+            continue
+        mu = _mobius(d // e)
+        if mu == 1:
+            numerator *= (1 << e) - 1
+        elif mu == -1:
+            denominator *= (1 << e) - 1
+    return numerator // denominator
+
+
+def _mobius(n):
+    """Función de Möbius."""
+    result, p = 1, 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def mersenne_factors(degree):
+    """
+    Devuelve los factores primos distintos de 2^degree - 1, en orden creciente.
+
+    Descompone 2^n - 1 como el producto de Φ_d(2) para d que divide a n y
+    factoriza cada parte por separado. El resultado se guarda en la caché.
+
+    :raises ValueError: Si algún factor no se logra separar.
+    """
+    key = f"factors:{degree}"
+    cache = _load_cache()
+    if key not in cache:
+        factors = set()
+        for d in range(1, degree + 1):
+            if degree % d == 0:
+                _factor(_cyclotomic_at_2(d), factors)
+        cache[key] = sorted(factors)
+        _save_cache()
+    return cache[key]
+
+
+# ---------------------------------------------------------------------------
+# Búsqueda de polinomios de menor peso
+# ---------------------------------------------------------------------------
+
+def _low_weight_candidates(degree):
+    """Genera x^n + 1 (solo n = 1), trinomios y pentanomios en orden de peso y exponentes."""
+    top = (1 << degree) | 1
+    if degree == 1:
+        yield top
+        return
+    for k in range(1, degree):
+        yield top | (1 << k)
+    for a in range(3, degree):
+        for b in range(2, a):
+            for c in range(1, b):
+                yield top | (1 << a) | (1 << b) | (1 << c)
+
+
+def _search(degree, kind, test):
+    if degree <= 0:
+        raise ValueError("El grado del campo debe ser un entero positivo.")
+    key = f"{kind}:{degree}"
+    cache = _load_cache()
+    if key not in cache:
+        for candidate in _low_weight_candidates(degree):
+            if test(candidate):
+                cache[key] = candidate
+                break
+        else:
+            raise ValueError(f"No se encontró un polinomio {kind} de grado {degree} con peso a lo más 5.")
+        _save_cache()
+    return cache[key]
+
+
+def find_irreducible(degree):
+    """
+    Busca el polinomio irreducible de menor peso de grado 'degree'.
+
+    Entre los de igual peso elige el de exponentes intermedios más pequeños.
+
+    :return: Polinomio irreducible representado como entero.
+    """
+    return _search(degree, "irreducible", is_irreducible)
+
+
+def find_primitive(degree):
+    """
+    Busca el polinomio primitivo de menor peso de grado 'degree'.
+
+    :return: Polinomio primitivo representado como entero.
+    :raises ValueError: Si no se logra factorizar 2^degree - 1.
+    """
+    return _search(degree, "primitive", is_primitive)
+
+
+# ---------------------------------------------------------------------------
+# Caché en disco
+# ---------------------------------------------------------------------------
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            with open(POLY_CACHE_PATH, "r", encoding="utf-8") as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache():
+    """Escribe la caché de forma atómica; los errores de escritura se ignoran."""
+    try:
+        os.makedirs(os.path.dirname(POLY_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{POLY_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_cache, f)
+        os.replace(tmp_path, POLY_CACHE_PATH)
+    except OSError:
+        pass
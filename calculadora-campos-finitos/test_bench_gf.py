@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+import bench_gf
+from bench_gf import bench_suite_case, compare_with_baseline, load_baseline, save_baseline
+from gf import GF
+
+
+class TestRegressionSuite(unittest.TestCase):
+    def setUp(self):
+        self.old_budget = bench_gf.CASE_TIME_BUDGET
+        bench_gf.CASE_TIME_BUDGET = 0.001  # Mediciones cortas: solo se prueba la mecánica
+
+    def tearDown(self):
+        bench_gf.CASE_TIME_BUDGET = self.old_budget
+
+    def test_case_measurement(self):
+        for degree, workload in ((8, "elemento"), (64, "elemento"), (8, "arreglo")):
+            for operation in bench_gf.SUITE_OPERATIONS:
+                result = bench_suite_case(GF(degree), operation, workload, 50, repeat=1)
+                self.assertGreater(result["ops_per_sec"], 0, f"{operation} debe medir ops/s.")
+                self.assertGreater(result["relative"], 0, f"{operation} debe medir el rendimiento relativo.")
+                self.assertGreaterEqual(result["allocs_per_op"], 0, "Las reservas no pueden ser negativas.")
+
+    def test_compare_with_baseline(self):
+        baseline = {"a": {"relative": 1.0, "allocs_per_op": 0.0},
+                    "b": {"relative": 1.0, "allocs_per_op": 2.0}}
+        same = {"a": {"relative": 0.9, "allocs_per_op": 0.0},
+                "b": {"relative": 1.2, "allocs_per_op": 2.0},
+                "nuevo": {"relative": 0.1, "allocs_per_op": 9.0}}
+        self.assertEqual(compare_with_baseline(same, baseline, 0.25), [],
+                         "Variaciones dentro del umbral y casos nuevos no son regresiones.")
+        worse = {"a": {"relative": 0.5, "allocs_per_op": 0.0},
+                 "b": {"relative": 1.0, "allocs_per_op": 4.0}}
+        regressions = compare_with_baseline(worse, baseline, 0.25)
+        self.assertEqual([(key, metric) for key, _, _, metric in regressions],
+                         [("a", "ops/calibración"), ("b", "reservas/op")],
+                         "Deben detectarse la caída de rendimiento y el aumento de reservas.")
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "base.json")
+            self.assertIsNone(load_baseline(path), "Una línea base inexistente debe dar None.")
+            results = {"GF(2^8)/elemento/suma": {"ops_per_sec": 1.0, "relative": 0.5, "allocs_per_op": 0.0}}
+            save_baseline(path, results, 100)
+            self.assertEqual(load_baseline(path)["resultados"], results, "La línea base no se guardó bien.")
+
+
+if __name__ == '__main__':
+    unittest.main()
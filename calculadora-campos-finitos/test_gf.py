@@ -1,4 +1,8 @@
+import random
 import unittest
+from unittest import mock
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+import gf
 from gf import GF, GFElement
 
 class TestGFOperations(unittest.TestCase):
@@ -177,5 +181,306 @@ class TestGFOperations(unittest.TestCase):
         expected = 0b110000  # 48
         self.assertEqual(result.value, expected, "Exponenciación grande en GF(64) falló.")
 
+class TestGFTables(unittest.TestCase):
+    def setUp(self):
+        # GF(2^8) con el polinomio de AES: x^8 + x^4 + x^3 + x + 1
+        self.gf256 = GF(8, 0b100011011)
+        # Campos con 9 <= n <= 16 usan las tablas exp/log en lugar de las tablas completas
+        self.gf65536 = GF(16, 0x1100B)  # x^16 + x^12 + x^3 + x + 1
+        self.gf4096 = GF(12, 0x1053)    # x^12 + x^6 + x^4 + x + 1
+
+    def test_exp_log_fields_use_exp_log_tables(self):
+        for field in (self.gf4096, self.gf65536):
+            self.assertIsNotNone(field.tables(), f"GF(2^{field.degree}) debe tener tablas exp/log.")
+            self.assertIsNone(field.full_tables(), f"GF(2^{field.degree}) no debe tener tablas completas.")
+
+    def test_tables_match_bitwise(self):
+        for field in (self.gf4096, self.gf65536):
+            for a in range(0, field.order, field.order // 61):
+                for b in range(0, field.order, field.order // 67):
+                    self.assertEqual(field._mul(a, b), field._mul_bitwise(a, b),
+                                     f"Producto por tablas distinto en GF(2^{field.degree}) para {a} * {b}.")
+
+    def test_division_matches_bitwise(self):
+        for field in (self.gf4096, self.gf65536):
+            for a in range(0, field.order, field.order // 61):
+                for b in range(1, field.order, field.order // 67):
+                    self.assertEqual(field._div(a, b), field._mul_bitwise(a, field._inverse_bitwise(b)),
+                                     f"División por tablas distinta en GF(2^{field.degree}) para {a} / {b}.")
+
+    def test_inverse_matches_bitwise(self):
+        for field in (self.gf4096, self.gf65536):
+            for a in range(1, field.order, field.order // 509):
+                inverse = field._inverse(a)
+                self.assertEqual(inverse, field._inverse_bitwise(a),
+                                 f"Inverso por tablas incorrecto en GF(2^{field.degree}).")
+                self.assertEqual(field._mul(a, inverse), 1, "a * a^-1 debe ser 1.")
+
+    def test_tables_match_bitwise_gf256(self):
+        for a in range(0, 256, 7):
+            for b in range(256):
+                self.assertEqual(self.gf256._mul(a, b), self.gf256._mul_bitwise(a, b),
+                                 f"Producto por tablas distinto en GF(256) para {a} * {b}.")
+
+    def test_inverse_gf256(self):
+        for a in range(1, 256):
+            inverse = self.gf256._inverse(a)
+            self.assertEqual(inverse, self.gf256._inverse_bitwise(a), "Inverso por tablas incorrecto.")
+            self.assertEqual(self.gf256._mul(a, inverse), 1, "a * a^-1 debe ser 1 en GF(256).")
+
+    def test_aes_known_product(self):
+        # Ejemplo del estándar AES: {57} * {83} = {c1}
+        result = self.gf256.element(0x57) * self.gf256.element(0x83)
+        self.assertEqual(result.value, 0xc1, "Producto de AES en GF(256) incorrecto.")
+
+    def test_division_and_power_gf256(self):
+        a = self.gf256.element(0x53)
+        b = self.gf256.element(0xca)
+        self.assertEqual((a / b) * b, a, "División por tablas en GF(256) incorrecta.")
+        self.assertEqual((a ** 255).value, 1, "a^(2^8 - 1) debe ser 1 en GF(256).")
+        self.assertEqual((a ** -3) * (a ** 3), self.gf256.element(1), "Potencia negativa incorrecta.")
+
+    def test_tables_shared_between_instances(self):
+        other = GF(8, 0b100011011)
+        self.assertIs(self.gf256.tables(), other.tables(), "Las tablas deben compartirse por campo.")
+
+    def test_large_field_falls_back_to_bitwise(self):
+        gf = GF(20, (1 << 20) | 0b1001)  # x^20 + x^3 + 1
+        self.assertIsNone(gf.tables(), "Un campo grande no debe tabularse.")
+        a = gf.element(0x12345)
+        self.assertEqual((a / a).value, 1, "La ruta bit a bit debe seguir funcionando.")
+
+    def test_zero_power(self):
+        zero = self.gf256.element(0)
+        self.assertEqual((zero ** 0).value, 1, "0^0 debe ser 1.")
+        self.assertEqual((zero ** 5).value, 0, "0^5 debe ser 0.")
+        with self.assertRaises(ZeroDivisionError):
+            _ = zero ** -1
+
+class TestGFElementRepresentation(unittest.TestCase):
+    def setUp(self):
+        self.gf8 = GF(3, 0b1011)
+
+    def test_elements_are_immutable(self):
+        a = self.gf8.element(0b101)
+        with self.assertRaises(AttributeError):
+            a.value = 0b001
+        with self.assertRaises(AttributeError):
+            a.extra = 1
+
+    def test_interned_elements(self):
+        a = self.gf8.element(0b011) * self.gf8.element(0b001)
+        self.assertIs(a, self.gf8.element(0b011), "Los elementos de campos pequeños deben reutilizarse.")
+        other = GF(3, 0b1011, intern_elements=False)
+        self.assertIsNot(other.element(3), other.element(3), "Sin flyweight se crean instancias nuevas.")
+        self.assertEqual(other.element(3), self.gf8.element(3), "La igualdad no depende de la identidad.")
+
+    def test_hash(self):
+        a = self.gf8.element(0b110)
+        b = GF(3, 0b1011, intern_elements=False).element(0b110)
+        self.assertEqual(len({a, b}), 1, "Elementos iguales deben tener el mismo hash.")
+
+class TestGFLargeDegree(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.fields = [
+            GF(128, (1 << 128) | 0b10000111),          # GHASH: x^128 + x^7 + x^2 + x + 1
+            GF(163, (1 << 163) | 0b11001001),          # NIST B-163: x^163 + x^7 + x^6 + x^3 + 1
+            GF(233, (1 << 233) | (1 << 74) | 1),       # NIST B-233: x^233 + x^74 + 1
+        ]
+
+    def test_sparse_moduli_detected(self):
+        self.assertEqual(self.fields[0]._sparse_terms, (0, 1, 2, 7), "Pentanomio no detectado.")
+        self.assertEqual(self.fields[2]._sparse_terms, (0, 74), "Trinomio no detectado.")
+        self.assertIsNone(GF(8, 0b111110101)._sparse_terms, "Un módulo denso no es disperso.")
+
+    def test_windowed_matches_bitwise(self):
+        for field in self.fields:
+            for _ in range(50):
+                a = random.getrandbits(field.degree)
+                b = random.getrandbits(field.degree)
+                self.assertEqual(field._mul(a, b), field._mul_bitwise(a, b),
+                                 f"Multiplicación con ventana incorrecta en GF(2^{field.degree}).")
+
+    def test_inverse_and_division(self):
+        for field in self.fields:
+            a = field.element(random.getrandbits(field.degree) | 1)
+            b = field.element(random.getrandbits(field.degree) | 1)
+            self.assertEqual((a ** -1) * a, field.element(1), f"Inverso incorrecto en GF(2^{field.degree}).")
+            self.assertEqual((a / b) * b, a, f"División incorrecta en GF(2^{field.degree}).")
+
+    def test_group_order(self):
+        for field in self.fields:
+            a = field.element(random.getrandbits(field.degree) | 1)
+            self.assertEqual((a ** (field.order - 1)).value, 1,
+                             f"a^(2^n - 1) debe ser 1 en GF(2^{field.degree}).")
+
+class TestBatchInverse(unittest.TestCase):
+    def test_batch_inverse(self):
+        random.seed(2)
+        for field in (GF(3, 0b1011), GF(8), GF(32), GF(163)):
+            elements = [field.element(random.randrange(1, field.order)) for _ in range(40)]
+            inverses = field.batch_inverse(elements)
+            for a, inverse in zip(elements, inverses):
+                self.assertEqual(a * inverse, field.element(1),
+                                 f"Inverso por lotes incorrecto en GF(2^{field.degree}).")
+
+    def test_batch_inverse_zeros(self):
+        field = GF(64)
+        elements = [field.element(0), field.element(5), field.element(0), field.element(7)]
+        with self.assertRaises(ZeroDivisionError):
+            field.batch_inverse(elements)
+        inverses = field.batch_inverse(elements, skip_zeros=True)
+        self.assertEqual([inverses[0].value, inverses[2].value], [0, 0], "Los ceros deben quedar en cero.")
+        self.assertEqual(inverses[1], field.element(1) / field.element(5), "Inverso junto a ceros incorrecto.")
+        self.assertEqual(inverses[3], field.element(1) / field.element(7), "Inverso junto a ceros incorrecto.")
+        self.assertEqual(field.batch_inverse([]), [], "La lista vacía debe dar una lista vacía.")
+
+class TestOrderAndLog(unittest.TestCase):
+    def test_order_small_field(self):
+        gf16 = GF(4, 0b10011)
+        for value in range(1, 16):
+            a = gf16.element(value)
+            k, power = 1, a
+            while power.value != 1:
+                power = power * a
+                k += 1
+            self.assertEqual(a.order(), k, f"Orden incorrecto para {value} en GF(16).")
+        with self.assertRaises(ValueError):
+            gf16.element(0).order()
+
+    def test_order_large_field(self):
+        field = GF(64)
+        a = field.element(0x123456789abcdef)
+        order = a.order()
+        self.assertEqual((a ** order).value, 1, "a^orden debe ser 1.")
+        self.assertEqual((field.order - 1) % order, 0, "El orden debe dividir a 2^n - 1.")
+
+    def test_log(self):
+        random.seed(3)
+        for field in (GF(8), GF(20), GF(48)):
+            base = field.element(random.randrange(2, field.order))
+            for _ in range(5):
+                x = random.randrange(field.order)
+                a = base ** x
+                log = a.log(base)
+                self.assertEqual(base ** log, a, f"Logaritmo incorrecto en GF(2^{field.degree}).")
+                self.assertEqual(log, x % base.order(), "El logaritmo debe ser el menor exponente.")
+
+    def test_bsgs_tables_are_evicted(self):
+        # GF(2^48) no tiene tablas exp/log, así que cada base construye sus tablas de pasos pequeños
+        field = GF(48)
+        random.seed(7)
+        bases = [field.element(random.randrange(2, field.order)) for _ in range(6)]
+        with mock.patch.object(gf, "BSGS_CACHE_ENTRIES", 200):
+            first_key = None
+            for base in bases:
+                x = random.randrange(field.order)
+                self.assertEqual(base ** (base ** x).log(base), base ** x, "Logaritmo incorrecto.")
+                if first_key is None:
+                    # La tabla más grande de la primera base (las de primos chicos se comparten)
+                    first_key = max(field._bsgs_tables, key=lambda key: key[1])
+                self.assertLessEqual(field._bsgs_entries, 200, "Las tablas deben respetar el límite de entradas.")
+                self.assertEqual(field._bsgs_entries, sum(len(t[0]) for t in field._bsgs_tables.values()))
+            self.assertNotIn(first_key, field._bsgs_tables, "Las tablas de la primera base deben desalojarse.")
+            # La primera base reconstruye sus tablas al volver a usarse
+            self.assertEqual((bases[0] ** 12345).log(bases[0]), 12345 % bases[0].order())
+
+    def test_log_not_a_power(self):
+        field = GF(20)
+        # 2^20 - 1 = 3 * 5^2 * 11 * 31 * 41; un cubo no genera a un no cubo
+        base = field.element(0b10) ** 3
+        with self.assertRaises(ValueError):
+            field.element(0b10).log(base)
+
+class TestLinearMaps(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        # Grados pares e impares, con y sin tablas
+        self.fields = [GF(1), GF(4), GF(7), GF(8), GF(16), GF(64), GF(163), GF(233)]
+
+    def random_elements(self, field, count=10):
+        return [field.element(random.randrange(field.order)) for _ in range(count)] + [field.element(0)]
+
+    def test_square_and_sqrt(self):
+        for field in self.fields:
+            for a in self.random_elements(field):
+                self.assertEqual(a.square(), a * a, f"Cuadrado incorrecto en GF(2^{field.degree}).")
+                self.assertEqual(a.sqrt().square(), a, f"Raíz cuadrada incorrecta en GF(2^{field.degree}).")
+
+    def test_frobenius(self):
+        for field in self.fields:
+            a = self.random_elements(field)[0]
+            for k in (0, 1, 2, field.degree - 1, field.degree, 2 * field.degree + 3):
+                self.assertEqual(a.frobenius(k), a ** (2 ** k), f"Frobenius {k} incorrecto en GF(2^{field.degree}).")
+
+    def test_trace(self):
+        for field in self.fields:
+            for a in self.random_elements(field, 5):
+                expected, power = a, a
+                for _ in range(field.degree - 1):
+                    power = power * power
+                    expected = expected + power
+                self.assertIn(expected.value, (0, 1), "La traza debe estar en GF(2).")
+                self.assertEqual(a.trace(), expected.value, f"Traza incorrecta en GF(2^{field.degree}).")
+
+    def test_half_trace(self):
+        for field in self.fields:
+            if field.degree % 2 == 0:
+                with self.assertRaises(ValueError):
+                    field.element(1).half_trace()
+                continue
+            for a in self.random_elements(field):
+                h = a.half_trace()
+                self.assertEqual(h * h + h, a + field.element(a.trace()),
+                                 f"Semitraza incorrecta en GF(2^{field.degree}).")
+
+    def test_solve_quadratic(self):
+        for field in self.fields:
+            for c in self.random_elements(field, 20):
+                if c.trace():
+                    with self.assertRaises(ValueError):
+                        c.solve_quadratic()
+                else:
+                    z = c.solve_quadratic()
+                    self.assertEqual(z * z + z, c, f"z^2 + z = c mal resuelta en GF(2^{field.degree}).")
+
+
+class TestFixedBase(unittest.TestCase):
+    def test_matches_pow(self):
+        random.seed(11)
+        for field in (GF(8), GF(16), GF(32), GF(64), GF(163)):
+            g = field.element(random.randrange(2, field.order))
+            fixed = field.fixed_base(g)
+            exponents = [0, 1, -1, field.order - 1, -field.order, 10 ** 60, -10 ** 40]
+            exponents += [random.randrange(-field.order, field.order) for _ in range(20)]
+            for e in exponents:
+                self.assertEqual(fixed.pow(e), g ** e, f"g^{e} incorrecto en GF(2^{field.degree}).")
+            self.assertEqual(field.fixed_base(g, window=3).pow(12345), g ** 12345, "Ventana de 3 bits incorrecta.")
+
+    def test_negative_exponents(self):
+        field = GF(64)
+        a = field.element(0x1234)
+        self.assertEqual(a ** -1 * a, field.element(1), "a^-1 debe ser el inverso.")
+        self.assertEqual(a ** -5, (a ** 5) ** -1, "a^-5 debe ser el inverso de a^5.")
+        self.assertEqual(field.element(0) ** 0, field.element(1), "0^0 se define como 1.")
+        with self.assertRaises(ZeroDivisionError):
+            field.element(0) ** -1
+        with self.assertRaises(ZeroDivisionError):
+            field.fixed_base(field.element(0)).pow(-3)
+
+    def test_lru_cache(self):
+        import gf as gf_module
+        field = GF(32)
+        bases = [field.element(v) for v in range(2, 2 + gf_module.FIXED_BASE_CACHE_SIZE + 1)]
+        first = field.fixed_base(bases[0])
+        self.assertIs(field.fixed_base(bases[0]), first, "Una base repetida debe reutilizar su tabla.")
+        for base in bases[1:]:
+            field.fixed_base(base)
+        self.assertEqual(len(field._fixed_bases), gf_module.FIXED_BASE_CACHE_SIZE,
+                         "El número de bases en caché debe estar acotado.")
+        self.assertIsNot(field.fixed_base(bases[0]), first, "La base menos usada debe desalojarse.")
+
+
 if __name__ == '__main__':
     unittest.main()
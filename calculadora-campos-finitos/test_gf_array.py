@@ -0,0 +1,99 @@
+import importlib.util
+import random
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+from gf import GF
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+@unittest.skipUnless(HAS_NUMPY, "GFArray requiere NumPy.")
+class TestGFArray(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.gf256 = GF(8, 0b100011011)          # GF(2^8), tablas exp/log
+        self.gf2_20 = GF(20, (1 << 20) | 0b1001)  # GF(2^20), multiplicación sin acarreo
+        self.fields = [self.gf256, self.gf2_20]
+
+    def random_values(self, field, n, nonzero=False):
+        low = 1 if nonzero else 0
+        return [random.randrange(low, field.order) for _ in range(n)]
+
+    def test_dtype(self):
+        self.assertEqual(self.gf256.array([1, 2]).values.dtype.itemsize, 1, "GF(2^8) debe usar uint8.")
+        self.assertEqual(self.gf2_20.array([1, 2]).values.dtype.itemsize, 4, "GF(2^20) debe usar uint32.")
+
+    def test_elementwise_operations_match_scalars(self):
+        for field in self.fields:
+            xs = self.random_values(field, 50)
+            ys = self.random_values(field, 50, nonzero=True)
+            a, b = field.array(xs), field.array(ys)
+            for op in ("__add__", "__sub__", "__mul__", "__truediv__"):
+                expected = [getattr(field.element(x), op)(field.element(y)).value for x, y in zip(xs, ys)]
+                self.assertEqual(getattr(a, op)(b).values.tolist(), expected,
+                                 f"{op} de GFArray no coincide con GFElement en GF(2^{field.degree}).")
+
+    def test_power(self):
+        for field in self.fields:
+            xs = self.random_values(field, 30) + [0]
+            a = field.array(xs)
+            for exponent in (0, 1, 5, field.order - 1, 3 * field.order):
+                expected = [(field.element(x) ** exponent).value for x in xs]
+                self.assertEqual((a ** exponent).values.tolist(), expected,
+                                 f"Potencia {exponent} incorrecta en GF(2^{field.degree}).")
+            nonzero = field.array(self.random_values(field, 30, nonzero=True))
+            self.assertTrue(((nonzero ** -1) * nonzero == field.element(1)).all(),
+                            "a^-1 * a debe ser 1.")
+
+    def test_reductions(self):
+        for field in self.fields:
+            xs = self.random_values(field, 40, nonzero=True)
+            ys = self.random_values(field, 40)
+            a, b = field.array(xs), field.array(ys)
+            expected_sum = field.element(0)
+            expected_prod = field.element(1)
+            expected_dot = field.element(0)
+            for x, y in zip(xs, ys):
+                expected_sum = expected_sum + field.element(x)
+                expected_prod = expected_prod * field.element(x)
+                expected_dot = expected_dot + field.element(x) * field.element(y)
+            self.assertEqual(a.sum(), expected_sum, "sum incorrecta.")
+            self.assertEqual(a.prod(), expected_prod, "prod incorrecto.")
+            self.assertEqual(a.dot(b), expected_dot, "dot incorrecto.")
+            self.assertEqual(field.array([3, 0, 5]).prod().value, 0, "Un cero anula el producto.")
+
+    def test_batch_inverse(self):
+        for field in self.fields:
+            xs = self.random_values(field, 37)
+            inverses = field.array(xs).batch_inverse(skip_zeros=True)
+            expected = [(field.element(1) / field.element(x)).value if x else 0 for x in xs]
+            self.assertEqual(inverses.values.tolist(), expected,
+                             f"batch_inverse incorrecto en GF(2^{field.degree}).")
+        with self.assertRaises(ZeroDivisionError):
+            self.gf2_20.array([3, 0]).batch_inverse()
+
+    def test_scalar_broadcasting(self):
+        xs = self.random_values(self.gf256, 20)
+        a = self.gf256.array(xs)
+        c = self.gf256.element(0x53)
+        self.assertEqual((c * a).values.tolist(), [(c * self.gf256.element(x)).value for x in xs],
+                         "La difusión de un GFElement por la izquierda falló.")
+        self.assertEqual((a + c).values.tolist(), [x ^ 0x53 for x in xs],
+                         "La difusión de un GFElement por la derecha falló.")
+
+    def test_indexing(self):
+        a = self.gf256.array([1, 2, 3, 4])
+        self.assertEqual(a[2], self.gf256.element(3), "Un índice escalar debe devolver GFElement.")
+        self.assertEqual(a[1:3].values.tolist(), [2, 3], "Una rebanada debe devolver GFArray.")
+
+    def test_errors(self):
+        a = self.gf256.array([1, 2])
+        with self.assertRaises(ZeroDivisionError):
+            _ = a / self.gf256.array([1, 0])
+        with self.assertRaises(ValueError):
+            _ = a * GF(4, 0b10011).array([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import json
+import random
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+from calculator import poly_to_string, run_batch
+from gf import GF
+from gf_expr import ExpressionEvaluator, compile_expression, split_literals
+
+
+class TestExpressionEvaluator(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.evaluator = ExpressionEvaluator()
+
+    def evaluate(self, line):
+        return self.evaluator.evaluate(line)[1]
+
+    def test_example_expression(self):
+        field = GF(8)
+        x, one = field.element(2), field.element(1)
+        expected = (x ** 7 + x + one) * x ** 3 / field.element(0b1011) ** 5
+        self.assertEqual(self.evaluate("GF(2^8): (x^7+x+1) * (x^3) / 0b1011 ** 5"), expected.value,
+                         "La expresión de ejemplo se evaluó mal.")
+
+    def test_matches_elements(self):
+        for degree in (3, 8, 20, 128):
+            field = GF(degree)
+            for _ in range(20):
+                a, b, c = (random.randrange(1, field.order) for _ in range(3))
+                k, e = random.randrange(0, 3 * degree), random.randrange(-5, 300)
+                A, B, C, X = field.element(a), field.element(b), field.element(c), field.element(2)
+                expected = ((A - X ** k) * B / C ** e + A).value
+                line = f"GF(2^{degree}): ({hex(a)} - x^{k}) * {bin(b)} / {c} ** {e} + {hex(a)}"
+                self.assertEqual(self.evaluate(line), expected, f"Evaluación incorrecta: {line}")
+
+    def test_literals_are_reduced(self):
+        # En GF(2^3) con x^3 + x + 1, el literal 0b1000 (x^3) es x + 1
+        self.assertEqual(self.evaluate("GF(2^3): 0b1000"), 0b011, "Los literales deben reducirse.")
+        self.assertEqual(self.evaluate("GF(2^3, 0b1101): x^3"), 0b101, "Se debe respetar el polinomio dado.")
+        self.assertEqual(self.evaluate("GF(2^1): x"), 1, "En GF(2), x = 1.")
+
+    def test_shared_plans(self):
+        shape, literals = split_literals("(0x1f + x^3) * 07 ** 2")
+        self.assertEqual(shape, "(# + x^#) * # ** #", "Forma incorrecta.")
+        self.assertEqual(literals, [31, 3, 7, 2], "Literales incorrectos.")
+        self.assertIs(compile_expression(shape), compile_expression(split_literals("(1 + x^9) * 5 ** 3")[0]),
+                      "Expresiones con la misma forma deben compartir el plan.")
+
+    def test_errors(self):
+        for line in ("GF(2^8): 3 +", "GF(2^8): (1", "GF(2^8): 1 1", "GF(2^8): y", "GF(2^8): x^2^3",
+                     "GF(3^8): 1", "x + 1", "GF(2^4, 0b10101): 1"):
+            with self.assertRaises(ValueError, msg=line):
+                self.evaluate(line)
+        with self.assertRaises(ZeroDivisionError):
+            self.evaluate("GF(2^8): x / (x + x)")
+        with self.assertRaises(ZeroDivisionError):
+            self.evaluate("GF(2^8): 0 ** -1")
+        self.assertEqual(ExpressionEvaluator(default_degree=4).evaluate("x * x^3")[1], 0b0011,
+                         "Las líneas sin encabezado deben usar el grado por defecto.")
+
+
+class TestBatchMode(unittest.TestCase):
+    lines = ["GF(2^4): x^4", "# comentario", "", "GF(2^4): 1 / 0"]
+
+    def test_text(self):
+        output = io.StringIO()
+        self.assertEqual(run_batch(self.lines, output), 1, "Debe contarse una línea con error.")
+        self.assertEqual(output.getvalue().splitlines(),
+                         ["GF(2^4): x^4 = x + 1",
+                          "GF(2^4): 1 / 0 = Error: No se puede dividir por cero en un campo finito."],
+                         "Salida de texto incorrecta.")
+
+    def test_csv_and_jsonl(self):
+        output = io.StringIO()
+        run_batch(self.lines, output, "csv")
+        rows = output.getvalue().splitlines()
+        self.assertEqual(rows[0], "campo,expresion,valor,polinomio,error", "Encabezado CSV incorrecto.")
+        self.assertEqual(rows[1], "GF(2^4),GF(2^4): x^4,3,x + 1,", "Fila CSV incorrecta.")
+        output = io.StringIO()
+        run_batch(self.lines, output, "jsonl")
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records[0]["valor"], 3, "Valor JSONL incorrecto.")
+        self.assertIsNone(records[1]["valor"], "Una línea con error no tiene valor.")
+        self.assertIn("cero", records[1]["error"], "Falta el mensaje de error.")
+
+    def test_jsonl_matches_json_dumps(self):
+        # Las líneas JSONL se arman sin json.dumps: deben ser idénticas a las suyas
+        lines = ["GF(2^8):\tx\t* 0x53", "GF(2^8, 0x11d): x ** 9", "GF(2^3): 0b111 + 1", "GF(2^8): \"ñ\\"]
+        output = io.StringIO()
+        run_batch(lines, output, "jsonl")
+        evaluator = ExpressionEvaluator()
+        expected = []
+        for line in lines[:3]:
+            field, value = evaluator.evaluate(line)
+            expected.append(json.dumps({"campo": f"GF(2^{field.degree})", "expresion": line, "valor": value,
+                                        "polinomio": poly_to_string(value), "error": None}, ensure_ascii=False))
+        records = output.getvalue().splitlines()
+        self.assertEqual(records[:3], expected, "Líneas JSONL distintas de las de json.dumps.")
+        self.assertEqual(json.loads(records[3])["expresion"], lines[3], "Expresión mal escapada en JSONL.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import importlib.util
+import random
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+from gf import GF
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    from gf_matrix import GFMatrix
+
+
+@unittest.skipUnless(HAS_NUMPY, "GFMatrix requiere NumPy.")
+class TestGFMatrix(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.fields = [GF(8), GF(16), GF(20)]
+
+    def random_matrix(self, field, n_rows, n_cols):
+        return GFMatrix(field, [[random.randrange(field.order) for _ in range(n_cols)] for _ in range(n_rows)])
+
+    def test_matmul_matches_elements(self):
+        for field in self.fields:
+            a = self.random_matrix(field, 4, 5)
+            b = self.random_matrix(field, 5, 3)
+            c = a @ b
+            for i in range(4):
+                for j in range(3):
+                    expected = field.element(0)
+                    for k in range(5):
+                        expected = expected + a[i, k] * b[k, j]
+                    self.assertEqual(c[i, j], expected, f"Producto de matrices incorrecto en GF(2^{field.degree}).")
+
+    def test_inverse(self):
+        for field in self.fields:
+            a = self.random_matrix(field, 20, 20)
+            identity = GFMatrix.identity(field, 20)
+            self.assertEqual(a @ a.inverse(), identity, "A * A^-1 debe ser la identidad.")
+            self.assertEqual(a.inverse() @ a, identity, "A^-1 * A debe ser la identidad.")
+
+    def test_solve(self):
+        for field in self.fields:
+            a = self.random_matrix(field, 15, 15)
+            b = field.array([random.randrange(field.order) for _ in range(15)])
+            x = a.solve(b)
+            self.assertTrue(((a @ x) == b).all(), "A x debe ser b.")
+            rhs = self.random_matrix(field, 15, 3)
+            self.assertEqual(a @ a.solve(rhs), rhs, "Resolver con varios lados derechos falló.")
+
+    def test_rank_and_determinant(self):
+        for field in self.fields:
+            a = self.random_matrix(field, 10, 10)
+            b = self.random_matrix(field, 10, 10)
+            self.assertEqual((a @ b).determinant(), a.determinant() * b.determinant(),
+                             "El determinante debe ser multiplicativo.")
+            # Una fila repetida baja el rango y anula el determinante
+            singular = GFMatrix(field, a.values.copy())
+            singular.values[3] = singular.values[7]
+            self.assertEqual(singular.rank(), 9, "El rango de una matriz con filas repetidas es incorrecto.")
+            self.assertEqual(singular.determinant().value, 0, "El determinante de una matriz singular es 0.")
+            with self.assertRaises(ValueError):
+                singular.inverse()
+
+    def test_row_reduce(self):
+        field = self.fields[0]
+        a = GFMatrix(field, [[2, 4, 6], [1, 2, 3], [0, 0, 5]])
+        reduced, pivots = a.row_reduce()
+        self.assertEqual(pivots, [0, 2], "Columnas pivote incorrectas.")
+        self.assertEqual(reduced.values.tolist(), [[1, 2, 0], [0, 0, 1], [0, 0, 0]],
+                         "Forma escalonada reducida incorrecta.")
+
+    def test_solve_errors(self):
+        field = self.fields[0]
+        a = GFMatrix(field, [[1, 1], [1, 1]])
+        with self.assertRaises(ValueError):
+            a.solve([1, 0])  # Inconsistente
+        with self.assertRaises(ValueError):
+            a.solve([1, 1])  # Infinitas soluciones
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+from gf import GF
+from gf_poly import GFPolynomial, _schoolbook
+
+
+class TestGFPolynomial(unittest.TestCase):
+    def setUp(self):
+        random.seed(4)
+        self.fields = [GF(8), GF(40)]
+
+    def random_poly(self, field, length):
+        return GFPolynomial(field, [random.randrange(field.order) for _ in range(length)])
+
+    def test_trimmed_coefficients(self):
+        field = self.fields[0]
+        p = GFPolynomial(field, [1, 2, 0, 0])
+        self.assertEqual(p.coeffs, (1, 2), "Los ceros de mayor grado deben eliminarse.")
+        self.assertEqual(GFPolynomial(field, [0, 0]).degree, -1, "El polinomio cero tiene grado -1.")
+
+    def test_karatsuba_matches_schoolbook(self):
+        for field in self.fields:
+            a = self.random_poly(field, 150)
+            b = self.random_poly(field, 97)
+            expected = _schoolbook(field, list(a.coeffs), list(b.coeffs))
+            self.assertEqual((a * b).coeffs, tuple(expected),
+                             f"Karatsuba no coincide con el método escolar en GF(2^{field.degree}).")
+
+    def test_divmod_and_gcd(self):
+        for field in self.fields:
+            a = self.random_poly(field, 60)
+            b = self.random_poly(field, 25)
+            q, r = divmod(a, b)
+            self.assertEqual(q * b + r, a, "a debe ser q * b + r.")
+            self.assertLess(r.degree, b.degree, "El residuo debe tener grado menor al divisor.")
+            common = GFPolynomial(field, [5, 3, 1])
+            self.assertEqual((a * common).gcd(b * common) % common.monic(), GFPolynomial(field, []),
+                             "El mcd debe ser múltiplo del factor común.")
+        with self.assertRaises(ZeroDivisionError):
+            divmod(a, GFPolynomial(field, []))
+
+    def test_evaluation(self):
+        for field in self.fields:
+            p = self.random_poly(field, 30)
+            points = [field.element(random.randrange(field.order)) for _ in range(20)]
+            expected = []
+            for x in points:
+                value = field.element(0)
+                for i, c in enumerate(p.coeffs):
+                    value = value + field.element(c) * x ** i
+                expected.append(value)
+            self.assertEqual([p(x) for x in points], expected, "La evaluación de Horner es incorrecta.")
+            self.assertEqual(p.evaluate(points), expected, "La evaluación en lote es incorrecta.")
+            self.assertEqual(p.evaluate(x for x in points), expected, "Un generador debe evaluarse como lista.")
+            self.assertEqual(p.evaluate(tuple(points)), expected, "Una tupla debe evaluarse como lista.")
+
+    def test_interpolation(self):
+        for field in self.fields:
+            xs = [field.element(v) for v in random.sample(range(field.order), 40)]
+            ys = [field.element(random.randrange(field.order)) for _ in xs]
+            for method in ("lagrange", "newton"):
+                p = GFPolynomial.interpolate(field, xs, ys, method=method)
+                self.assertLess(p.degree, len(xs), "El interpolante debe tener grado menor a n.")
+                self.assertEqual(p.evaluate(xs), ys, f"Interpolación de {method} incorrecta.")
+        with self.assertRaises(ValueError):
+            GFPolynomial.interpolate(field, [xs[0], xs[0]], ys[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import mmap
+import os
+import tempfile
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+import gf_tables
+from gf import GF
+
+
+class TestFullTables(unittest.TestCase):
+    def setUp(self):
+        # Usar un directorio temporal para no depender del estado del usuario
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_dir = gf_tables.TABLE_DIR
+        self.old_loaded = dict(gf_tables._LOADED)
+        gf_tables.TABLE_DIR = self.tmpdir.name
+        gf_tables._LOADED.clear()
+
+    def tearDown(self):
+        gf_tables.TABLE_DIR = self.old_dir
+        gf_tables._LOADED.clear()
+        gf_tables._LOADED.update(self.old_loaded)
+        self.tmpdir.cleanup()
+
+    def test_tables_match_bitwise(self):
+        for degree, poly in ((1, 0b11), (3, 0b1011), (5, 0b100101), (8, 0b100011011), (8, 0b100011101)):
+            field = GF(degree, poly)
+            mul, inverse = field.full_tables()
+            for a in range(field.order):
+                self.assertEqual(inverse[a], field._inverse_bitwise(a) if a else 0,
+                                 f"Inverso de {a} incorrecto en GF(2^{degree}).")
+                for b in range(field.order):
+                    self.assertEqual(mul[(a << degree) | b], field._mul_bitwise(a, b),
+                                     f"Producto {a} * {b} incorrecto en GF(2^{degree}).")
+        self.assertIsNone(GF(9).full_tables(), "GF(2^9) no debe tener tablas completas.")
+
+    def test_file_is_memory_mapped(self):
+        field = GF(8)
+        mul, _ = field.full_tables()
+        path = gf_tables.table_path(8, field.irreducible_poly)
+        self.assertTrue(os.path.exists(path), "Las tablas deben guardarse en disco.")
+        self.assertEqual(os.path.getsize(path), gf_tables.HEADER_SIZE + 256 * 256 + 256, "Tamaño de archivo incorrecto.")
+        self.assertIsInstance(mul.obj, mmap.mmap, "Las tablas deben leerse con mmap.")
+        # Otra instancia del mismo campo comparte las mismas tablas
+        self.assertIs(GF(8).full_tables()[0], mul, "Las tablas deben compartirse entre instancias.")
+
+    def test_memory_by_default(self):
+        gf_tables.TABLE_DIR = None
+        mul, inverse = GF(4, 0b10011).full_tables()
+        self.assertNotIsInstance(mul.obj, mmap.mmap, "Sin directorio, las tablas deben quedar en memoria.")
+        self.assertEqual(mul[(2 << 4) | 8], 0b0011, "Producto incorrecto en GF(2^4).")
+        self.assertEqual(os.listdir(self.tmpdir.name), [], "Sin directorio no debe escribirse nada.")
+
+    def test_use_table_dir(self):
+        gf_tables.TABLE_DIR = None
+        gf_tables.use_table_dir(os.path.join(self.tmpdir.name, "otro"))
+        GF(5, 0b100101).full_tables()
+        self.assertTrue(os.path.exists(gf_tables.table_path(5, 0b100101)), "use_table_dir debe guardar las tablas.")
+
+    def test_invalid_file_is_rebuilt(self):
+        path = gf_tables.table_path(4, 0b10011)
+        with open(path, "wb") as f:
+            f.write(b"\0" * (gf_tables.HEADER_SIZE + 16 * 16 + 16))
+        field = GF(4, 0b10011)
+        self.assertEqual(field.full_tables()[0][(2 << 4) | 8], 0b0011, "Un archivo inválido debe reconstruirse.")
+
+    def test_unwritable_directory(self):
+        gf_tables.TABLE_DIR = os.path.join(self.tmpdir.name, "archivo")
+        open(gf_tables.TABLE_DIR, "w").close()  # Un archivo en lugar de directorio
+        field = GF(3, 0b1011)
+        self.assertEqual(field.full_tables()[1][0b010], 0b101, "Sin disco, las tablas deben quedar en memoria.")
+
+    def test_element_operations(self):
+        field = GF(8)
+        a, b = field.element(0x57), field.element(0x83)
+        self.assertEqual((a * b).value, 0xC1, "0x57 * 0x83 = 0xC1 en GF(2^8) de AES.")
+        self.assertEqual((a * b / b), a, "(a * b) / b debe ser a.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from cache_isolation import setUpModule, tearDownModule  # noqa: F401
+import irreducible
+from gf import GF
+from irreducible import (find_irreducible, find_primitive, is_irreducible, is_primitive,
+                         mersenne_factors)
+
+
+class TestIrreducible(unittest.TestCase):
+    def setUp(self):
+        # Usar una caché temporal para no depender del estado del usuario
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_path = irreducible.POLY_CACHE_PATH
+        irreducible.POLY_CACHE_PATH = os.path.join(self.tmpdir.name, "polinomios.json")
+        irreducible._cache = None
+
+    def tearDown(self):
+        irreducible.POLY_CACHE_PATH = self.old_path
+        irreducible._cache = None
+        self.tmpdir.cleanup()
+
+    def test_irreducibility(self):
+        self.assertTrue(is_irreducible(0b1011), "x^3 + x + 1 es irreducible.")
+        self.assertTrue(is_irreducible(0b100011011), "El polinomio de AES es irreducible.")
+        self.assertFalse(is_irreducible(0b101), "x^2 + 1 = (x + 1)^2 no es irreducible.")
+        self.assertFalse(is_irreducible(0b10101), "x^4 + x^2 + 1 = (x^2 + x + 1)^2 no es irreducible.")
+        self.assertTrue(is_irreducible((1 << 233) | (1 << 74) | 1), "x^233 + x^74 + 1 es irreducible.")
+
+    def test_primitivity(self):
+        self.assertTrue(is_primitive(0b100011101), "x^8 + x^4 + x^3 + x^2 + 1 es primitivo.")
+        self.assertFalse(is_primitive(0b100011011), "El polinomio de AES no es primitivo.")
+        self.assertFalse(is_primitive(0b11111), "x^4 + x^3 + x^2 + x + 1 no es primitivo.")
+
+    def test_mersenne_factors(self):
+        self.assertEqual(mersenne_factors(8), [3, 5, 17], "Factores de 2^8 - 1 incorrectos.")
+        self.assertEqual(mersenne_factors(11), [23, 89], "Factores de 2^11 - 1 incorrectos.")
+
+    def test_lowest_weight_search(self):
+        expected = {1: 0b11, 2: 0b111, 3: 0b1011, 4: 0b10011, 5: 0b100101, 6: 0b1000011}
+        for degree, poly in expected.items():
+            self.assertEqual(find_irreducible(degree), poly, f"Irreducible de grado {degree} incorrecto.")
+        self.assertEqual(find_irreducible(8), 0b100011011, "Irreducible de grado 8 incorrecto.")
+        self.assertEqual(find_primitive(8), 0b100011101, "Primitivo de grado 8 incorrecto.")
+        # NIST B-163 y B-571
+        self.assertEqual(find_irreducible(163), (1 << 163) | 0b11001001, "Irreducible de grado 163 incorrecto.")
+        self.assertEqual(find_irreducible(571), (1 << 571) | 0b10000100101, "Irreducible de grado 571 incorrecto.")
+
+    def test_calculator_fields(self):
+        # Los campos fijos de la calculadora son constantes, pero deben coincidir con la búsqueda
+        from calculator import Calculator
+        for size, poly in Calculator().irreducible_polys.items():
+            self.assertEqual(poly, find_irreducible(size.bit_length() - 1), f"Polinomio de GF({size}) incorrecto.")
+
+    def test_persistent_cache(self):
+        find_irreducible(100)
+        irreducible._cache = None
+        self.assertTrue(os.path.exists(irreducible.POLY_CACHE_PATH), "La caché debe escribirse en disco.")
+        self.assertIn("irreducible:100", irreducible._load_cache(), "La caché debe conservar la búsqueda.")
+
+    def test_field_from_degree(self):
+        field = GF(8)
+        self.assertEqual(field.irreducible_poly, 0b100011011, "GF(8) debe usar el irreducible de menor peso.")
+        with self.assertRaises(ValueError):
+            GF(2, 0b101)
+        with self.assertRaises(ValueError):
+            GF(2, 0b1011)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,22 @@
+# Número mínimo de bloques para que encrypt y decrypt usen el modo bitslice;
+# con menos bloques pesa más el costo fijo de las 16 rondas sobre los planos
+BITSLICE_MIN_BLOCKS = 1024
+
+
+def _key_to_bytes(key, message):
+    """
+    Llave como bytes: una cadena ASCII o un objeto con protocolo de búfer
+    (bytes, bytearray, memoryview, ...). Cualquier otro tipo, como un entero
+    (bytes(8) serían ocho bytes en cero), lanza TypeError con 'message'.
+    """
+    if isinstance(key, str):
+        return key.encode('ascii')
+    try:
+        return memoryview(key).tobytes()
+    except TypeError:
+        raise TypeError(message) from None
+
+
 class DES:
     # Tablas de permutación y sustitución utilizadas por el algoritmo DES
     IP = [58, 50, 42, 34, 26, 18, 10, 2,
@@ -103,11 +122,180 @@ class DES:
     SHIFT = [1, 1, 2, 2, 2, 2, 2, 2,
              1, 2, 2, 2, 2, 2, 2, 1]
 
-    def __init__(self, key):
-        if len(key) != 8:
+    def __init__(self, key, check_parity=False):
+        """
+        :param key: Llave de 8 caracteres ASCII o de 8 bytes (bytes, bytearray, ...).
+        :param check_parity: Si es True, exige que cada byte de la llave tenga
+                             paridad impar, como indica el estándar.
+        """
+        key_bytes = _key_to_bytes(key, "La clave debe ser de 8 bytes.")
+        if len(key_bytes) != 8:
             raise ValueError("La clave debe ser de 8 bytes.")
+        from des_engine import DESEngine, cached_schedule, has_odd_parity
+        if check_parity and not has_odd_parity(key_bytes):
+            raise ValueError("Cada byte de la clave debe tener paridad impar.")
         self.key = key
-        self.subkeys = self.generate_keys()
+        self.key_bytes = key_bytes
+        self._subkeys = None
+        # Motor sobre enteros para cifrar mensajes, con las subllaves del caché
+        # de des_engine; encrypt_block y decrypt_block se conservan como
+        # implementación de referencia
+        self.engine = DESEngine.from_schedule(cached_schedule(key_bytes))
+        self._bitslice = None
+        self._vector = None
+        self._compiled = None
+
+    @property
+    def subkeys(self):
+        """Subllaves como listas de bits de la implementación de referencia; se generan al usarse."""
+        if self._subkeys is None:
+            self._subkeys = self.generate_keys()
+        return self._subkeys
+
+    @property
+    def bitslice(self):
+        """Motor bitslice, creado al usarse por primera vez; None si NumPy no está disponible."""
+        if self._bitslice is None:
+            try:
+                from des_bitslice import BitsliceEngine
+            except ImportError:
+                return None
+            self._bitslice = BitsliceEngine.from_subkeys(self.engine.round_keys)
+        return self._bitslice
+
+    @property
+    def compiled(self):
+        """
+        Motor con las subllaves metidas en las tablas de cada ronda (ver
+        des_compiled), para cifrar o descifrar mucho volumen con esta llave.
+        Se crea al usarse y sus tablas (256 KB) se construyen al cifrar o
+        descifrar por primera vez. Solo existe para DES simple.
+        """
+        if self._compiled is None:
+            from des_compiled import CompiledEngine
+            self._compiled = CompiledEngine.from_schedule(self.engine.schedule)
+        return self._compiled
+
+    def encrypt_blocks(self, blocks):
+        """
+        Cifra en modo ECB, sin relleno, un arreglo de NumPy de bloques con las
+        operaciones vectorizadas de des_vector.
+
+        :param blocks: Arreglo unidimensional de uint64; cada elemento es un
+                       bloque como entero de 64 bits (primer byte en los bits
+                       más significativos, como np.frombuffer(datos, '>u8')).
+        :return: Arreglo nuevo de uint64 con los bloques cifrados.
+        """
+        return self._vector_engine().crypt_blocks(blocks)
+
+    def decrypt_blocks(self, blocks):
+        """Descifra en modo ECB un arreglo de bloques uint64; ver encrypt_blocks."""
+        return self._vector_engine().crypt_blocks(blocks, decrypt=True)
+
+    def _vector_engine(self):
+        if self._vector is None:
+            from des_vector import VectorEngine
+            self._vector = VectorEngine(self.engine)
+        return self._vector
+
+    def _crypt_ecb_into(self, data, out, decrypt=False):
+        """
+        ECB sobre un búfer cuya longitud es múltiplo de 8 bytes, sin relleno,
+        escribiendo en out: modo bitslice para lotes grandes y motor sobre
+        enteros para el resto.
+        """
+        if len(data) // 8 >= BITSLICE_MIN_BLOCKS and self.bitslice is not None:
+            self.bitslice.crypt_into(data, out, decrypt)
+        else:
+            self.engine.crypt_into(data, out, decrypt)
+
+    def _crypt_ecb(self, data, decrypt=False):
+        """ECB sobre datos cuya longitud es múltiplo de 8 bytes, sin relleno."""
+        out = bytearray(len(data))
+        self._crypt_ecb_into(data, out, decrypt)
+        return bytes(out)
+
+    def encrypt_into(self, data, out, padding=True):
+        """
+        Cifra en modo ECB un objeto con protocolo de búfer (bytes, bytearray,
+        memoryview, mmap, array, ...) y escribe el resultado en out.
+
+        :param out: Búfer escribible con al menos len(data) bytes, más el
+                    bloque de relleno si padding es True (ver output_size).
+        :param padding: Si es False, len(data) debe ser múltiplo de 8.
+        :return: Número de bytes escritos en out.
+        """
+        source, target = memoryview(data).cast('B'), memoryview(out).cast('B')
+        n = len(source) - len(source) % 8
+        if not padding and n != len(source):
+            raise ValueError("Sin relleno, la longitud de los datos debe ser múltiplo de 8 bytes.")
+        size = self.output_size(len(source), padding)
+        if len(target) < size:
+            raise ValueError("El búfer de salida es demasiado pequeño.")
+        self._crypt_ecb_into(source[:n], target[:n])
+        if padding:
+            self._crypt_ecb_into(self.pad(bytes(source[n:])), target[n:size])
+        return size
+
+    def decrypt_into(self, data, out, padding=True):
+        """
+        Descifra en modo ECB un objeto con protocolo de búfer y escribe el
+        resultado en out; out puede ser el mismo data (descifrado en sitio).
+
+        :param out: Búfer escribible con al menos len(data) bytes.
+        :param padding: Si es True, quita el relleno: los bytes de relleno
+                        quedan en out después de los que se reportan.
+        :return: Número de bytes de texto claro en out.
+        """
+        source, target = memoryview(data).cast('B'), memoryview(out).cast('B')
+        if len(source) % 8 or (padding and not source):
+            raise ValueError("La longitud del texto cifrado debe ser un múltiplo positivo de 8 bytes.")
+        if len(target) < len(source):
+            raise ValueError("El búfer de salida es demasiado pequeño.")
+        self._crypt_ecb_into(source, target[:len(source)], decrypt=True)
+        if not padding:
+            return len(source)
+        return len(source) - self.padding_length(target[len(source) - 8:len(source)])
+
+    @staticmethod
+    def output_size(length, padding=True):
+        """Bytes que produce cifrar length bytes en ECB (con relleno, siempre de 1 a 8 más)."""
+        return (length // 8 + 1) * 8 if padding else length
+
+    def encrypt_file(self, src_path, dst_path):
+        """Cifra un archivo en ECB con relleno usando memoria acotada; ver des_files.encrypt_file."""
+        from des_files import encrypt_file
+        return encrypt_file(self, src_path, dst_path)
+
+    def decrypt_file(self, src_path, dst_path):
+        """Descifra un archivo en ECB con relleno usando memoria acotada; ver des_files.decrypt_file."""
+        from des_files import decrypt_file
+        return decrypt_file(self, src_path, dst_path)
+
+    def ecb(self, decrypt=False, padding=True):
+        """Cifrador (o descifrador) incremental en modo ECB; ver des_modes.ECB."""
+        from des_modes import ECB
+        return ECB(self, decrypt, padding)
+
+    def cbc(self, iv, decrypt=False, padding=True):
+        """Cifrador (o descifrador) incremental en modo CBC; ver des_modes.CBC."""
+        from des_modes import CBC
+        return CBC(self, iv, decrypt, padding)
+
+    def ctr(self, nonce):
+        """Cifrador incremental en modo CTR (cifra y descifra); ver des_modes.CTR."""
+        from des_modes import CTR
+        return CTR(self, nonce)
+
+    def cfb(self, iv, decrypt=False):
+        """Cifrador (o descifrador) incremental en modo CFB de 64 bits; ver des_modes.CFB."""
+        from des_modes import CFB
+        return CFB(self, iv, decrypt)
+
+    def ofb(self, iv):
+        """Cifrador incremental en modo OFB (cifra y descifra); ver des_modes.OFB."""
+        from des_modes import OFB
+        return OFB(self, iv)
 
     def permute(self, block, table):
         return [block[i -1] for i in table]
@@ -130,7 +318,7 @@ class DES:
         return result
 
     def generate_keys(self):
-        key_bits = [int(x) for x in f"{int.from_bytes(self.key.encode('ascii'), 'big'):064b}"]
+        key_bits = [int(x) for x in f"{int.from_bytes(self.key_bytes, 'big'):064b}"]
         key_permuted = self.permute(key_bits, self.PC_1)
         C = key_permuted[:28]
         D = key_permuted[28:]
@@ -183,28 +371,66 @@ class DES:
         return data + bytes([pad_len]*pad_len)
 
     def unpad(self, data):
-        pad_len = data[-1]
-        if pad_len < 1 or pad_len > 8:
+        return data[:-self.padding_length(data)]
+
+    @staticmethod
+    def padding_length(data):
+        """
+        Longitud del relleno de pad al final de data: pad_len bytes que valen
+        pad_len, entre 1 y 8. Revisa todos los bytes del relleno, no solo el
+        último.
+        """
+        pad_len = data[-1] if len(data) else 0
+        if not 1 <= pad_len <= min(8, len(data)) or any(b != pad_len for b in data[len(data) - pad_len:]):
             raise ValueError("Padding inválido.")
-        return data[:-pad_len]
+        return pad_len
 
     def encrypt(self, plaintext):
         data = plaintext.encode('ascii')
-        data = self.pad(data)
-        ciphertext = b''
-        for i in range(0, len(data), 8):
-            block = data[i:i+8]
-            ciphertext += self.encrypt_block(block)
-        return ciphertext
+        return self._crypt_ecb(self.pad(data))
 
     def decrypt(self, ciphertext):
-        data = b''
-        for i in range(0, len(ciphertext), 8):
-            block = ciphertext[i:i+8]
-            data += self.decrypt_block(block)
-        data = self.unpad(data)
+        data = self.unpad(self._crypt_ecb(ciphertext, decrypt=True))
         return data.decode('ascii')
 
+class TripleDES(DES):
+    def __init__(self, key, check_parity=False):
+        """
+        Triple DES en la forma EDE: cifrar con K1, descifrar con K2 y cifrar
+        con K3. Tiene los mismos métodos, modos y búferes que DES.
+
+        Cada llave es un objeto DES, así que sus subllaves salen del caché de
+        des_engine; el motor las une en las 48 rondas de des_engine.crypt3_int.
+
+        :param key: 16 bytes o caracteres ASCII (K1 || K2, con K3 = K1; EDE2) o
+                    24 (K1 || K2 || K3; EDE3).
+        :param check_parity: Si es True, exige paridad impar en cada byte.
+        """
+        from des_engine import TripleDESEngine, split_triple_key
+        key_bytes = _key_to_bytes(key, "La clave de triple DES debe ser de 16 o 24 bytes.")
+        self.key = key
+        self.key_bytes = key_bytes
+        self.keys = tuple(DES(k, check_parity) for k in split_triple_key(key_bytes))
+        self.engine = TripleDESEngine.from_engines(*(des.engine for des in self.keys))
+        self._bitslice = None
+        self._vector = None
+        self._compiled = None
+
+    @property
+    def subkeys(self):
+        """Subllaves de referencia (listas de bits) de K1, K2 y K3."""
+        return tuple(des.subkeys for des in self.keys)
+
+    def encrypt_block(self, block):
+        # Implementación de referencia: tres DES completos encadenados
+        first, second, third = self.keys
+        return third.encrypt_block(second.decrypt_block(first.encrypt_block(block)))
+
+    def decrypt_block(self, block):
+        first, second, third = self.keys
+        return first.decrypt_block(second.encrypt_block(third.decrypt_block(block)))
+
+
 if __name__ == "__main__":
     key = 'MiClave1'  # La clave debe ser de 8 caracteres
     des = DES(key)
@@ -0,0 +1,402 @@
+import argparse
+import json
+import os
+import platform
+import time
+
+from DES import DES, TripleDES
+from des_compiled import CompiledEngine
+from des_engine import DESEngine, TripleDESEngine
+
+# Llave de los benchmarks (8 caracteres ASCII, como pide la clase DES)
+BENCH_KEY = "MiClave1"
+# Llave de triple DES de los benchmarks (EDE3)
+BENCH_TRIPLE_KEY = "MiClave1OtraClavTercera3"
+# Tiempo mínimo que se mide el camino bloque por bloque; se extrapola al total
+PER_BLOCK_TIME_BUDGET = 0.5
+# Tiempo mínimo de cada medición de la suite
+CASE_TIME_BUDGET = 0.2
+# Bytes de los casos de volumen de la suite
+SUITE_BULK_BYTES = 1 << 20
+
+
+def bench_bitslice(n_blocks):
+    """
+    Compara el cifrado bloque por bloque (motor sobre enteros) contra el modo
+    bitslice sobre los mismos n_blocks bloques.
+
+    :return: Diccionario con los MB/s de cada camino y la aceleración.
+    """
+    des = DES(BENCH_KEY)
+    data = os.urandom(8 * n_blocks)
+
+    encrypt_block = des.engine.encrypt_block
+    blocks = 0
+    start = time.perf_counter()
+    while blocks < n_blocks and time.perf_counter() - start < PER_BLOCK_TIME_BUDGET:
+        encrypt_block(data[8 * blocks:8 * blocks + 8])
+        blocks += 1
+    per_block = (time.perf_counter() - start) / blocks
+
+    bitslice = des.bitslice
+    bitslice.encrypt(data[:8 * 64])  # Calentamiento
+    start = time.perf_counter()
+    bitslice.encrypt(data)
+    elapsed = time.perf_counter() - start
+    return {
+        "mb_per_s_block": 8 / per_block / 1e6,
+        "mb_per_s_bitslice": 8 * n_blocks / elapsed / 1e6,
+        "speedup": per_block * n_blocks / elapsed,
+    }
+
+
+def bench_vector(n_blocks, repeat=5):
+    """
+    Compara encrypt_blocks (des_vector) contra el modo bitslice sobre un
+    arreglo de n_blocks bloques; toma el mejor de 'repeat' intentos.
+
+    :return: Diccionario con los MB/s de cada camino.
+    """
+    import numpy as np
+
+    des = DES(BENCH_KEY)
+    data = os.urandom(8 * n_blocks)
+    blocks = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+    result = {}
+    for name, run in (("vector", lambda: des.encrypt_blocks(blocks)), ("bitslice", lambda: des.bitslice.encrypt(data))):
+        run()  # Calentamiento
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        result[f"mb_per_s_{name}"] = 8 * n_blocks / best / 1e6
+    return result
+
+
+def _best_time(function, repeat):
+    """Mejor tiempo en segundos de 'repeat' llamadas a 'function'."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_compiled(n_blocks, repeat=3):
+    """
+    Compara el descifrado con el motor sobre enteros contra el motor de
+    tablas compiladas sobre n_blocks bloques; toma el mejor de 'repeat'
+    intentos.
+
+    :return: Diccionario con los MB/s de cada camino; el compilado, con y sin
+             la construcción de las tablas.
+    """
+    engine = DES(BENCH_KEY).engine
+    compiled = CompiledEngine.from_schedule(engine.schedule)
+    data = os.urandom(8 * n_blocks)
+    build = _best_time(lambda: CompiledEngine.from_schedule(engine.schedule).schedule, repeat)
+    compiled.schedule
+    elapsed_engine = _best_time(lambda: engine.decrypt(data), repeat)
+    elapsed_compiled = _best_time(lambda: compiled.decrypt(data), repeat)
+    return {
+        "mb_per_s_engine": 8 * n_blocks / elapsed_engine / 1e6,
+        "mb_per_s_compiled": 8 * n_blocks / elapsed_compiled / 1e6,
+        "mb_per_s_compiled_total": 8 * n_blocks / (build + elapsed_compiled) / 1e6,
+    }
+
+
+def compiled_crossover(n_blocks=1024, repeat=15):
+    """
+    Punto de equilibrio del motor compilado: bytes a partir de los cuales el
+    tiempo de construir las tablas se recupera con lo que se ahorra por
+    bloque. Los costos por bloque son el mejor de 'repeat' descifrados de
+    n_blocks bloques, para que el ruido de la máquina pese poco.
+
+    :return: Diccionario con el tiempo de construcción (ms), la memoria de las
+             tablas, los microsegundos por bloque de cada motor y el punto de
+             equilibrio en bytes (inf si el compilado no es más rápido).
+    """
+    engine = DES(BENCH_KEY).engine
+    compiled = CompiledEngine.from_schedule(engine.schedule)
+    data = os.urandom(8 * n_blocks)
+    build = _best_time(lambda: CompiledEngine.from_schedule(engine.schedule).schedule, repeat)
+    compiled.schedule
+    per_block_engine = _best_time(lambda: engine.decrypt(data), repeat) / n_blocks
+    per_block_compiled = _best_time(lambda: compiled.decrypt(data), repeat) / n_blocks
+    saving = per_block_engine - per_block_compiled
+    return {
+        "build_ms": build * 1e3,
+        "table_bytes": compiled.table_bytes,
+        "us_per_block_engine": per_block_engine * 1e6,
+        "us_per_block_compiled": per_block_compiled * 1e6,
+        "crossover_bytes": 8 * build / saving if saving > 0 else float("inf"),
+    }
+
+
+def bench_service(n_requests, max_batch, linger, message_size=16):
+    """
+    Manda n_requests peticiones simultáneas de message_size bytes con la misma
+    llave a un DESService por TCP y mide cuántas atiende por segundo.
+
+    :return: Diccionario con las peticiones por segundo y las métricas del servicio.
+    """
+    import asyncio
+
+    from des_service import DESClient, DESService
+
+    async def run():
+        service = DESService(max_batch, linger)
+        port = await service.start_tcp()
+        client = await DESClient.connect_tcp(port=port)
+        key = BENCH_KEY.encode("ascii")
+        message = os.urandom(message_size)
+        try:
+            await client.encrypt(key, message)  # Calentamiento
+            start = time.perf_counter()
+            await asyncio.gather(*(client.encrypt(key, message) for _ in range(n_requests)))
+            elapsed = time.perf_counter() - start
+            return {"requests_per_sec": n_requests / elapsed, "metrics": service.metrics()}
+        finally:
+            await client.close()
+            await service.close()
+
+    return asyncio.run(run())
+
+
+def bench_parallel(processes, size):
+    """
+    Mide el cifrado ECB de size bytes con ParallelDES y el número de procesos
+    dado (sin contar el arranque de los procesos).
+
+    :return: Diccionario con los MB/s.
+    """
+    from des_parallel import ParallelDES
+
+    data = os.urandom(size)
+    with ParallelDES(DES(BENCH_KEY), processes=processes) as parallel:
+        parallel.encrypt(data[:8])  # Arranca los procesos
+        start = time.perf_counter()
+        parallel.encrypt(data)
+        elapsed = time.perf_counter() - start
+    return {"mb_per_s": size / elapsed / 1e6}
+
+
+def _autorange(function):
+    """
+    Segundos por llamada de 'function', repitiéndola hasta que la medición
+    dure al menos CASE_TIME_BUDGET (como timeit.autorange).
+    """
+    loops = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= CASE_TIME_BUDGET:
+            return elapsed / loops
+
+
+def _key_setup_cases():
+    """Casos de preparación de llave: (nombre, función que prepara una llave nueva o repetida)."""
+    counter = iter(range(1 << 62))
+
+    def new_key():
+        return next(counter).to_bytes(8, "big")
+
+    return [
+        ("referencia/llave", lambda: DES(new_key()).subkeys),
+        ("enteros/llave", lambda: DESEngine(new_key())),
+        ("DES/llave nueva", lambda: DES(new_key())),
+        ("DES/llave en caché", lambda: DES(BENCH_KEY)),
+        ("compilado/llave", lambda: CompiledEngine(new_key()).schedule),
+        ("triple/llave en caché", lambda: TripleDES(BENCH_TRIPLE_KEY)),
+    ]
+
+
+def _block_cases(bulk_bytes):
+    """
+    Casos de cifrado: (nombre, bloques por llamada, función). Los de un bloque
+    miden el costo por llamada; los de volumen cifran bulk_bytes bytes.
+    """
+    des, des3 = DES(BENCH_KEY), TripleDES(BENCH_TRIPLE_KEY)
+    engine, engine3 = DESEngine(BENCH_KEY.encode("ascii")), TripleDESEngine(BENCH_TRIPLE_KEY.encode("ascii"))
+    compiled = des.compiled
+    block = b"Un bloq."
+    data = os.urandom(bulk_bytes - bulk_bytes % 8)
+    out = bytearray(len(data))
+    n_blocks = len(data) // 8
+    cases = [
+        ("referencia/bloque", 1, lambda: des.encrypt_block(block)),
+        ("enteros/bloque", 1, lambda: engine.encrypt_block(block)),
+        ("compilado/bloque", 1, lambda: compiled.encrypt_block(block)),
+        ("triple/bloque", 1, lambda: engine3.encrypt_block(block)),
+        ("enteros/volumen", n_blocks, lambda: engine.crypt_into(data, out)),
+        ("compilado/volumen", n_blocks, lambda: compiled.crypt_into(data, out)),
+        ("triple/volumen", n_blocks, lambda: engine3.crypt_into(data, out)),
+        ("DES/volumen", n_blocks, lambda: des.encrypt_into(data, out, padding=False)),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        return cases
+    one = np.array([int.from_bytes(block, "big")], dtype=np.uint64)
+    blocks = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+    cases += [
+        ("vector/bloque", 1, lambda: des.encrypt_blocks(one)),
+        ("vector/volumen", n_blocks, lambda: des.encrypt_blocks(blocks)),
+        ("triple-vector/volumen", n_blocks, lambda: des3.encrypt_blocks(blocks)),
+        ("bitslice/volumen", n_blocks, lambda: des.bitslice.crypt_into(data, out)),
+        ("triple-bitslice/volumen", n_blocks, lambda: des3.bitslice.crypt_into(data, out)),
+    ]
+    return cases
+
+
+def run_suite(bulk_bytes=SUITE_BULK_BYTES, progress=None):
+    """
+    Mide la preparación de llaves, el cifrado de un bloque y el cifrado por
+    volumen con cada motor disponible (vector y bitslice solo si hay NumPy).
+
+    :return: Diccionario {"motor/caso": medición}: keys_per_sec para las
+             llaves; blocks_per_sec y mb_per_s para el cifrado.
+    """
+    results = {}
+    for name, function in _key_setup_cases():
+        function()  # Calentamiento
+        results[name] = {"keys_per_sec": 1 / _autorange(function)}
+        if progress is not None:
+            progress(name, results[name])
+    for name, n_blocks, function in _block_cases(bulk_bytes):
+        function()
+        seconds = _autorange(function)
+        results[name] = {"blocks_per_sec": n_blocks / seconds, "mb_per_s": 8 * n_blocks / seconds / 1e6}
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+
+def save_results(path, results, bulk_bytes):
+    """Guarda los resultados de la suite en JSON junto con datos del entorno, para seguir su evolución."""
+    data = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "bytes_volumen": bulk_bytes,
+        "resultados": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def run_bitslice(args):
+    print("Cifrado ECB: bloque por bloque contra bitslice\n")
+    print(f"{'Bloques':>9} | {'MB/s (bloque)':>13} | {'MB/s (bitslice)':>15} | {'Aceleración':>11}")
+    print("-" * 58)
+    for n_blocks in args.sizes:
+        result = bench_bitslice(n_blocks)
+        print(f"{n_blocks:>9} | {result['mb_per_s_block']:>13.2f} | "
+              f"{result['mb_per_s_bitslice']:>15.2f} | {result['speedup']:>10.1f}x")
+
+
+def run_vector(args):
+    print("Cifrado ECB: encrypt_blocks (vectorizado) contra bitslice\n")
+    print(f"{'Bloques':>9} | {'MB/s (vector)':>13} | {'MB/s (bitslice)':>15}")
+    print("-" * 43)
+    for n_blocks in args.sizes:
+        result = bench_vector(n_blocks)
+        print(f"{n_blocks:>9} | {result['mb_per_s_vector']:>13.2f} | {result['mb_per_s_bitslice']:>15.2f}")
+
+
+def run_compiled(args):
+    print("Descifrado ECB: motor sobre enteros contra tablas compiladas\n")
+    print(f"{'Bloques':>9} | {'MB/s (enteros)':>14} | {'MB/s (compilado)':>16} | {'MB/s (con tablas)':>17}")
+    print("-" * 66)
+    for n_blocks in args.sizes:
+        result = bench_compiled(n_blocks)
+        print(f"{n_blocks:>9} | {result['mb_per_s_engine']:>14.2f} | {result['mb_per_s_compiled']:>16.2f} | "
+              f"{result['mb_per_s_compiled_total']:>17.2f}")
+    result = compiled_crossover()
+    print(f"\nTablas: {result['build_ms']:.1f} ms, {result['table_bytes'] // 1024} KB; por bloque: "
+          f"{result['us_per_block_engine']:.1f} us (enteros), {result['us_per_block_compiled']:.1f} us (compilado)")
+    if result["crossover_bytes"] == float("inf"):
+        print("El motor compilado no fue más rápido en esta máquina.")
+    else:
+        print(f"Conviene a partir de unos {result['crossover_bytes'] / 1024:.0f} KB con la misma llave.")
+
+
+def run_service(args):
+    n_requests = 5000
+    print(f"Servicio: {n_requests} peticiones simultáneas de 16 bytes con la misma llave\n")
+    print(f"{'Lote máx.':>9} | {'Espera (ms)':>11} | {'Peticiones/s':>12} | {'Pet./lote':>9} | {'p50 (ms)':>8} | {'p99 (ms)':>8}")
+    print("-" * 74)
+    for max_batch, linger in ((1, 0.0), (64, 0.0), (4096, 0.0), (4096, 0.002)):
+        result = bench_service(n_requests, max_batch, linger)
+        metrics = result["metrics"]
+        print(f"{max_batch:>9} | {1000 * linger:>11.1f} | {result['requests_per_sec']:>12.0f} | "
+              f"{metrics['requests_per_batch']:>9.1f} | {metrics['latency_p50_ms']:>8.2f} | {metrics['latency_p99_ms']:>8.2f}")
+
+
+def run_parallel(args):
+    megabytes = args.megabytes or 64
+    size = megabytes * 1024 * 1024
+    print(f"Cifrado ECB en paralelo de {megabytes} MB ({os.cpu_count()} CPU)\n")
+    print(f"{'Procesos':>8} | {'MB/s':>8} | {'Escala':>7}")
+    print("-" * 30)
+    base = None
+    processes = 1
+    while processes <= args.max_processes:
+        result = bench_parallel(processes, size)
+        base = base or result["mb_per_s"]
+        print(f"{processes:>8} | {result['mb_per_s']:>8.2f} | {result['mb_per_s'] / base:>6.2f}x")
+        processes *= 2
+
+
+def run_suite_command(args):
+    bulk_bytes = args.megabytes * 1024 * 1024 if args.megabytes else SUITE_BULK_BYTES
+    print(f"Suite de rendimiento (volumen de {bulk_bytes // 1024} KB)\n")
+    print(f"{'Caso':<24} | {'Llaves/s':>10} | {'Bloques/s':>12} | {'MB/s':>8}")
+    print("-" * 63)
+
+    def progress(key, result):
+        if "keys_per_sec" in result:
+            print(f"{key:<24} | {result['keys_per_sec']:>10.0f} | {'-':>12} | {'-':>8}")
+        else:
+            print(f"{key:<24} | {'-':>10} | {result['blocks_per_sec']:>12.0f} | {result['mb_per_s']:>8.2f}")
+
+    results = run_suite(bulk_bytes, progress)
+    if args.json:
+        save_results(args.json, results, bulk_bytes)
+        print(f"\nResultados guardados en {args.json}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de DES.")
+    parser.add_argument("benchmark", nargs="?", choices=["bitslice", "vector", "compilado", "paralelo", "servicio", "suite"], default="bitslice",
+                        help="Benchmark a ejecutar (por defecto bitslice).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 1024, 16384, 262144],
+                        help="Números de bloques a cifrar (bitslice, vector y compilado).")
+    parser.add_argument("--megabytes", type=int, default=None,
+                        help="Tamaño de la entrada en MB (paralelo: 64 por defecto; suite: 1 por defecto).")
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1,
+                        help="Número máximo de procesos (paralelo); se prueban potencias de 2.")
+    parser.add_argument("--json", default=None,
+                        help="Archivo donde guardar los resultados de la suite en JSON.")
+    args = parser.parse_args()
+
+    if args.benchmark == "bitslice":
+        run_bitslice(args)
+    elif args.benchmark == "vector":
+        run_vector(args)
+    elif args.benchmark == "compilado":
+        run_compiled(args)
+    elif args.benchmark == "servicio":
+        run_service(args)
+    elif args.benchmark == "suite":
+        run_suite_command(args)
+    else:
+        run_parallel(args)
+
+
+if __name__ == "__main__":
+    main()
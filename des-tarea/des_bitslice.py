@@ -0,0 +1,213 @@
+"""
+DES en modo bitslice sobre arreglos de NumPy.
+
+Los bloques se transponen a 64 planos de bits: el plano i es un arreglo de
+uint64 en el que la palabra w guarda el bit i + 1 de los bloques 64w a
+64w + 63 (el del bloque 64w en el bit más significativo), así que cada
+operación lógica sobre un plano procesa 64 bloques por palabra. En esta forma las permutaciones
+(IP, E, P, IP^-1) solo reordenan la lista de planos y cada S-box se evalúa como
+una red de compuertas AND, OR y XOR sobre todos los bloques a la vez.
+
+Las redes se generan a partir de las tablas S_BOX de la clase DES: los cuatro
+bits de columna se decodifican en 16 mintérminos, y cada bit de salida es el OR
+de los mintérminos de columna agrupados según la función de los dos bits de
+fila que les corresponde.
+"""
+import numpy as np
+
+from DES import DES
+from des_engine import subkeys
+
+# Bloques que se transponen y cifran juntos; acota la memoria intermedia
+CHUNK_BLOCKS = 256 * 1024
+
+# Expresión más barata de cada función de los bits de fila (a = bit 1, f = bit 6)
+# según su tabla de verdad: el bit r vale 1 si la función es 1 en la fila r = 2a + f
+_ROW_FUNCTIONS = {
+    0b0001: "na & nf", 0b0010: "na & f", 0b0100: "a & nf", 0b1000: "a & f",
+    0b0011: "na", 0b1100: "a", 0b0101: "nf", 0b1010: "f",
+    0b0110: "a ^ f", 0b1001: "a ^ nf",
+    0b0111: "na | nf", 0b1011: "na | f", 0b1101: "a | nf", 0b1110: "a | f",
+}
+
+
+def _sbox_source(index, sbox):
+    """
+    Genera el código de la red de compuertas de una S-box.
+
+    La función recibe cada bit de entrada junto con su complemento (así el XOR
+    con un bit de subllave en 1 es solo intercambiar el par) y devuelve los
+    cuatro bits de salida, del más significativo al menos significativo.
+    """
+    lines = [f"def sbox{index}(a, na, b, nb, c, nc, d, nd, e, ne, f, nf):",
+             "    bc0, bc1, bc2, bc3 = nb & nc, nb & c, b & nc, b & c",
+             "    de0, de1, de2, de3 = nd & ne, nd & e, d & ne, d & e"]
+    for column in range(16):
+        lines.append(f"    m{column} = bc{column >> 2} & de{column & 3}")
+    row_functions = {}
+    outputs = []
+    for bit in range(3, -1, -1):
+        # Columnas agrupadas por la función de fila de este bit de salida
+        classes = {}
+        for column in range(16):
+            mask = sum(((sbox[row][column] >> bit) & 1) << row for row in range(4))
+            if mask:
+                classes.setdefault(mask, []).append(f"m{column}")
+        terms = []
+        for mask, minterms in sorted(classes.items()):
+            union = " | ".join(minterms)
+            if mask == 0b1111:
+                terms.append(f"({union})")
+                continue
+            if mask not in row_functions:
+                row_functions[mask] = f"g{mask}"
+                lines.append(f"    g{mask} = {_ROW_FUNCTIONS[mask]}")
+            terms.append(f"(({union}) & g{mask})")
+        lines.append(f"    o{bit} = " + " | ".join(terms))
+        outputs.append(f"o{bit}")
+    lines.append(f"    return {', '.join(outputs)}")
+    return "\n".join(lines)
+
+
+def _compile_sboxes():
+    namespace = {}
+    for index, sbox in enumerate(DES.S_BOX):
+        exec(compile(_sbox_source(index, sbox), f"<sbox{index}>", "exec"), namespace)
+    return tuple(namespace[f"sbox{index}"] for index in range(8))
+
+
+_SBOXES = _compile_sboxes()
+# Fuente de cada bit de entrada de las S-boxes en R (expansión E, desde 0)
+_E = [i - 1 for i in DES.E]
+# Bit de la salida de las S-boxes que llega a cada posición de f (permutación P)
+_P = [i - 1 for i in DES.P]
+_IP = [i - 1 for i in DES.IP]
+_FP = [i - 1 for i in DES.IP_INV]
+
+
+def _transpose64(x):
+    """
+    Transpone en sitio cada matriz de 64 x 64 bits de un arreglo (W, 64) de
+    uint64 (fila = palabra, columna 0 = bit más significativo).
+
+    Usa el algoritmo de intercambio por bloques de Hacker's Delight: seis
+    pasos que intercambian submatrices de 32, 16, ..., 1 bits, cada uno
+    vectorizado sobre todas las matrices.
+    """
+    n = x.shape[0]
+    j, mask = 32, 0x00000000FFFFFFFF
+    while j:
+        pairs = x.reshape(n, 32 // j, 2, j)
+        a, b = pairs[:, :, 0, :], pairs[:, :, 1, :]
+        t = (a ^ (b >> np.uint64(j))) & np.uint64(mask)
+        a ^= t
+        b ^= t << np.uint64(j)
+        j >>= 1
+        mask ^= mask << j
+    return x
+
+
+def to_planes(data, n_blocks):
+    """
+    Transpone n_blocks bloques de 8 bytes a 64 planos de bits.
+
+    :return: Arreglo (64, ceil(n_blocks / 64)) de uint64; los bloques de relleno son cero.
+    """
+    words = np.zeros(-(-n_blocks // 64) * 64, dtype=np.uint64)
+    words[:n_blocks] = np.frombuffer(data, dtype=">u8", count=n_blocks)
+    return np.ascontiguousarray(_transpose64(words.reshape(-1, 64)).T)
+
+
+def from_planes(planes, n_blocks, out=None):
+    """
+    Transpone 64 planos de bits de vuelta a n_blocks bloques de 8 bytes.
+
+    :param out: Búfer escribible de 8 * n_blocks bytes donde se escriben los
+                bloques; si es None, se devuelven como bytes.
+    """
+    words = _transpose64(np.ascontiguousarray(planes.T)).reshape(-1)[:n_blocks]
+    if out is None:
+        return words.astype(">u8").tobytes()
+    np.frombuffer(out, dtype=">u8", count=n_blocks)[:] = words
+
+
+def crypt_planes(planes, round_keys):
+    """
+    Aplica DES a bloques en forma de planos de bits.
+
+    Con 48 subllaves aplica triple DES: IP y IP^-1 de las etapas intermedias
+    se cancelan, y entre etapas solo se intercambian L y R.
+
+    :param planes: Secuencia de 64 planos (arreglos de uint64 del mismo tamaño).
+    :param round_keys: 16 subllaves de 48 bits (48 para triple DES), en orden
+                       inverso para descifrar.
+    :return: Lista de los 64 planos del resultado.
+    """
+    rows = [planes[i] for i in _IP]
+    left, right = rows[:32], rows[32:]
+    for n, k in enumerate(round_keys):
+        if n and not n % 16:
+            left, right = right, left
+        complement = [~r for r in right]
+        f = []
+        for i, sbox in enumerate(_SBOXES):
+            inputs = []
+            for j in range(6 * i, 6 * i + 6):
+                source = _E[j]
+                if (k >> (47 - j)) & 1:
+                    inputs += (complement[source], right[source])
+                else:
+                    inputs += (right[source], complement[source])
+            f.extend(sbox(*inputs))
+        left, right = right, [l ^ f[p] for l, p in zip(left, _P)]
+    output = right + left
+    return [output[i] for i in _FP]
+
+
+class BitsliceEngine:
+    def __init__(self, key):
+        """
+        Motor de DES en modo bitslice.
+
+        :param key: Llave de 8 bytes.
+        """
+        self.round_keys = subkeys(key)
+
+    @classmethod
+    def from_subkeys(cls, round_keys):
+        """
+        Crea el motor a partir de las 16 subllaves de 48 bits, o de las 48 de
+        triple DES (las de TripleDESEngine.round_keys).
+        """
+        engine = cls.__new__(cls)
+        engine.round_keys = tuple(round_keys)
+        return engine
+
+    def crypt_into(self, data, out, decrypt=False):
+        """
+        ECB sobre un búfer cuya longitud es múltiplo de 8 bytes, escribiendo en
+        out (un búfer escribible del mismo tamaño, que puede ser el mismo data).
+        """
+        source, target = memoryview(data).cast("B"), memoryview(out).cast("B")
+        n_blocks, remainder = divmod(len(source), 8)
+        if remainder:
+            raise ValueError("La longitud de los datos debe ser múltiplo de 8 bytes.")
+        if len(target) != len(source):
+            raise ValueError("El búfer de salida debe tener la misma longitud que los datos.")
+        round_keys = self.round_keys[::-1] if decrypt else self.round_keys
+        for start in range(0, n_blocks, CHUNK_BLOCKS):
+            count = min(CHUNK_BLOCKS, n_blocks - start)
+            planes = to_planes(source[start * 8:(start + count) * 8], count)
+            from_planes(np.stack(crypt_planes(planes, round_keys)), count, target[start * 8:(start + count) * 8])
+
+    def encrypt(self, data):
+        """Cifra en modo ECB datos cuya longitud es múltiplo de 8 bytes."""
+        out = bytearray(len(data))
+        self.crypt_into(data, out)
+        return bytes(out)
+
+    def decrypt(self, data):
+        """Descifra en modo ECB datos cuya longitud es múltiplo de 8 bytes."""
+        out = bytearray(len(data))
+        self.crypt_into(data, out, decrypt=True)
+        return bytes(out)
@@ -0,0 +1,122 @@
+"""
+DES con tablas de ronda especializadas para una llave.
+
+En crypt_int de des_engine cada ronda hace R ^ K antes de consultar las
+tablas SP. Aquí la subllave de cada ronda se mete en las tablas: para una
+llave fija, la entrada v de la tabla de la S-box i en la ronda r es
+SP_i[v ^ K_r,i], así que la ronda consulta las tablas directamente con los
+bits de R, sin XOR con la subllave ni la forma de 34 bits de _spread.
+
+Las S-boxes se juntan de dos en dos como en des_vector: los grupos de E de
+S2 y S3 (R4..R9 y R8..R13) caben en el campo de 10 bits R4..R13, y lo mismo
+S4 y S5, S6 y S7, y S8 y S1 (R28..R32 || R1..R5, el único campo que da la
+vuelta). Cada ronda hace 4 consultas a tablas de 1024 entradas de 32 bits,
+guardadas como array('I'): 16 KB por ronda y 256 KB por llave.
+
+Construir las tablas cuesta unos milisegundos, así que solo conviene para
+volúmenes grandes con la misma llave (ver "bench_des.py compilado").
+"""
+from array import array
+
+from des_engine import SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8, _FP, _IP, DESEngine, subkeys_from_schedule
+
+# Tablas SP en 32 bits (sin los bits repetidos de la forma de _spread)
+_SP32 = tuple(tuple((v >> 1) & 0xFFFFFFFF for v in table) for table in (SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8))
+
+
+def _paired_table(high, low, k_high, k_low):
+    """
+    Tabla de 1024 entradas para un campo de 10 bits de R: sus 6 bits altos
+    son el grupo de E de la S-box 'high' y los 6 bajos el de 'low' (los 2 de
+    en medio cuentan para ambas), ya combinados con sus bits de subllave.
+    """
+    return array("I", [high[(v >> 4) ^ k_high] ^ low[(v & 0x3F) ^ k_low] for v in range(1024)])
+
+
+def compile_round(k1, k2, _sp=_SP32):
+    """
+    Tablas de una ronda para la subllave (k1, k2) de des_engine.key_schedule.
+
+    :return: Tupla (S2+S3, S4+S5, S6+S7, S8+S1) de arreglos array('I').
+    """
+    sp1, sp2, sp3, sp4, sp5, sp6, sp7, sp8 = _sp
+    # k1 tiene los grupos de S1, S3, S5 y S7; k2 los de S2, S4, S6 y S8
+    return (_paired_table(sp2, sp3, (k2 >> 24) & 0x3F, (k1 >> 20) & 0x3F),
+            _paired_table(sp4, sp5, (k2 >> 16) & 0x3F, (k1 >> 12) & 0x3F),
+            _paired_table(sp6, sp7, (k2 >> 8) & 0x3F, (k1 >> 4) & 0x3F),
+            _paired_table(sp8, sp1, k2 & 0x3F, k1 >> 28))
+
+
+def compiled_crypt_int(block, rounds, _ip=_IP, _fp=_FP):
+    """
+    Cifra (o descifra, con las rondas en orden inverso) un bloque de 64 bits
+    con las tablas de compile_round.
+
+    :param block: Bloque como entero de 64 bits.
+    :param rounds: 16 tuplas de compile_round.
+    :return: Bloque resultante como entero de 64 bits.
+    """
+    ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = _ip
+    block = (ip0[block >> 56] | ip1[(block >> 48) & 0xFF] | ip2[(block >> 40) & 0xFF] |
+             ip3[(block >> 32) & 0xFF] | ip4[(block >> 24) & 0xFF] | ip5[(block >> 16) & 0xFF] |
+             ip6[(block >> 8) & 0xFF] | ip7[block & 0xFF])
+    left, right = block >> 32, block & 0xFFFFFFFF
+    rounds = iter(rounds)
+    for t23, t45, t67, t81 in rounds:
+        left ^= (t23[(right >> 19) & 0x3FF] ^ t45[(right >> 11) & 0x3FF] ^ t67[(right >> 3) & 0x3FF] ^
+                 t81[((right & 0x1F) << 5) | (right >> 27)])
+        t23, t45, t67, t81 = next(rounds)
+        right ^= (t23[(left >> 19) & 0x3FF] ^ t45[(left >> 11) & 0x3FF] ^ t67[(left >> 3) & 0x3FF] ^
+                  t81[((left & 0x1F) << 5) | (left >> 27)])
+    # Tras la última ronda no hay intercambio: la salida es R16 || L16
+    fp0, fp1, fp2, fp3, fp4, fp5, fp6, fp7 = _fp
+    return (fp0[right >> 24] | fp1[(right >> 16) & 0xFF] | fp2[(right >> 8) & 0xFF] | fp3[right & 0xFF] |
+            fp4[left >> 24] | fp5[(left >> 16) & 0xFF] | fp6[(left >> 8) & 0xFF] | fp7[left & 0xFF])
+
+
+class CompiledEngine(DESEngine):
+    """
+    Motor de DES con tablas de ronda especializadas para su llave.
+
+    Tiene la misma interfaz que DESEngine (encrypt_block, crypt_into, etc.);
+    las tablas se construyen la primera vez que se cifra o descifra.
+    """
+    crypt_int = staticmethod(compiled_crypt_int)
+
+    def _set_schedule(self, schedule, round_keys=None):
+        if len(schedule) != 16:
+            raise ValueError("Las tablas compiladas solo están disponibles para DES simple.")
+        self.key_schedule = schedule
+        self._round_keys = round_keys
+        self._rounds = None
+
+    @property
+    def round_keys(self):
+        """Subllaves de 48 bits; se recuperan de key_schedule al usarse."""
+        if self._round_keys is None:
+            self._round_keys = subkeys_from_schedule(self.key_schedule)
+        return self._round_keys
+
+    @property
+    def schedule(self):
+        """Tablas de las 16 rondas en orden de cifrado; se construyen al usarse."""
+        if self._rounds is None:
+            self._rounds = tuple(compile_round(k1, k2) for k1, k2 in self.key_schedule)
+        return self._rounds
+
+    @property
+    def inverse_schedule(self):
+        """Tablas de las rondas en orden de descifrado (las mismas, al revés)."""
+        return self.schedule[::-1]
+
+    @property
+    def compiled(self):
+        """Indica si las tablas ya se construyeron."""
+        return self._rounds is not None
+
+    @property
+    def table_bytes(self):
+        """Memoria de las tablas en bytes (0 mientras no se construyan)."""
+        if self._rounds is None:
+            return 0
+        return sum(len(table) * table.itemsize for tables in self._rounds for table in tables)
@@ -0,0 +1,423 @@
+"""
+Motor de DES sobre enteros.
+
+Los bloques se manejan como enteros de 64 bits, las mitades L y R como enteros
+de 32 bits y las subllaves como enteros. Las permutaciones IP, IP^-1, PC-1 y
+PC-2 se aplican con tablas indexadas por byte, y cada S-box se fusiona con la
+permutación P en una tabla SP de 64 entradas. Las tablas se derivan de las de
+la clase DES, que sigue siendo la implementación de referencia.
+"""
+import struct
+from collections import OrderedDict
+from itertools import islice
+
+from DES import DES
+
+# Bloques que crypt_into desempaqueta a la vez; acota la lista temporal de enteros
+SEGMENT_BLOCKS = 4096
+
+# Número de llaves cuyas subllaves conserva cached_schedule (unos 350 bytes por llave)
+SCHEDULE_CACHE_SIZE = 1 << 15
+
+# Subllaves empaquetadas (ver pack_schedule), indexadas por llave, de la menos a la más reciente
+_schedule_cache = OrderedDict()
+
+
+def _byte_permutation(table, in_width):
+    """
+    Tablas por byte de una permutación de bits (numerados desde 1 en el bit
+    más significativo, como en el estándar).
+
+    La tabla j tiene en la posición v los bits de salida que aporta el byte j
+    de la entrada (contando desde el más significativo) cuando vale v.
+    """
+    out_width = len(table)
+    tables = []
+    for j in range(in_width // 8):
+        byte_table = [0] * 256
+        for v in range(256):
+            out = 0
+            for position, source in enumerate(table):
+                bit = source - 1 - 8 * j  # Posición del bit fuente dentro del byte j
+                if 0 <= bit < 8 and (v >> (7 - bit)) & 1:
+                    out |= 1 << (out_width - 1 - position)
+            byte_table[v] = out
+        tables.append(byte_table)
+    return tables
+
+
+def _permute(tables, x, in_width):
+    """Aplica una permutación dada por sus tablas por byte: una consulta por byte."""
+    out = 0
+    shift = in_width - 8
+    for table in tables:
+        out |= table[(x >> shift) & 0xFF]
+        shift -= 8
+    return out
+
+
+def _spread(half):
+    """
+    Forma de 34 bits de una mitad de 32 bits: R32 || R1 ... R32 || R1.
+
+    Los ocho grupos de 6 bits de la expansión E (que se traslapan) quedan
+    contiguos en esta forma: el grupo i ocupa los bits 33 - 4i a 28 - 4i.
+    Como la forma es lineal, las rondas pueden trabajar con L y R en ella.
+    """
+    return ((half & 1) << 33) | (half << 1) | (half >> 31)
+
+
+def _sp_tables():
+    """
+    Fusiona cada S-box con la permutación P: SP[i][v] es P aplicada a la
+    salida de la S-box i para la entrada de 6 bits v, colocada en su nibble y
+    en la forma de 34 bits de _spread.
+    """
+    tables = []
+    for i, sbox in enumerate(DES.S_BOX):
+        table = []
+        for v in range(64):
+            row = ((v >> 4) & 2) | (v & 1)
+            col = (v >> 1) & 0xF
+            nibble = sbox[row][col] << (28 - 4 * i)
+            out = 0
+            for position, source in enumerate(DES.P):
+                if (nibble >> (32 - source)) & 1:
+                    out |= 1 << (31 - position)
+            table.append(_spread(out))
+        tables.append(tuple(table))
+    return tables
+
+
+_IP = _byte_permutation(DES.IP, 64)
+_FP = _byte_permutation(DES.IP_INV, 64)
+_PC1 = _byte_permutation(DES.PC_1, 64)
+_PC2 = _byte_permutation(DES.PC_2, 56)
+SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8 = _sp_tables()
+
+
+def subkeys(key):
+    """
+    Genera las 16 subllaves de 48 bits de una llave de 8 bytes.
+
+    :param key: Llave de 8 bytes.
+    :return: Tupla de 16 enteros de 48 bits.
+    """
+    if len(key) != 8:
+        raise ValueError("La clave debe ser de 8 bytes.")
+    cd = _permute(_PC1, int.from_bytes(key, "big"), 64)
+    c, d = cd >> 28, cd & 0xFFFFFFF
+    result = []
+    for shift in DES.SHIFT:
+        c = ((c << shift) | (c >> (28 - shift))) & 0xFFFFFFF
+        d = ((d << shift) | (d >> (28 - shift))) & 0xFFFFFFF
+        result.append(_permute(_PC2, (c << 28) | d, 56))
+    return tuple(result)
+
+
+def key_schedule(key):
+    """
+    Genera las subllaves de una llave de 8 bytes en la forma que usa crypt_int.
+
+    :param key: Llave de 8 bytes.
+    :return: Tupla de 16 pares (grupos impares, grupos pares).
+    """
+    return schedule_from_subkeys(subkeys(key))
+
+
+def schedule_from_subkeys(round_keys):
+    """
+    Convierte subllaves de 48 bits a la forma que usa crypt_int.
+
+    Con R en la forma de 34 bits de _spread, los grupos 1, 3, 5 y 7 de la
+    expansión E ocupan los bits 33-28, 25-20, 17-12 y 9-4, y los grupos 2, 4,
+    6 y 8 los bits 29-24, 21-16, 13-8 y 5-0. Cada subllave de 48 bits se guarda
+    como un par de enteros con sus grupos en esas posiciones, de modo que la
+    expansión E desaparece: basta un XOR de R con cada entero del par.
+
+    :param round_keys: Subllaves de 48 bits.
+    :return: Tupla de pares (grupos impares, grupos pares).
+    """
+    schedule = []
+    for k in round_keys:
+        groups = [(k >> (42 - 6 * i)) & 0x3F for i in range(8)]
+        odd = (groups[0] << 28) | (groups[2] << 20) | (groups[4] << 12) | (groups[6] << 4)
+        even = (groups[1] << 24) | (groups[3] << 16) | (groups[5] << 8) | groups[7]
+        schedule.append((odd, even))
+    return tuple(schedule)
+
+
+def subkeys_from_schedule(schedule):
+    """Inversa de schedule_from_subkeys: recupera las subllaves de 48 bits."""
+    round_keys = []
+    for odd, even in schedule:
+        k = 0
+        for odd_shift, even_shift in ((28, 24), (20, 16), (12, 8), (4, 0)):
+            k = (k << 12) | (((odd >> odd_shift) & 0x3F) << 6) | ((even >> even_shift) & 0x3F)
+        round_keys.append(k)
+    return tuple(round_keys)
+
+
+def pack_schedule(schedule):
+    """
+    Empaqueta las 16 subllaves de key_schedule en un solo entero de 1024
+    bits: cada par ocupa 64 bits, con el entero impar (34 bits) arriba del par
+    (30 bits).
+    """
+    packed = 0
+    for odd, even in schedule:
+        packed = (packed << 64) | (odd << 30) | even
+    return packed
+
+
+def unpack_schedule(packed):
+    """Inversa de pack_schedule."""
+    return tuple(((packed >> shift) >> 30 & 0x3FFFFFFFF, (packed >> shift) & 0x3FFFFFFF)
+                 for shift in range(960, -1, -64))
+
+
+def cached_schedule(key):
+    """
+    Igual que key_schedule, pero conserva las subllaves de las
+    SCHEDULE_CACHE_SIZE llaves usadas más recientemente, empaquetadas en un
+    entero cada una; pedir de nuevo una llave solo las desempaqueta.
+
+    :param key: Llave de 8 bytes.
+    """
+    key = bytes(key)
+    packed = _schedule_cache.get(key)
+    if packed is not None:
+        _schedule_cache.move_to_end(key)
+        return unpack_schedule(packed)
+    schedule = key_schedule(key)
+    _schedule_cache[key] = pack_schedule(schedule)
+    if len(_schedule_cache) > SCHEDULE_CACHE_SIZE:
+        _schedule_cache.popitem(last=False)
+    return schedule
+
+
+def has_odd_parity(key):
+    """Indica si cada byte de la llave tiene un número impar de bits en 1 (bits de paridad de DES)."""
+    return all(bin(byte).count("1") & 1 for byte in key)
+
+
+def crypt_int(block, schedule, _ip=_IP, _fp=_FP, _sp=(SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8)):
+    """
+    Cifra (o descifra, con las subllaves en orden inverso) un bloque de 64 bits.
+
+    L y R se llevan en la forma de 34 bits de _spread; las rondas se procesan
+    de dos en dos para no intercambiar L y R en cada una, y las permutaciones
+    inicial y final se aplican desenrolladas.
+
+    :param block: Bloque como entero de 64 bits.
+    :param schedule: Subllaves de key_schedule (invertidas para descifrar).
+    :return: Bloque resultante como entero de 64 bits.
+    """
+    sp1, sp2, sp3, sp4, sp5, sp6, sp7, sp8 = _sp
+    ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = _ip
+    block = (ip0[block >> 56] | ip1[(block >> 48) & 0xFF] | ip2[(block >> 40) & 0xFF] |
+             ip3[(block >> 32) & 0xFF] | ip4[(block >> 24) & 0xFF] | ip5[(block >> 16) & 0xFF] |
+             ip6[(block >> 8) & 0xFF] | ip7[block & 0xFF])
+    left, right = block >> 32, block & 0xFFFFFFFF
+    left = ((left & 1) << 33) | (left << 1) | (left >> 31)
+    right = ((right & 1) << 33) | (right << 1) | (right >> 31)
+    rounds = iter(schedule)
+    for k1, k2 in rounds:
+        odd = right ^ k1
+        even = right ^ k2
+        left ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+        k1, k2 = next(rounds)
+        odd = left ^ k1
+        even = left ^ k2
+        right ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+    left = (left >> 1) & 0xFFFFFFFF
+    right = (right >> 1) & 0xFFFFFFFF
+    # Tras la última ronda no hay intercambio: la salida es R16 || L16
+    fp0, fp1, fp2, fp3, fp4, fp5, fp6, fp7 = _fp
+    return (fp0[right >> 24] | fp1[(right >> 16) & 0xFF] | fp2[(right >> 8) & 0xFF] | fp3[right & 0xFF] |
+            fp4[left >> 24] | fp5[(left >> 16) & 0xFF] | fp6[(left >> 8) & 0xFF] | fp7[left & 0xFF])
+
+
+def crypt3_int(block, schedule, _ip=_IP, _fp=_FP, _sp=(SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8)):
+    """
+    Triple DES (EDE) de un bloque de 64 bits.
+
+    Entre dos etapas, la permutación final de una y la inicial de la siguiente
+    se cancelan, así que IP se aplica una sola vez al inicio, FP una sola vez
+    al final y las 48 rondas corren seguidas en la forma de 34 bits. Lo único
+    que queda de la frontera entre etapas es el intercambio de L y R: la etapa
+    de en medio se recorre con los papeles de L y R invertidos.
+
+    :param block: Bloque como entero de 64 bits.
+    :param schedule: 48 pares de subllaves (ver triple_schedule), invertidos para descifrar.
+    :return: Bloque resultante como entero de 64 bits.
+    """
+    sp1, sp2, sp3, sp4, sp5, sp6, sp7, sp8 = _sp
+    ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = _ip
+    block = (ip0[block >> 56] | ip1[(block >> 48) & 0xFF] | ip2[(block >> 40) & 0xFF] |
+             ip3[(block >> 32) & 0xFF] | ip4[(block >> 24) & 0xFF] | ip5[(block >> 16) & 0xFF] |
+             ip6[(block >> 8) & 0xFF] | ip7[block & 0xFF])
+    left, right = block >> 32, block & 0xFFFFFFFF
+    left = ((left & 1) << 33) | (left << 1) | (left >> 31)
+    right = ((right & 1) << 33) | (right << 1) | (right >> 31)
+    rounds = iter(schedule)
+    for k1, k2 in islice(rounds, 8):
+        odd = right ^ k1
+        even = right ^ k2
+        left ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+        k1, k2 = next(rounds)
+        odd = left ^ k1
+        even = left ^ k2
+        right ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+    # Segunda etapa: su L inicial es R16 de la primera y su R inicial es L16
+    for k1, k2 in islice(rounds, 8):
+        odd = left ^ k1
+        even = left ^ k2
+        right ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                  sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+        k1, k2 = next(rounds)
+        odd = right ^ k1
+        even = right ^ k2
+        left ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+    # Tercera etapa: el segundo intercambio devuelve L y R a su lugar
+    for k1, k2 in rounds:
+        odd = right ^ k1
+        even = right ^ k2
+        left ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                 sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+        k1, k2 = next(rounds)
+        odd = left ^ k1
+        even = left ^ k2
+        right ^= (sp1[odd >> 28] ^ sp2[(even >> 24) & 0x3F] ^ sp3[(odd >> 20) & 0x3F] ^ sp4[(even >> 16) & 0x3F] ^
+                  sp5[(odd >> 12) & 0x3F] ^ sp6[(even >> 8) & 0x3F] ^ sp7[(odd >> 4) & 0x3F] ^ sp8[even & 0x3F])
+    left = (left >> 1) & 0xFFFFFFFF
+    right = (right >> 1) & 0xFFFFFFFF
+    fp0, fp1, fp2, fp3, fp4, fp5, fp6, fp7 = _fp
+    return (fp0[right >> 24] | fp1[(right >> 16) & 0xFF] | fp2[(right >> 8) & 0xFF] | fp3[right & 0xFF] |
+            fp4[left >> 24] | fp5[(left >> 16) & 0xFF] | fp6[(left >> 8) & 0xFF] | fp7[left & 0xFF])
+
+
+def split_triple_key(key):
+    """
+    Separa una llave de triple DES en sus tres llaves de 8 bytes.
+
+    :param key: 16 bytes (K1 || K2, con K3 = K1) o 24 bytes (K1 || K2 || K3).
+    :return: Tupla (K1, K2, K3).
+    """
+    if len(key) == 16:
+        return key[:8], key[8:], key[:8]
+    if len(key) == 24:
+        return key[:8], key[8:16], key[16:]
+    raise ValueError("La clave de triple DES debe ser de 16 o 24 bytes.")
+
+
+def triple_schedule(first, second, third):
+    """
+    Une las subllaves de tres llaves (de key_schedule) en las 48 de crypt3_int:
+    cifrar con la primera, descifrar con la segunda y cifrar con la tercera.
+    """
+    return tuple(first) + tuple(second)[::-1] + tuple(third)
+
+
+class DESEngine:
+    # Función que aplica el cifrado a un bloque entero con las subllaves de schedule
+    crypt_int = staticmethod(crypt_int)
+
+    def __init__(self, key):
+        """
+        Motor de DES con las subllaves precalculadas.
+
+        :param key: Llave de 8 bytes.
+        """
+        round_keys = subkeys(key)
+        self._set_schedule(schedule_from_subkeys(round_keys), round_keys)
+
+    @classmethod
+    def from_subkeys(cls, round_keys):
+        """Crea el motor a partir de las 16 subllaves de 48 bits, sin repetir PC-1 y PC-2."""
+        round_keys = tuple(round_keys)
+        engine = cls.__new__(cls)
+        engine._set_schedule(schedule_from_subkeys(round_keys), round_keys)
+        return engine
+
+    @classmethod
+    def from_schedule(cls, schedule):
+        """Crea el motor a partir de las subllaves de key_schedule (o cached_schedule)."""
+        engine = cls.__new__(cls)
+        engine._set_schedule(tuple(schedule))
+        return engine
+
+    def _set_schedule(self, schedule, round_keys=None):
+        self.schedule = schedule
+        self.inverse_schedule = schedule[::-1]
+        self._round_keys = round_keys
+
+    @property
+    def round_keys(self):
+        """Subllaves de 48 bits (para el modo bitslice); se recuperan de schedule al usarse."""
+        if self._round_keys is None:
+            self._round_keys = subkeys_from_schedule(self.schedule)
+        return self._round_keys
+
+    def encrypt_block(self, block):
+        """Cifra un bloque de 8 bytes."""
+        return self.crypt_int(int.from_bytes(block, "big"), self.schedule).to_bytes(8, "big")
+
+    def decrypt_block(self, block):
+        """Descifra un bloque de 8 bytes."""
+        return self.crypt_int(int.from_bytes(block, "big"), self.inverse_schedule).to_bytes(8, "big")
+
+    def crypt_into(self, data, out, decrypt=False):
+        """
+        ECB sobre un búfer cuya longitud es múltiplo de 8 bytes, escribiendo en
+        out (un búfer escribible del mismo tamaño, que puede ser el mismo data).
+        Los bloques se leen y escriben con struct directamente sobre los
+        búferes, por tramos de SEGMENT_BLOCKS, sin crear bytes por bloque.
+        """
+        source, target = memoryview(data).cast("B"), memoryview(out).cast("B")
+        n_blocks, remainder = divmod(len(source), 8)
+        if remainder:
+            raise ValueError("La longitud de los datos debe ser múltiplo de 8 bytes.")
+        if len(target) != len(source):
+            raise ValueError("El búfer de salida debe tener la misma longitud que los datos.")
+        schedule = self.inverse_schedule if decrypt else self.schedule
+        crypt = self.crypt_int
+        for start in range(0, n_blocks, SEGMENT_BLOCKS):
+            count = min(SEGMENT_BLOCKS, n_blocks - start)
+            layout = f">{count}Q"
+            blocks = struct.unpack_from(layout, source, start * 8)
+            struct.pack_into(layout, target, start * 8, *[crypt(block, schedule) for block in blocks])
+
+    def encrypt(self, data):
+        """Cifra en modo ECB datos cuya longitud es múltiplo de 8 bytes."""
+        out = bytearray(len(data))
+        self.crypt_into(data, out)
+        return bytes(out)
+
+    def decrypt(self, data):
+        """Descifra en modo ECB datos cuya longitud es múltiplo de 8 bytes."""
+        out = bytearray(len(data))
+        self.crypt_into(data, out, decrypt=True)
+        return bytes(out)
+
+
+class TripleDESEngine(DESEngine):
+    crypt_int = staticmethod(crypt3_int)
+
+    def __init__(self, key):
+        """
+        Motor de triple DES (EDE) con las subllaves precalculadas.
+
+        :param key: 16 bytes (EDE2) o 24 bytes (EDE3); ver split_triple_key.
+        """
+        self._set_schedule(triple_schedule(*(key_schedule(k) for k in split_triple_key(key))))
+
+    @classmethod
+    def from_engines(cls, first, second, third):
+        """Crea el motor con las subllaves de tres motores DES, sin volver a calcularlas."""
+        return cls.from_schedule(triple_schedule(first.schedule, second.schedule, third.schedule))
@@ -0,0 +1,70 @@
+"""
+Cifrado de archivos con memoria acotada.
+
+Los archivos se leen con readinto en un búfer de FILE_CHUNK bytes y se cifran
+con encrypt_into en otro búfer, ambos reutilizados en cada trozo, así que la
+memoria no depende del tamaño del archivo. El formato es el de DES.encrypt:
+ECB con el relleno de DES.pad.
+"""
+# Tamaño de cada lectura (múltiplo de 8 bytes)
+FILE_CHUNK = 4 * 1024 * 1024
+
+
+def _check_chunk(chunk_size):
+    if chunk_size < 16 or chunk_size % 8:
+        raise ValueError("El tamaño de trozo debe ser un múltiplo de 8 de al menos 16 bytes.")
+
+
+def encrypt_file(des, src_path, dst_path, chunk_size=FILE_CHUNK):
+    """
+    Cifra el archivo src_path en dst_path.
+
+    :param des: Instancia de DES.
+    :return: Número de bytes escritos.
+    """
+    _check_chunk(chunk_size)
+    buffer, output = memoryview(bytearray(chunk_size)), memoryview(bytearray(chunk_size + 8))
+    written = pending = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            n = src.readinto(buffer[pending:])
+            if not n:
+                break
+            pending += n
+            if pending == chunk_size:
+                dst.write(output[:des.encrypt_into(buffer, output, padding=False)])
+                written += chunk_size
+                pending = 0
+        size = des.encrypt_into(buffer[:pending], output)
+        dst.write(output[:size])
+    return written + size
+
+
+def decrypt_file(des, src_path, dst_path, chunk_size=FILE_CHUNK):
+    """
+    Descifra el archivo src_path en dst_path.
+
+    El último bloque de cada trozo completo se guarda para el siguiente, de
+    modo que el relleno se quita solo del último bloque del archivo.
+
+    :param des: Instancia de DES.
+    :return: Número de bytes escritos.
+    """
+    _check_chunk(chunk_size)
+    buffer, output = memoryview(bytearray(chunk_size)), memoryview(bytearray(chunk_size))
+    written = pending = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            n = src.readinto(buffer[pending:])
+            if not n:
+                break
+            pending += n
+            if pending == chunk_size:
+                size = des.decrypt_into(buffer[:-8], output, padding=False)
+                dst.write(output[:size])
+                written += size
+                buffer[:8] = buffer[-8:]
+                pending = 8
+        size = des.decrypt_into(buffer[:pending], output)
+        dst.write(output[:size])
+    return written + size
@@ -0,0 +1,287 @@
+"""
+Modos de operación de DES como objetos incrementales.
+
+Cada objeto recibe los datos por partes con update(datos), que devuelve la
+salida disponible, y termina con finalize(), que devuelve el resto (el bloque
+con relleno en ECB y CBC). Entre llamadas solo se guarda menos de un bloque
+pendiente y el estado del modo, así que un archivo de varios gigabytes se
+procesa en memoria constante pasándolo por trozos.
+
+ECB, la parte paralela de CBC y CFB al descifrar y el flujo de llaves de CTR
+se calculan por lotes con DES._crypt_ecb, que usa el modo bitslice para lotes
+grandes. Los pasos encadenados (CBC y CFB al cifrar, OFB) van bloque por bloque
+con el motor sobre enteros.
+"""
+import struct
+
+_MASK64 = (1 << 64) - 1
+# Bytes de flujo de llaves que CTR calcula por lote dentro de un update
+CTR_SEGMENT = 2 * 1024 * 1024
+
+
+def _xor(a, b):
+    """XOR de dos cadenas de bytes de la misma longitud."""
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+
+def _check_iv(iv):
+    if len(iv) != 8:
+        raise ValueError("El vector de inicialización debe ser de 8 bytes.")
+    return bytes(iv)
+
+
+def check_nonce(nonce):
+    """Revisa que el nonce de CTR sea de a lo más 8 bytes y lo devuelve como bytes."""
+    if len(nonce) > 8:
+        raise ValueError("El nonce debe ser de a lo más 8 bytes.")
+    return bytes(nonce)
+
+
+def counter_blocks(nonce, first, last):
+    """
+    Bloques contador first a last - 1 de CTR: nonce || i, con i en big endian
+    en los 8 - len(nonce) bytes restantes. Con un nonce de 8 bytes (o vacío)
+    el contador ocupa todo el bloque y se incrementa módulo 2^64.
+    """
+    base = int.from_bytes(nonce.ljust(8, b"\0"), "big")
+    if 0 < len(nonce) < 8 and last > 1 << (64 - 8 * len(nonce)):
+        raise OverflowError("El contador de CTR se desbordó hacia el nonce.")
+    if base + last <= _MASK64 + 1:
+        values = range(base + first, base + last)
+    else:
+        values = [(base + i) & _MASK64 for i in range(first, last)]
+    return struct.pack(f">{last - first}Q", *values)
+
+
+class _Mode:
+    """Base de los modos: una sola llamada a finalize cierra el objeto."""
+
+    def __init__(self, des):
+        self._des = des
+        self._finalized = False
+
+    def update(self, data):
+        """
+        Procesa una parte de los datos.
+
+        :param data: Objeto tipo bytes (bytes, bytearray, memoryview, ...).
+        :return: Bytes de salida disponibles hasta ahora.
+        """
+        if self._finalized:
+            raise ValueError("El objeto ya fue finalizado.")
+        return self._update(bytes(data))
+
+    def finalize(self):
+        """Termina el procesamiento y devuelve la salida restante."""
+        if self._finalized:
+            raise ValueError("El objeto ya fue finalizado.")
+        self._finalized = True
+        return self._finalize()
+
+    def _finalize(self):
+        return b""
+
+
+class _BlockMode(_Mode):
+    """Modos que trabajan con bloques completos y relleno (ECB y CBC)."""
+
+    def __init__(self, des, decrypt, padding):
+        super().__init__(des)
+        self._decrypt = decrypt
+        self._padding = padding
+        self._buffer = b""
+
+    def _update(self, data):
+        data = self._buffer + data
+        n = len(data) - len(data) % 8
+        if self._decrypt and self._padding and n and n == len(data):
+            n -= 8  # El último bloque se guarda para quitarle el relleno en finalize
+        self._buffer = data[n:]
+        return self._process(data[:n]) if n else b""
+
+    def _finalize(self):
+        if self._padding and not self._decrypt:
+            return self._process(self._des.pad(self._buffer))
+        if self._padding:
+            if len(self._buffer) != 8:
+                raise ValueError("La longitud del texto cifrado debe ser múltiplo de 8 bytes.")
+            return self._des.unpad(self._process(self._buffer))
+        if self._buffer:
+            raise ValueError("Sin relleno, la longitud de los datos debe ser múltiplo de 8 bytes.")
+        return b""
+
+
+class ECB(_BlockMode):
+    def __init__(self, des, decrypt=False, padding=True):
+        """
+        Modo ECB incremental.
+
+        :param des: Instancia de DES o TripleDES.
+        :param decrypt: Si es True, descifra.
+        :param padding: Si es True, agrega (o quita) el relleno de DES.pad.
+        """
+        super().__init__(des, decrypt, padding)
+
+    def _process(self, blocks):
+        return self._des._crypt_ecb(blocks, self._decrypt)
+
+
+class CBC(_BlockMode):
+    def __init__(self, des, iv, decrypt=False, padding=True):
+        """
+        Modo CBC incremental.
+
+        :param des: Instancia de DES o TripleDES.
+        :param iv: Vector de inicialización de 8 bytes.
+        :param decrypt: Si es True, descifra.
+        :param padding: Si es True, agrega (o quita) el relleno de DES.pad.
+        """
+        super().__init__(des, decrypt, padding)
+        self._previous = _check_iv(iv)
+
+    def _process(self, blocks):
+        if self._decrypt:
+            # P_i = D(C_i) ^ C_{i-1}: todos los D(C_i) se calculan en un lote
+            plaintext = _xor(self._des._crypt_ecb(blocks, decrypt=True), self._previous + blocks[:-8])
+            self._previous = blocks[-8:]
+            return plaintext
+        layout = f">{len(blocks) // 8}Q"
+        engine = self._des.engine
+        crypt, schedule = engine.crypt_int, engine.schedule
+        previous = int.from_bytes(self._previous, "big")
+        output = []
+        for block in struct.unpack(layout, blocks):
+            previous = crypt(block ^ previous, schedule)
+            output.append(previous)
+        ciphertext = struct.pack(layout, *output)
+        self._previous = ciphertext[-8:]
+        return ciphertext
+
+
+class CTR(_Mode):
+    def __init__(self, des, nonce):
+        """
+        Modo CTR incremental; cifrar y descifrar son la misma operación.
+
+        Los bloques contador son los de counter_blocks; con un nonce de 8
+        bytes, el nonce es el bloque contador inicial.
+
+        :param des: Instancia de DES o TripleDES.
+        :param nonce: De 0 a 8 bytes.
+        """
+        super().__init__(des)
+        self._nonce = check_nonce(nonce)
+        self._position = 0
+
+    @property
+    def position(self):
+        """Posición actual en bytes dentro del flujo de llaves."""
+        return self._position
+
+    def seek(self, offset):
+        """
+        Mueve la posición del flujo de llaves al byte 'offset', de modo que el
+        siguiente update cifra los datos como si estuvieran en esa posición.
+        Así cada proceso puede cifrar un rango distinto de un mismo mensaje.
+        """
+        if offset < 0:
+            raise ValueError("La posición debe ser no negativa.")
+        self._position = offset
+
+    def keystream(self, offset, length):
+        """Bytes [offset, offset + length) del flujo de llaves."""
+        first, last = offset // 8, (offset + length + 7) // 8
+        start = offset % 8
+        return self._des._crypt_ecb(counter_blocks(self._nonce, first, last))[start:start + length]
+
+    def _update(self, data):
+        parts = []
+        for start in range(0, len(data), CTR_SEGMENT):
+            chunk = data[start:start + CTR_SEGMENT]
+            parts.append(_xor(chunk, self.keystream(self._position, len(chunk))))
+            self._position += len(chunk)
+        return b"".join(parts)
+
+
+class OFB(_Mode):
+    def __init__(self, des, iv):
+        """
+        Modo OFB incremental; cifrar y descifrar son la misma operación.
+
+        :param des: Instancia de DES o TripleDES.
+        :param iv: Vector de inicialización de 8 bytes.
+        """
+        super().__init__(des)
+        self._register = int.from_bytes(_check_iv(iv), "big")
+        self._pending = b""  # Flujo de llaves sin usar del bloque actual
+
+    def _update(self, data):
+        n_blocks = -(-(len(data) - len(self._pending)) // 8)
+        engine = self._des.engine
+        crypt, schedule = engine.crypt_int, engine.schedule
+        register = self._register
+        output = []
+        for _ in range(n_blocks):
+            register = crypt(register, schedule)
+            output.append(register)
+        self._register = register
+        keystream = self._pending + struct.pack(f">{len(output)}Q", *output)
+        self._pending = keystream[len(data):]
+        return _xor(data, keystream[:len(data)])
+
+
+class CFB(_Mode):
+    def __init__(self, des, iv, decrypt=False):
+        """
+        Modo CFB de 64 bits incremental; el último segmento puede ser parcial.
+
+        :param des: Instancia de DES o TripleDES.
+        :param iv: Vector de inicialización de 8 bytes.
+        :param decrypt: Si es True, descifra.
+        """
+        super().__init__(des)
+        self._decrypt = decrypt
+        self._feedback = _check_iv(iv)  # Último bloque cifrado completo
+        self._keystream = None  # E(feedback) mientras hay un bloque a medias
+        self._segment = b""  # Bytes cifrados del bloque a medias
+
+    def _finish_segment(self, data):
+        """Completa el bloque a medias con el inicio de data; devuelve la salida y lo que sobra."""
+        if self._keystream is None:
+            self._keystream = self._des.engine.encrypt_block(self._feedback)
+        offset = len(self._segment)
+        head = data[:8 - offset]
+        output = _xor(head, self._keystream[offset:offset + len(head)])
+        self._segment += head if self._decrypt else output
+        if len(self._segment) == 8:
+            self._feedback, self._segment, self._keystream = self._segment, b"", None
+        return output, data[len(head):]
+
+    def _update(self, data):
+        parts = []
+        if self._segment:
+            output, data = self._finish_segment(data)
+            parts.append(output)
+        n = len(data) - len(data) % 8
+        if n:
+            blocks = data[:n]
+            if self._decrypt:
+                # P_i = C_i ^ E(C_{i-1}): todos los E(C_{i-1}) se calculan en un lote
+                parts.append(_xor(blocks, self._des._crypt_ecb(self._feedback + blocks[:-8])))
+                self._feedback = blocks[-8:]
+            else:
+                layout = f">{n // 8}Q"
+                engine = self._des.engine
+                crypt, schedule = engine.crypt_int, engine.schedule
+                feedback = int.from_bytes(self._feedback, "big")
+                output = []
+                for block in struct.unpack(layout, blocks):
+                    feedback = crypt(feedback, schedule) ^ block
+                    output.append(feedback)
+                ciphertext = struct.pack(layout, *output)
+                self._feedback = ciphertext[-8:]
+                parts.append(ciphertext)
+        if n < len(data):
+            output, _ = self._finish_segment(data[n:])
+            parts.append(output)
+        return b"".join(parts)
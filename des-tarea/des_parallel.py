@@ -0,0 +1,216 @@
+"""
+Cifrado DES en paralelo con varios procesos (ECB y CTR).
+
+La entrada se copia (o se lee del archivo) a un bloque de memoria compartida
+y se divide en trozos de chunk_size bytes; cada proceso del grupo transforma
+sus trozos en sitio, así que por la cola de tareas solo viajan el nombre de la
+memoria compartida y los límites de cada trozo. Las subllaves se calculan una
+sola vez en el proceso principal y se entregan a cada trabajador al iniciarlo.
+Como ECB y CTR tratan cada bloque de forma independiente, el resultado es
+idéntico byte a byte al de DES.encrypt_into y DES.ctr.
+"""
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from DES import BITSLICE_MIN_BLOCKS
+from des_modes import check_nonce, counter_blocks
+
+# Bytes de cada tarea; el modo bitslice rinde mejor con trozos de un par de MB
+PARALLEL_CHUNK = 2 * 1024 * 1024
+
+# Motores del proceso trabajador, creados por _init_worker
+_engines = {}
+
+
+def _init_worker(engine_class, round_keys):
+    """
+    Crea los motores del trabajador a partir de las subllaves del proceso
+    principal; engine_class es DESEngine o TripleDESEngine.
+    """
+    _engines["integer"] = engine_class.from_subkeys(round_keys)
+    try:
+        from des_bitslice import BitsliceEngine
+    except ImportError:
+        _engines["bitslice"] = None
+    else:
+        _engines["bitslice"] = BitsliceEngine.from_subkeys(round_keys)
+
+
+def _engine_for(n_blocks):
+    bitslice = _engines["bitslice"]
+    if bitslice is not None and n_blocks >= BITSLICE_MIN_BLOCKS:
+        return bitslice
+    return _engines["integer"]
+
+
+def _ecb_task(name, start, end, decrypt):
+    """Cifra (o descifra) en sitio el rango [start, end) de la memoria compartida."""
+    shm = SharedMemory(name=name)
+    view = shm.buf[start:end]
+    try:
+        _engine_for((end - start) // 8).crypt_into(view, view, decrypt)
+    finally:
+        view.release()
+        shm.close()
+
+
+def _ctr_task(name, start, end, nonce, offset):
+    """
+    Aplica en sitio CTR al rango [start, end) de la memoria compartida, que
+    corresponde a la posición offset + start del flujo de llaves (múltiplo de 8).
+    """
+    shm = SharedMemory(name=name)
+    view = shm.buf[start:end]
+    try:
+        first = (offset + start) // 8
+        keystream = bytearray(counter_blocks(nonce, first, first + (end - start + 7) // 8))
+        _engine_for(len(keystream) // 8).crypt_into(keystream, keystream)
+        n = end - start
+        view[:] = (int.from_bytes(view, "big") ^ int.from_bytes(keystream[:n], "big")).to_bytes(n, "big")
+    finally:
+        view.release()
+        shm.close()
+
+
+def _read_full(f, view):
+    """Llena view con el archivo f (readinto puede devolver lecturas parciales)."""
+    filled = 0
+    while filled < len(view):
+        n = f.readinto(view[filled:])
+        if not n:
+            raise EOFError("El archivo terminó antes de lo esperado.")
+        filled += n
+
+
+class ParallelDES:
+    def __init__(self, des, processes=None, chunk_size=PARALLEL_CHUNK):
+        """
+        Cifrador DES que reparte el trabajo entre varios procesos.
+
+        El grupo de procesos se crea al primer uso y se reutiliza; se cierra
+        con close() o al salir de un bloque with.
+
+        :param des: Instancia de DES o TripleDES.
+        :param processes: Número de procesos (por defecto, os.cpu_count()).
+        :param chunk_size: Bytes por tarea (múltiplo de 8).
+        """
+        if chunk_size <= 0 or chunk_size % 8:
+            raise ValueError("El tamaño de trozo debe ser un múltiplo positivo de 8 bytes.")
+        self.des = des
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Termina los procesos trabajadores."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _run(self, shm, length, task, *args):
+        """Reparte [0, length) de la memoria compartida en trozos y espera a que terminen."""
+        if self._pool is None:
+            engine = self.des.engine
+            self._pool = Pool(self.processes, initializer=_init_worker, initargs=(type(engine), engine.round_keys))
+        chunk = self.chunk_size
+        self._pool.starmap(task, [(shm.name, start, min(start + chunk, length)) + args
+                                  for start in range(0, length, chunk)])
+
+    def _transform(self, data, task, *args, padding=None):
+        """
+        Copia data a memoria compartida, la transforma con task y devuelve el
+        resultado. Con padding='add' agrega el relleno de DES.pad antes; con
+        padding='remove' lo quita después.
+        """
+        source = memoryview(data).cast("B")
+        length = len(source)
+        size = self.des.output_size(length) if padding == "add" else length
+        shm = SharedMemory(create=True, size=max(size, 1))
+        try:
+            shm.buf[:length] = source
+            if padding == "add":
+                full = length - length % 8
+                shm.buf[full:size] = self.des.pad(bytes(source[full:]))
+            self._run(shm, size, task, *args)
+            if padding == "remove":
+                size -= self.des.padding_length(shm.buf[size - 8:size])
+            return bytes(shm.buf[:size])
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def encrypt(self, data, padding=True):
+        """Cifra en modo ECB un objeto con protocolo de búfer; igual que DES.encrypt_into."""
+        if not padding and len(memoryview(data).cast("B")) % 8:
+            raise ValueError("Sin relleno, la longitud de los datos debe ser múltiplo de 8 bytes.")
+        return self._transform(data, _ecb_task, False, padding="add" if padding else None)
+
+    def decrypt(self, data, padding=True):
+        """Descifra en modo ECB un objeto con protocolo de búfer; igual que DES.decrypt_into."""
+        length = len(memoryview(data).cast("B"))
+        if length % 8 or (padding and not length):
+            raise ValueError("La longitud del texto cifrado debe ser un múltiplo positivo de 8 bytes.")
+        return self._transform(data, _ecb_task, True, padding="remove" if padding else None)
+
+    def ctr(self, nonce, data):
+        """Cifra o descifra en modo CTR desde el inicio del flujo de llaves; igual que DES.ctr(nonce)."""
+        return self._transform(data, _ctr_task, check_nonce(nonce), 0)
+
+    def _transform_file(self, src_path, dst_path, task, *args, mode):
+        """
+        Procesa un archivo por ventanas de processes * chunk_size bytes en una
+        sola memoria compartida, de modo que la memoria no depende del tamaño
+        del archivo. mode es 'encrypt', 'decrypt' (ECB con relleno) o 'ctr'.
+
+        :return: Número de bytes escritos.
+        """
+        size = os.path.getsize(src_path)
+        if mode == "decrypt" and (size % 8 or not size):
+            raise ValueError("La longitud del texto cifrado debe ser un múltiplo positivo de 8 bytes.")
+        window = self.processes * self.chunk_size
+        shm = SharedMemory(create=True, size=window + 8)
+        written = 0
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                position = 0
+                while True:
+                    n = min(window, size - position)
+                    _read_full(src, shm.buf[:n])
+                    last = position + n == size
+                    length = n
+                    if last and mode == "encrypt":
+                        full = n - n % 8
+                        length = full + 8
+                        shm.buf[full:length] = self.des.pad(bytes(shm.buf[full:n]))
+                    self._run(shm, length, task, *(args + ((position,) if mode == "ctr" else ())))
+                    if last and mode == "decrypt":
+                        length -= self.des.padding_length(shm.buf[length - 8:length])
+                    dst.write(shm.buf[:length])
+                    written += length
+                    position += n
+                    if last:
+                        break
+        finally:
+            shm.close()
+            shm.unlink()
+        return written
+
+    def encrypt_file(self, src_path, dst_path):
+        """Cifra un archivo en ECB con relleno; mismo formato que des_files.encrypt_file."""
+        return self._transform_file(src_path, dst_path, _ecb_task, False, mode="encrypt")
+
+    def decrypt_file(self, src_path, dst_path):
+        """Descifra un archivo en ECB con relleno; mismo formato que des_files.decrypt_file."""
+        return self._transform_file(src_path, dst_path, _ecb_task, True, mode="decrypt")
+
+    def ctr_file(self, nonce, src_path, dst_path):
+        """Cifra o descifra un archivo en modo CTR."""
+        return self._transform_file(src_path, dst_path, _ctr_task, check_nonce(nonce), mode="ctr")
@@ -0,0 +1,403 @@
+"""
+Servicio local de cifrado DES y triple DES sobre asyncio.
+
+Varios procesos que comparten llaves se conectan por un socket Unix o por TCP
+en localhost. El servicio conserva los objetos DES y TripleDES de las llaves
+usadas más recientemente (con sus subllaves y tablas ya calculadas) y junta
+las peticiones pequeñas que llegan al mismo tiempo para una misma llave y
+operación en un solo lote: el lote se cifra cuando pasan 'linger' segundos
+desde su primera petición o cuando junta 'max_batch' bloques, lo que ocurra
+primero. Con NumPy cada lote es una sola llamada a encrypt_blocks.
+
+Cada petición es un mensaje cifrado en modo ECB con el relleno de DES.pad,
+igual que DES.encrypt_into y DES.decrypt_into.
+
+Protocolo (enteros en big endian):
+
+- Petición: id (4 bytes), operación (1), longitud de la llave (1), longitud
+  de los datos (4), la llave y los datos. La llave es de 8 bytes (DES) o de
+  16 o 24 (triple DES).
+- Respuesta: id (4 bytes), estado (1; 0 = bien, 1 = error), longitud (4) y
+  el resultado, o el mensaje de error en UTF-8. Para OP_METRICS el resultado
+  son las métricas en JSON.
+
+Las respuestas de una conexión pueden llegar en otro orden que las peticiones.
+"""
+import asyncio
+import json
+import struct
+import time
+from collections import OrderedDict, deque
+
+from DES import DES, TripleDES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OP_ENCRYPT = 1
+OP_DECRYPT = 2
+OP_METRICS = 3
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_REQUEST = struct.Struct(">IBBI")
+_RESPONSE = struct.Struct(">IBI")
+
+# Bloques por lote por defecto; un lote se cifra en cuanto los junta
+DEFAULT_MAX_BATCH = 4096
+# Segundos que un lote espera más peticiones desde que llega la primera
+DEFAULT_LINGER = 0.002
+# Número de llaves cuyos objetos DES o TripleDES se conservan
+SERVICE_KEY_CACHE_SIZE = 1024
+# Latencias recientes con las que se calculan los percentiles de las métricas
+LATENCY_WINDOW = 10000
+# Tamaño máximo de los datos de una petición
+MAX_MESSAGE = 16 * 1024 * 1024
+# Bloques a partir de los cuales un lote usa encrypt_blocks en lugar del motor sobre enteros
+VECTOR_MIN_BLOCKS = 16
+
+
+class _Batch:
+    """Peticiones pendientes de una misma llave y operación."""
+
+    def __init__(self):
+        self.parts = []
+        self.futures = []
+        self.blocks = 0
+        self.timer = None
+
+
+def _crypt(cipher, data, decrypt):
+    """
+    ECB sin relleno sobre todo un lote: encrypt_blocks si hay NumPy y el lote
+    tiene al menos VECTOR_MIN_BLOCKS bloques, y _crypt_ecb en otro caso.
+    """
+    if np is None or len(data) // 8 < VECTOR_MIN_BLOCKS:
+        return cipher._crypt_ecb(data, decrypt)
+    blocks = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+    result = cipher.decrypt_blocks(blocks) if decrypt else cipher.encrypt_blocks(blocks)
+    return result.astype(">u8").tobytes()
+
+
+class DESService:
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, linger=DEFAULT_LINGER):
+        """
+        Servicio de cifrado con agrupación de peticiones.
+
+        :param max_batch: Bloques a partir de los cuales un lote se cifra sin esperar.
+        :param linger: Segundos que espera un lote desde su primera petición.
+        """
+        if max_batch < 1 or linger < 0:
+            raise ValueError("max_batch debe ser positivo y linger no negativo.")
+        self.max_batch = max_batch
+        self.linger = linger
+        self._ciphers = OrderedDict()
+        self._batches = {}
+        self._servers = []
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._started = time.perf_counter()
+        self._requests = 0
+        self._errors = 0
+        self._batch_count = 0
+        self._batched_requests = 0
+        self._blocks = 0
+        self._bytes = 0
+
+    def cipher(self, key):
+        """
+        Objeto DES (llave de 8 bytes) o TripleDES (16 o 24 bytes) de la llave,
+        reutilizado entre peticiones mientras esté entre las
+        SERVICE_KEY_CACHE_SIZE llaves usadas más recientemente.
+        """
+        key = bytes(key)
+        cipher = self._ciphers.get(key)
+        if cipher is not None:
+            self._ciphers.move_to_end(key)
+            return cipher
+        if len(key) == 8:
+            cipher = DES(key)
+        elif len(key) in (16, 24):
+            cipher = TripleDES(key)
+        else:
+            raise ValueError("La clave debe ser de 8, 16 o 24 bytes.")
+        self._ciphers[key] = cipher
+        if len(self._ciphers) > SERVICE_KEY_CACHE_SIZE:
+            self._ciphers.popitem(last=False)
+        return cipher
+
+    async def submit(self, op, key, data):
+        """
+        Cifra o descifra un mensaje, agrupándolo con las demás peticiones
+        pendientes de la misma llave y operación.
+
+        :param op: OP_ENCRYPT u OP_DECRYPT.
+        :return: Texto cifrado con relleno, o texto claro sin él.
+        """
+        start = time.perf_counter()
+        self._requests += 1
+        try:
+            if op not in (OP_ENCRYPT, OP_DECRYPT):
+                raise ValueError(f"Operación desconocida: {op}.")
+            cipher = self.cipher(key)
+            decrypt = op == OP_DECRYPT
+            data = bytes(data)
+            if decrypt and (len(data) % 8 or not data):
+                raise ValueError("La longitud del texto cifrado debe ser un múltiplo positivo de 8 bytes.")
+            future = asyncio.get_running_loop().create_future()
+            self._add(cipher, bytes(key), decrypt, data if decrypt else cipher.pad(data), future)
+            return await future
+        except Exception:
+            self._errors += 1
+            raise
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+
+    def _add(self, cipher, key, decrypt, payload, future):
+        batch_key = (key, decrypt)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = self._batches[batch_key] = _Batch()
+            batch.timer = asyncio.get_running_loop().call_later(self.linger, self._flush, batch_key, cipher)
+        batch.parts.append(payload)
+        batch.futures.append(future)
+        batch.blocks += len(payload) // 8
+        if batch.blocks >= self.max_batch:
+            self._flush(batch_key, cipher)
+
+    def _flush(self, batch_key, cipher):
+        """Cifra un lote completo y reparte los resultados entre sus peticiones."""
+        batch = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        decrypt = batch_key[1]
+        try:
+            output = _crypt(cipher, b"".join(batch.parts), decrypt)
+        except Exception as error:
+            # Sin esto, las peticiones del lote esperarían para siempre
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self._batch_count += 1
+        self._batched_requests += len(batch.futures)
+        self._blocks += batch.blocks
+        self._bytes += len(output)
+        position = 0
+        for part, future in zip(batch.parts, batch.futures):
+            result = output[position:position + len(part)]
+            position += len(part)
+            if future.done():
+                continue  # La petición se canceló mientras esperaba
+            if not decrypt:
+                future.set_result(result)
+                continue
+            try:
+                future.set_result(result[:-cipher.padding_length(result)])
+            except ValueError as error:
+                future.set_exception(error)
+
+    def metrics(self):
+        """
+        Métricas desde que se creó el servicio: peticiones, errores, lotes,
+        peticiones y bloques por lote, percentiles de latencia (de las últimas
+        LATENCY_WINDOW peticiones) y rendimiento.
+        """
+        uptime = time.perf_counter() - self._started
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            return 1000 * latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+        batches = self._batch_count
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "batches": batches,
+            "requests_per_batch": self._batched_requests / batches if batches else 0.0,
+            "blocks_per_batch": self._blocks / batches if batches else 0.0,
+            "latency_p50_ms": percentile(0.5),
+            "latency_p99_ms": percentile(0.99),
+            "latency_max_ms": 1000 * latencies[-1] if latencies else 0.0,
+            "requests_per_sec": self._requests / uptime,
+            "mb_per_s": self._bytes / uptime / 1e6,
+            "uptime_s": uptime,
+            "keys": len(self._ciphers),
+        }
+
+    async def start_unix(self, path):
+        """Empieza a atender conexiones en el socket Unix 'path'."""
+        self._servers.append(await asyncio.start_unix_server(self._handle, path=path))
+
+    async def start_tcp(self, host="127.0.0.1", port=0):
+        """
+        Empieza a atender conexiones TCP; con port=0 el sistema elige el puerto.
+
+        :return: Puerto en el que escucha.
+        """
+        server = await asyncio.start_server(self._handle, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Deja de aceptar conexiones."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    async def _handle(self, reader, writer):
+        """Atiende una conexión; cada petición se procesa en su propia tarea."""
+        tasks = set()
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+                request_id, op, key_length, data_length = _REQUEST.unpack(header)
+                if data_length > MAX_MESSAGE:
+                    writer.write(_error(request_id, "El mensaje es demasiado grande."))
+                    await writer.drain()
+                    break
+                key = await reader.readexactly(key_length)
+                data = await reader.readexactly(data_length)
+                task = asyncio.ensure_future(self._respond(writer, request_id, op, key, data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, request_id, op, key, data):
+        try:
+            if op == OP_METRICS:
+                result = json.dumps(self.metrics()).encode("utf-8")
+            else:
+                result = await self.submit(op, key, data)
+        except Exception as error:
+            response = _error(request_id, str(error) or type(error).__name__)
+        else:
+            response = _RESPONSE.pack(request_id, STATUS_OK, len(result)) + result
+        if writer.is_closing():
+            return
+        writer.write(response)
+        try:
+            # Si el cliente lee despacio, se espera en lugar de acumular respuestas en memoria
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+def _error(request_id, message):
+    message = message.encode("utf-8")
+    return _RESPONSE.pack(request_id, STATUS_ERROR, len(message)) + message
+
+
+class DESClient:
+    def __init__(self, reader, writer):
+        """
+        Cliente del servicio. Se crea con connect_unix o connect_tcp; varias
+        peticiones pueden estar pendientes a la vez sobre la misma conexión.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._pending = {}
+        self._next_id = 0
+        self._reader_task = asyncio.ensure_future(self._read_responses())
+
+    @classmethod
+    async def connect_unix(cls, path):
+        return cls(*await asyncio.open_unix_connection(path))
+
+    @classmethod
+    async def connect_tcp(cls, host="127.0.0.1", port=0):
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def encrypt(self, key, data):
+        """Cifra data (con relleno) con la llave de 8, 16 o 24 bytes."""
+        return await self._request(OP_ENCRYPT, key, data)
+
+    async def decrypt(self, key, data):
+        """Descifra data y le quita el relleno."""
+        return await self._request(OP_DECRYPT, key, data)
+
+    async def metrics(self):
+        """Métricas del servicio (ver DESService.metrics)."""
+        return json.loads(await self._request(OP_METRICS, b"", b""))
+
+    async def close(self):
+        self._writer.close()
+        await self._reader_task
+
+    async def _request(self, op, key, data):
+        key, data = bytes(key), bytes(data)
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(_REQUEST.pack(request_id, op, len(key), len(data)) + key + data)
+        return await future
+
+    async def _read_responses(self):
+        try:
+            while True:
+                header = await self._reader.readexactly(_RESPONSE.size)
+                request_id, status, length = _RESPONSE.unpack(header)
+                payload = await self._reader.readexactly(length)
+                future = self._pending.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if status == STATUS_OK:
+                    future.set_result(payload)
+                else:
+                    future.set_exception(ValueError(payload.decode("utf-8")))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Se cerró la conexión con el servicio."))
+            self._pending.clear()
+
+
+async def _serve(args):
+    service = DESService(args.max_batch, args.linger)
+    if args.unix:
+        await service.start_unix(args.unix)
+        print(f"Escuchando en {args.unix}")
+    else:
+        port = await service.start_tcp(args.host, args.port)
+        print(f"Escuchando en {args.host}:{port}")
+    try:
+        while True:
+            await asyncio.sleep(args.report or 3600)
+            if args.report:
+                print(json.dumps(service.metrics()))
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servicio local de cifrado DES y triple DES.")
+    parser.add_argument("--unix", default=None, help="Ruta del socket Unix (si no se da, se usa TCP).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="Bloques a partir de los cuales un lote se cifra sin esperar.")
+    parser.add_argument("--linger", type=float, default=DEFAULT_LINGER,
+                        help="Segundos que un lote espera más peticiones.")
+    parser.add_argument("--report", type=float, default=0,
+                        help="Cada cuántos segundos imprimir las métricas (0 = nunca).")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
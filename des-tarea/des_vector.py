@@ -0,0 +1,119 @@
+"""
+DES vectorizado con NumPy sobre arreglos de bloques.
+
+Cada bloque es un elemento de un arreglo de uint64 (el bloque como entero de
+64 bits, con el primer byte en los bits más significativos). Se hacen los
+mismos pasos que crypt_int de des_engine, pero cada uno es una operación de
+NumPy sobre todos los bloques: las permutaciones IP e IP^-1 son ocho
+consultas a las tablas por byte, la expansión E es pasar R a la forma de 34
+bits de des_engine._spread con corrimientos, y las S-boxes fusionadas con P
+son consultas a tablas con np.take.
+
+Las tablas SP de des_engine se juntan de dos en dos: en la forma de 34 bits,
+los grupos de 6 bits de S1 y S3 quedan a 14 bits de distancia en el entero
+impar (lo mismo S5 y S7, y S2 y S4, y S6 y S8 en el par), así que un solo
+campo de 14 bits indexa una tabla con la suma de ambas S-boxes. Cada ronda
+hace 4 consultas en lugar de 8; las cuatro tablas ocupan 512 KB.
+
+A diferencia del modo bitslice, no hay que transponer los bloques, así que
+también conviene con lotes de unos cientos de bloques.
+"""
+import numpy as np
+
+from des_engine import SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8, _FP, _IP
+
+# Bloques que se procesan juntos; acota la memoria de los arreglos intermedios
+VECTOR_CHUNK = 1 << 14
+
+_IP_TABLES = np.array(_IP, dtype=np.uint64)
+_FP_TABLES = np.array(_FP, dtype=np.uint64)
+
+
+def _paired_table(high, low):
+    """
+    Tabla de 2^14 entradas para un campo de 14 bits cuyos 6 bits altos van a
+    la S-box 'high' y los 6 bajos a 'low' (los 2 de en medio no cuentan).
+    """
+    index = np.arange(1 << 14)
+    return (np.array(high, dtype=np.uint64)[index >> 8] ^
+            np.array(low, dtype=np.uint64)[index & 0x3F])
+
+
+# S1 y S3 en los bits 33-20 del entero impar, S5 y S7 en los bits 17-4;
+# S2 y S4 en los bits 29-16 del entero par, S6 y S8 en los bits 13-0
+_SP13 = _paired_table(SP1, SP3)
+_SP57 = _paired_table(SP5, SP7)
+_SP24 = _paired_table(SP2, SP4)
+_SP68 = _paired_table(SP6, SP8)
+
+
+def _permute64(tables, x):
+    """Aplica una permutación de 64 bits dada por sus tablas por byte a cada elemento de x."""
+    out = np.zeros_like(x)
+    for j, table in enumerate(tables):
+        out |= table.take((x >> np.uint64(56 - 8 * j)) & np.uint64(0xFF))
+    return out
+
+
+def crypt_blocks(blocks, schedule):
+    """
+    Cifra (o descifra, con las subllaves en orden inverso) un arreglo de bloques.
+
+    :param blocks: Arreglo de uint64, un bloque por elemento.
+    :param schedule: Subllaves de des_engine.key_schedule (16 pares) o de
+                     triple_schedule (48 pares).
+    :return: Arreglo nuevo de uint64 con los bloques resultantes.
+    """
+    mask32, mask14 = np.uint64(0xFFFFFFFF), np.uint64(0x3FFF)
+    one, n31, n32, n33 = np.uint64(1), np.uint64(31), np.uint64(32), np.uint64(33)
+    n4, n16, n20 = np.uint64(4), np.uint64(16), np.uint64(20)
+    sp13, sp57, sp24, sp68 = _SP13, _SP57, _SP24, _SP68
+    keys = [(np.uint64(odd), np.uint64(even)) for odd, even in schedule]
+
+    x = _permute64(_IP_TABLES, blocks)
+    left, right = x >> n32, x & mask32
+    left = ((left & one) << n33) | (left << one) | (left >> n31)
+    right = ((right & one) << n33) | (right << one) | (right >> n31)
+    for n, (k1, k2) in enumerate(keys):
+        if n and not n % 16:
+            # Frontera entre etapas de triple DES: IP^-1 e IP se cancelan
+            left, right = right, left
+        odd = right ^ k1
+        even = right ^ k2
+        f = sp13.take(odd >> n20)
+        f ^= sp57.take((odd >> n4) & mask14)
+        f ^= sp24.take((even >> n16) & mask14)
+        f ^= sp68.take(even & mask14)
+        left, right = right, left ^ f
+    left = (left >> one) & mask32
+    right = (right >> one) & mask32
+    return _permute64(_FP_TABLES, (right << n32) | left)
+
+
+class VectorEngine:
+    def __init__(self, engine):
+        """
+        Motor vectorizado que usa las subllaves de un motor sobre enteros.
+
+        :param engine: DESEngine o TripleDESEngine.
+        """
+        self.schedule = engine.schedule
+        self.inverse_schedule = engine.inverse_schedule
+
+    def crypt_blocks(self, blocks, decrypt=False):
+        """
+        Cifra (o descifra) un arreglo de bloques por tramos de VECTOR_CHUNK.
+
+        :param blocks: Arreglo unidimensional de uint64 (o convertible a uint64).
+        :return: Arreglo nuevo de uint64 con el resultado.
+        """
+        blocks = np.asarray(blocks)
+        if blocks.ndim != 1:
+            raise ValueError("Los bloques deben estar en un arreglo unidimensional.")
+        if blocks.dtype != np.uint64:
+            blocks = blocks.astype(np.uint64)
+        schedule = self.inverse_schedule if decrypt else self.schedule
+        out = np.empty_like(blocks)
+        for start in range(0, len(blocks), VECTOR_CHUNK):
+            out[start:start + VECTOR_CHUNK] = crypt_blocks(blocks[start:start + VECTOR_CHUNK], schedule)
+        return out
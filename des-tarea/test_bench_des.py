@@ -0,0 +1,85 @@
+import importlib.util
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import bench_des
+from DES import DES
+from bench_des import bench_compiled, compiled_crossover, run_suite, save_results
+from des_compiled import CompiledEngine, compiled_crypt_int
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class TestCompiledBenchmark(unittest.TestCase):
+    def test_crossover_from_measurements(self):
+        result = compiled_crossover(n_blocks=64, repeat=3)
+        self.assertEqual(result["table_bytes"], 16 * 4 * 1024 * 4)
+        self.assertGreater(result["build_ms"], 0)
+        saving_us = result["us_per_block_engine"] - result["us_per_block_compiled"]
+        if saving_us > 0:
+            # Bytes en los que lo ahorrado por bloque de 8 bytes paga la construcción de las tablas
+            expected = 8 * result["build_ms"] * 1e3 / saving_us
+            self.assertAlmostEqual(result["crossover_bytes"] / expected, 1.0, places=6)
+        else:
+            self.assertEqual(result["crossover_bytes"], float("inf"))
+
+    def test_no_crossover_without_saving(self):
+        # Con un motor compilado más lento que el de enteros, la construcción nunca se recupera
+        def slow(block, rounds):
+            time.sleep(1e-4)
+            return compiled_crypt_int(block, rounds)
+
+        with mock.patch.object(CompiledEngine, "crypt_int", staticmethod(slow)):
+            result = compiled_crossover(n_blocks=16, repeat=2)
+        self.assertGreater(result["us_per_block_compiled"], result["us_per_block_engine"])
+        self.assertEqual(result["crossover_bytes"], float("inf"))
+
+    def test_build_time_counts_against_compiled(self):
+        result = bench_compiled(64, repeat=1)
+        self.assertLess(result["mb_per_s_compiled_total"], result["mb_per_s_compiled"],
+                        "Contar la construcción de las tablas debe bajar los MB/s.")
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_block_cases_compute_the_same_block(self):
+        # Los casos de un bloque de DES deben medir el mismo cifrado con cada motor
+        expected = DES(bench_des.BENCH_KEY).encrypt_block(b"Un bloq.")
+        cases = {name: function for name, _, function in bench_des._block_cases(8 * 16)}
+        for name in ("referencia/bloque", "enteros/bloque", "compilado/bloque"):
+            self.assertEqual(cases[name](), expected, name)
+        if HAS_NUMPY:
+            self.assertEqual(int(cases["vector/bloque"]()[0]).to_bytes(8, "big"), expected)
+
+    @mock.patch.object(bench_des, "CASE_TIME_BUDGET", 0.001)
+    def test_suite(self):
+        seen = []
+        results = run_suite(bulk_bytes=8 * 64, progress=lambda key, result: seen.append(key))
+        self.assertEqual(seen, list(results), "progress debe llamarse con cada caso, en orden.")
+        numpy_cases = {"vector/volumen", "bitslice/volumen", "triple-vector/volumen"}
+        self.assertEqual(numpy_cases <= set(results), HAS_NUMPY, "Los casos con NumPy dependen de que esté instalado.")
+        for key, result in results.items():
+            if "/llave" in key:
+                self.assertEqual(set(result), {"keys_per_sec"}, key)
+                self.assertGreater(result["keys_per_sec"], 0, key)
+            else:
+                self.assertAlmostEqual(result["mb_per_s"], 8 * result["blocks_per_sec"] / 1e6, msg=key)
+
+    def test_save_results_keeps_case_names(self):
+        results = {"DES/llave en caché": {"keys_per_sec": 85000.0}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "resultados.json")
+            save_results(path, results, 1 << 20)
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        self.assertIn("llave en caché", text, "Los nombres de los casos deben guardarse sin escapar.")
+        data = json.loads(text)
+        self.assertEqual(data["resultados"], results)
+        self.assertEqual(data["bytes_volumen"], 1 << 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
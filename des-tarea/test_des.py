@@ -0,0 +1,738 @@
+import array
+import importlib.util
+import mmap
+import os
+import random
+import tempfile
+import unittest
+
+import DES as des_module
+from DES import DES, TripleDES
+import des_engine
+from des_compiled import CompiledEngine
+from des_engine import DESEngine, TripleDESEngine, crypt_int, key_schedule
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+    import des_bitslice
+    import des_vector
+    from des_bitslice import BitsliceEngine, from_planes, to_planes
+
+# Caracteres ASCII imprimibles para llaves aceptadas por la clase DES
+_KEY_CHARS = "".join(chr(c) for c in range(32, 127))
+
+
+class TestDESEngine(unittest.TestCase):
+    def test_known_vector(self):
+        # Ejemplo clásico de la especificación paso a paso de DES
+        engine = DESEngine(bytes.fromhex("133457799BBCDFF1"))
+        ciphertext = engine.encrypt_block(bytes.fromhex("0123456789ABCDEF"))
+        self.assertEqual(ciphertext.hex().upper(), "85E813540F0AB405")
+        self.assertEqual(engine.decrypt_block(ciphertext).hex().upper(), "0123456789ABCDEF")
+
+    def test_matches_reference(self):
+        rng = random.Random(15)
+        for _ in range(20):
+            key = "".join(rng.choice(_KEY_CHARS) for _ in range(8))
+            reference = DES(key)
+            engine = DESEngine(key.encode("ascii"))
+            for _ in range(5):
+                block = bytes(rng.randrange(256) for _ in range(8))
+                self.assertEqual(engine.encrypt_block(block), reference.encrypt_block(block))
+                self.assertEqual(engine.decrypt_block(block), reference.decrypt_block(block))
+
+    def test_round_trip(self):
+        rng = random.Random(16)
+        for _ in range(50):
+            schedule = key_schedule(bytes(rng.randrange(256) for _ in range(8)))
+            block = rng.getrandbits(64)
+            self.assertEqual(crypt_int(crypt_int(block, schedule), schedule[::-1]), block)
+
+    def test_invalid_key_length(self):
+        with self.assertRaises(ValueError):
+            DESEngine(b"corta")
+
+
+class TestDESMessages(unittest.TestCase):
+    def test_message_matches_reference_blocks(self):
+        des = DES("MiClave1")
+        message = "Por fin salio el cifradooo :D"
+        data = des.pad(message.encode("ascii"))
+        expected = b"".join(des.encrypt_block(data[i:i + 8]) for i in range(0, len(data), 8))
+        self.assertEqual(des.encrypt(message), expected)
+        self.assertEqual(des.decrypt(expected), message)
+
+
+class TestPadding(unittest.TestCase):
+    def setUp(self):
+        self.des = DES("MiClave1")
+
+    def test_pad_lengths(self):
+        for length in range(17):
+            data = bytes(range(length))
+            padded = self.des.pad(data)
+            pad_len = 8 - length % 8
+            self.assertEqual(len(padded), length + pad_len)
+            self.assertEqual(padded[length:], bytes([pad_len]) * pad_len)
+            self.assertEqual(self.des.unpad(padded), data)
+
+    def test_message_lengths(self):
+        # Mensajes de 0 a 17 caracteres: siempre se agrega al menos un byte de relleno
+        for length in range(18):
+            message = "x" * length
+            ciphertext = self.des.encrypt(message)
+            self.assertEqual(len(ciphertext), (length // 8 + 1) * 8)
+            self.assertEqual(self.des.decrypt(ciphertext), message)
+
+    def test_invalid_padding(self):
+        for padded in (b"", b"1234567\x00", b"1234567\x09", b"123456\x01\x02",
+                       b"12345\x03\x02\x03", b"\x03\x03"):
+            with self.assertRaises(ValueError, msg=padded):
+                self.des.unpad(padded)
+        self.assertEqual(self.des.unpad(b"\x08" * 8), b"")
+
+    def test_invalid_padding_after_decrypt(self):
+        # Un bloque que al descifrarse no termina en relleno válido
+        ciphertext = self.des._crypt_ecb(b"12345\x03\x02\x03")
+        with self.assertRaises(ValueError):
+            self.des.decrypt(ciphertext)
+        with self.assertRaises(ValueError):
+            self.des.decrypt_into(ciphertext, bytearray(8))
+        cipher = self.des.ecb(decrypt=True)
+        cipher.update(ciphertext)
+        with self.assertRaises(ValueError):
+            cipher.finalize()
+
+
+class TestKeys(unittest.TestCase):
+    # Ejemplo de FIPS 81 (llave 0123456789abcdef), verificado con OpenSSL
+    KEY = bytes.fromhex("0123456789abcdef")
+    IV = bytes.fromhex("1234567890abcdef")
+    PLAINTEXT = b"Now is the time for all "
+    VECTORS = {
+        "ecb": "3fa40e8a984d48156a271787ab8883f9893d51ec4b563b53",
+        "cbc": "e5c7cdde872bf27c43e934008c389c0f683788499a7c05f6",
+        "cfb": "f3096249c7f46e51a69e839b1a92f78403467133898ea622",
+        "ofb": "f3096249c7f46e5135f24a242eeb3d3f3d6d5be3255af8c3",
+    }
+
+    def test_binary_key_vectors(self):
+        des = DES(self.KEY)
+        ciphers = {
+            "ecb": des.ecb(padding=False),
+            "cbc": des.cbc(self.IV, padding=False),
+            "cfb": des.cfb(self.IV),
+            "ofb": des.ofb(self.IV),
+        }
+        for name, cipher in ciphers.items():
+            with self.subTest(mode=name):
+                output = cipher.update(self.PLAINTEXT) + cipher.finalize()
+                self.assertEqual(output.hex(), self.VECTORS[name])
+
+    def test_buffer_key_types(self):
+        expected = DES(self.KEY).encrypt("mensaje")
+        for key in (bytearray(self.KEY), memoryview(self.KEY), array.array("B", self.KEY)):
+            self.assertEqual(DES(key).encrypt("mensaje"), expected)
+        # Un entero no es una llave: bytes(8) serían ocho ceros
+        for key in (8, list(self.KEY), None):
+            with self.assertRaises(TypeError):
+                DES(key)
+        with self.assertRaises(TypeError):
+            TripleDES(16)
+
+    def test_text_key_equals_its_bytes(self):
+        self.assertEqual(DES("MiClave1").encrypt("mensaje"), DES(b"MiClave1").encrypt("mensaje"))
+
+    def test_reference_uses_binary_key(self):
+        des = DES(bytes(range(0x80, 0x88)))
+        block = bytes(range(8))
+        self.assertEqual(des.encrypt_block(block), des.engine.encrypt_block(block))
+
+    def test_parity(self):
+        DES(self.KEY, check_parity=True)
+        with self.assertRaises(ValueError):
+            DES(bytes.fromhex("0023456789abcdef"), check_parity=True)
+        # Sin revisar la paridad, la llave se acepta
+        DES(bytes.fromhex("0023456789abcdef"))
+
+    def test_invalid_key_length(self):
+        for key in ("corta", b"demasiado larga"):
+            with self.assertRaises(ValueError):
+                DES(key)
+
+    def test_schedule_cache(self):
+        key = bytes(range(8))
+        des_engine._schedule_cache.pop(key, None)
+        first = DES(key)
+        self.assertIn(key, des_engine._schedule_cache)
+        second = DES(key)
+        self.assertEqual(second.engine.schedule, first.engine.schedule)
+        self.assertEqual(second.engine.round_keys, DESEngine(key).round_keys)
+
+    def test_schedule_cache_evicts_least_recent(self):
+        saved = des_engine._schedule_cache.copy()
+        original_size = des_engine.SCHEDULE_CACHE_SIZE
+        try:
+            des_engine._schedule_cache.clear()
+            des_engine.SCHEDULE_CACHE_SIZE = 2
+            a, b, c = bytes(8), bytes([1] * 8), bytes([2] * 8)
+            des_engine.cached_schedule(a)
+            des_engine.cached_schedule(b)
+            des_engine.cached_schedule(a)
+            des_engine.cached_schedule(c)
+            self.assertEqual(list(des_engine._schedule_cache), [a, c])
+            self.assertEqual(des_engine.cached_schedule(b), key_schedule(b))
+        finally:
+            des_engine.SCHEDULE_CACHE_SIZE = original_size
+            des_engine._schedule_cache.clear()
+            des_engine._schedule_cache.update(saved)
+
+
+class TestModes(unittest.TestCase):
+    # Vectores generados con OpenSSL (des-ecb, des-cbc, des-cfb, des-ofb) para la llave 'MiClave1'
+    KEY = "MiClave1"
+    IV = bytes.fromhex("1234567890abcdef")
+    PLAINTEXT = b"Now is the time for all "
+    VECTORS = {
+        "ecb": "64a0a9d1fc13bd199129c802fdff6b909480d5b8f2f665b0",
+        "cbc": "0129c535f08360d05b4251c71daa3d8af1697bca756b52e9",
+        "cfb": "cc2f9a5c4268dff5b019c168c9fc6ad0a01a8e7be88f16e4",
+        "ofb": "cc2f9a5c4268dff5225b30d7ab86a602fdea3c4d37965117",
+        # nonce de 4 bytes seguido de un contador de 32 bits que empieza en cero
+        "ctr": "9d3f9be73fed746e3696728ee749d3e1376fe116e436e4f1",
+    }
+
+    def setUp(self):
+        self.des = DES(self.KEY)
+
+    @staticmethod
+    def run_chunked(cipher, data, sizes=(1, 3, 8, 5, 13)):
+        """Pasa data a update en trozos de tamaños variables y termina con finalize."""
+        output, start, i = [], 0, 0
+        while start < len(data):
+            size = sizes[i % len(sizes)]
+            output.append(cipher.update(data[start:start + size]))
+            start += size
+            i += 1
+        return b"".join(output) + cipher.finalize()
+
+    def ciphers(self):
+        """Pares (nombre, fábrica de cifrador, fábrica de descifrador) de cada modo."""
+        des, iv, nonce = self.des, self.IV, bytes.fromhex("12345678")
+        return [
+            ("ecb", lambda: des.ecb(padding=False), lambda: des.ecb(decrypt=True, padding=False)),
+            ("cbc", lambda: des.cbc(iv, padding=False), lambda: des.cbc(iv, decrypt=True, padding=False)),
+            ("cfb", lambda: des.cfb(iv), lambda: des.cfb(iv, decrypt=True)),
+            ("ofb", lambda: des.ofb(iv), lambda: des.ofb(iv)),
+            ("ctr", lambda: des.ctr(nonce), lambda: des.ctr(nonce)),
+        ]
+
+    def test_vectors(self):
+        for name, encryptor, decryptor in self.ciphers():
+            with self.subTest(mode=name):
+                ciphertext = bytes.fromhex(self.VECTORS[name])
+                self.assertEqual(self.run_chunked(encryptor(), self.PLAINTEXT), ciphertext)
+                self.assertEqual(self.run_chunked(decryptor(), ciphertext), self.PLAINTEXT)
+
+    def test_chunking_does_not_change_output(self):
+        data = bytes(range(256)) * 3 + b"cola"
+        for name, encryptor, decryptor in self.ciphers():
+            if name in ("ecb", "cbc"):
+                continue  # Sin relleno requieren bloques completos
+            with self.subTest(mode=name):
+                whole = encryptor()
+                expected = whole.update(data) + whole.finalize()
+                self.assertEqual(self.run_chunked(encryptor(), data, (7, 1, 64, 2)), expected)
+                self.assertEqual(self.run_chunked(decryptor(), expected, (9, 16, 3)), data)
+
+    def test_padding(self):
+        for length in (0, 1, 7, 8, 9, 16):
+            data = bytes(range(length))
+            for cipher, decipher in ((self.des.ecb(), self.des.ecb(decrypt=True)),
+                                     (self.des.cbc(self.IV), self.des.cbc(self.IV, decrypt=True))):
+                ciphertext = self.run_chunked(cipher, data)
+                self.assertEqual(len(ciphertext), (length // 8 + 1) * 8)
+                self.assertEqual(self.run_chunked(decipher, ciphertext), data)
+        # ECB con relleno coincide con DES.encrypt
+        message = "Por fin salio el cifradooo :D"
+        self.assertEqual(self.run_chunked(self.des.ecb(), message.encode("ascii")), self.des.encrypt(message))
+
+    def test_invalid_lengths(self):
+        cipher = self.des.cbc(self.IV, decrypt=True)
+        cipher.update(b"1234567")
+        with self.assertRaises(ValueError):
+            cipher.finalize()
+        cipher = self.des.ecb(padding=False)
+        cipher.update(b"123")
+        with self.assertRaises(ValueError):
+            cipher.finalize()
+        with self.assertRaises(ValueError):
+            self.des.cbc(b"corto")
+
+    def test_finalized(self):
+        cipher = self.des.ofb(self.IV)
+        cipher.finalize()
+        with self.assertRaises(ValueError):
+            cipher.update(b"datos")
+
+    def test_ctr_seek(self):
+        data = bytes(range(200))
+        expected = self.des.ctr(b"nonce").update(data)
+        for offset in (0, 3, 8, 77, 199):
+            cipher = self.des.ctr(b"nonce")
+            cipher.seek(offset)
+            self.assertEqual(cipher.update(data[offset:]), expected[offset:])
+            self.assertEqual(cipher.position, len(data))
+
+    def test_ctr_counter(self):
+        # Con un nonce de 8 bytes el contador ocupa todo el bloque y da la vuelta módulo 2^64
+        cipher = self.des.ctr(b"\xff" * 8)
+        keystream = cipher.update(bytes(16))
+        self.assertEqual(keystream[:8], self.des.engine.encrypt_block(b"\xff" * 8))
+        self.assertEqual(keystream[8:], self.des.engine.encrypt_block(bytes(8)))
+        # Con un nonce de 7 bytes solo hay 256 bloques de contador
+        cipher = self.des.ctr(b"1234567")
+        cipher.seek(256 * 8 - 8)
+        cipher.update(bytes(8))
+        with self.assertRaises(OverflowError):
+            cipher.update(b"x")
+
+
+class TestBuffers(unittest.TestCase):
+    def setUp(self):
+        self.des = DES("MiClave1")
+        self.message = "Por fin salio el cifradooo :D"
+        self.expected = self.des.encrypt(self.message)
+
+    def test_encrypt_into_buffer_types(self):
+        raw = self.message.encode("ascii")
+        for data in (raw, bytearray(raw), memoryview(raw), memoryview(bytearray(raw))[:]):
+            out = bytearray(self.des.output_size(len(raw)))
+            self.assertEqual(self.des.encrypt_into(data, out), len(self.expected))
+            self.assertEqual(bytes(out), self.expected)
+
+    def test_typed_buffers(self):
+        # Un arreglo de enteros de 64 bits se trata como sus bytes
+        values = array.array("Q", range(10))
+        out = array.array("Q", bytes(self.des.output_size(values.itemsize * len(values), padding=False)))
+        size = self.des.encrypt_into(values, out, padding=False)
+        self.assertEqual(size, 80)
+        self.assertEqual(out.tobytes(), self.des._crypt_ecb(values.tobytes()))
+
+    def test_mmap(self):
+        raw = bytes(range(256)) * 4
+        with tempfile.TemporaryFile() as f:
+            f.write(raw)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0) as mapped:
+                out = bytearray(self.des.output_size(len(mapped)))
+                size = self.des.encrypt_into(mapped, out)
+                # Descifrado en sitio sobre el mapa del archivo
+                mapped[:] = out[:len(mapped)]
+                plain = bytearray(size)
+                n = self.des.decrypt_into(out, plain)
+                self.assertEqual(bytes(plain[:n]), raw)
+                self.assertEqual(self.des.decrypt_into(mapped, mapped, padding=False), len(raw))
+                self.assertEqual(bytes(mapped), raw)
+
+    def test_caller_slice(self):
+        # Se puede escribir en una parte de un búfer más grande
+        out = bytearray(64)
+        size = self.des.encrypt_into(self.message.encode("ascii"), memoryview(out)[8:])
+        self.assertEqual(bytes(out[8:8 + size]), self.expected)
+        self.assertEqual(bytes(out[:8]), bytes(8))
+
+    def test_decrypt_in_place(self):
+        buffer = bytearray(self.expected)
+        n = self.des.decrypt_into(buffer, buffer)
+        self.assertEqual(buffer[:n].decode("ascii"), self.message)
+
+    def test_padding_lengths(self):
+        for length in (0, 1, 8, 15, 16):
+            data = os.urandom(length)
+            out = bytearray(self.des.output_size(length))
+            self.assertEqual(self.des.encrypt_into(data, out), len(out))
+            plain = bytearray(len(out))
+            self.assertEqual(bytes(plain[:self.des.decrypt_into(out, plain)]), data)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.des.encrypt_into(b"12345678", bytearray(8))  # Falta el bloque de relleno
+        with self.assertRaises(ValueError):
+            self.des.encrypt_into(b"123", bytearray(8), padding=False)
+        with self.assertRaises(ValueError):
+            self.des.decrypt_into(b"1234567", bytearray(8))
+        with self.assertRaises(ValueError):
+            self.des.decrypt_into(b"", bytearray(8))
+        with self.assertRaises(TypeError):
+            self.des.encrypt_into(b"12345678", b"solo lectura...." * 2, padding=False)
+
+    def test_files(self):
+        import des_files
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain_path = os.path.join(tmpdir, "claro.bin")
+            cipher_path = os.path.join(tmpdir, "cifrado.bin")
+            out_path = os.path.join(tmpdir, "descifrado.bin")
+            for length in (0, 7, 64, 1000):
+                data = os.urandom(length)
+                with open(plain_path, "wb") as f:
+                    f.write(data)
+                for chunk_size in (16, 64, des_files.FILE_CHUNK):
+                    written = des_files.encrypt_file(self.des, plain_path, cipher_path, chunk_size)
+                    with open(cipher_path, "rb") as f:
+                        ciphertext = f.read()
+                    self.assertEqual(written, len(ciphertext))
+                    self.assertEqual(ciphertext, self.des._crypt_ecb(self.des.pad(data)))
+                    self.assertEqual(des_files.decrypt_file(self.des, cipher_path, out_path, chunk_size), length)
+                    with open(out_path, "rb") as f:
+                        self.assertEqual(f.read(), data)
+            with self.assertRaises(ValueError):
+                des_files.encrypt_file(self.des, plain_path, cipher_path, chunk_size=12)
+
+
+class TestParallel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from des_parallel import ParallelDES
+
+        cls.des = DES("MiClave1")
+        # Trozos pequeños para que cada prueba reparta varias tareas
+        cls.parallel = ParallelDES(cls.des, processes=2, chunk_size=64)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.parallel.close()
+
+    def test_matches_sequential(self):
+        for length in (0, 5, 8, 100, 1000):
+            data = os.urandom(length)
+            out = bytearray(self.des.output_size(length))
+            self.des.encrypt_into(data, out)
+            self.assertEqual(self.parallel.encrypt(data), bytes(out))
+            self.assertEqual(self.parallel.decrypt(out), data)
+            self.assertEqual(self.parallel.ctr(b"abcd", data), self.des.ctr(b"abcd").update(data))
+        data = os.urandom(800)
+        self.assertEqual(self.parallel.encrypt(data, padding=False), self.des._crypt_ecb(data))
+        self.assertEqual(self.parallel.decrypt(self.des._crypt_ecb(data), padding=False), data)
+
+    def test_files(self):
+        data = os.urandom(1000)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain, cipher, out = (os.path.join(tmpdir, name) for name in ("claro", "cifrado", "descifrado"))
+            with open(plain, "wb") as f:
+                f.write(data)
+            # Las ventanas son de 2 * 64 bytes: el archivo se procesa en varias
+            self.assertEqual(self.parallel.encrypt_file(plain, cipher), self.des.output_size(len(data)))
+            with open(cipher, "rb") as f:
+                self.assertEqual(f.read(), self.des._crypt_ecb(self.des.pad(data)))
+            self.assertEqual(self.parallel.decrypt_file(cipher, out), len(data))
+            with open(out, "rb") as f:
+                self.assertEqual(f.read(), data)
+            self.parallel.ctr_file(b"abcd", plain, cipher)
+            with open(cipher, "rb") as f:
+                self.assertEqual(f.read(), self.des.ctr(b"abcd").update(data))
+
+    def test_errors(self):
+        from des_parallel import ParallelDES
+
+        with self.assertRaises(ValueError):
+            ParallelDES(self.des, chunk_size=12)
+        with self.assertRaises(ValueError):
+            self.parallel.decrypt(b"1234567")
+        with self.assertRaises(ValueError):
+            self.parallel.encrypt(b"123", padding=False)
+        # El nonce se revisa antes de repartir el trabajo, igual que en DES.ctr
+        with self.assertRaises(ValueError):
+            self.parallel.ctr(b"123456789", b"datos")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = os.path.join(tmpdir, "claro")
+            with open(plain, "wb") as f:
+                f.write(b"datos")
+            with self.assertRaises(ValueError):
+                self.parallel.ctr_file(b"123456789", plain, os.path.join(tmpdir, "cifrado"))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "cifrado")))
+
+
+class TestTripleDES(unittest.TestCase):
+    # Ejemplo de SP 800-67 (EDE3); los demás vectores se generaron con OpenSSL
+    # (des-ede3-*, y des-ede-* con K1 || K2 para EDE2)
+    KEY = bytes.fromhex("0123456789ABCDEF23456789ABCDEF01456789ABCDEF0123")
+    IV = bytes.fromhex("1234567890abcdef")
+    PLAINTEXT = b"The qufck brown fox jump"
+    VECTORS = {
+        24: {
+            "ecb": "a826fd8ce53b855fcce21c8112256fe668d5c05dd9b6b900",
+            "cbc": "38413d4ba2325cf1141f707471ac2ced57db530f0123b5ac",
+            "cfb": "f479d55c02165516ded179420f7ca8621e622c178b498156",
+            "ofb": "f479d55c0216551699cf2306047c850787e280f9e73fb9d9",
+        },
+        16: {
+            "ecb": "c44862f70cf2fbdc9077d0909fa91b884cabd61fc58e0cbb",
+            "cbc": "b0ed7d5e6849dc73cfb0c1915e64897f8182f143185f6cf1",
+            "cfb": "9f57ac903a375055a89207c78212219ef996f53e6d57592c",
+            "ofb": "9f57ac903a3750553cbc10ee99f461af87d24d4023842488",
+        },
+    }
+
+    def test_vectors(self):
+        for length, vectors in self.VECTORS.items():
+            des3 = TripleDES(self.KEY[:length])
+            ciphers = {
+                "ecb": (des3.ecb(padding=False), des3.ecb(decrypt=True, padding=False)),
+                "cbc": (des3.cbc(self.IV, padding=False), des3.cbc(self.IV, decrypt=True, padding=False)),
+                "cfb": (des3.cfb(self.IV), des3.cfb(self.IV, decrypt=True)),
+                "ofb": (des3.ofb(self.IV), des3.ofb(self.IV)),
+            }
+            for name, (encryptor, decryptor) in ciphers.items():
+                with self.subTest(key_length=length, mode=name):
+                    ciphertext = bytes.fromhex(vectors[name])
+                    self.assertEqual(TestModes.run_chunked(encryptor, self.PLAINTEXT), ciphertext)
+                    self.assertEqual(TestModes.run_chunked(decryptor, ciphertext), self.PLAINTEXT)
+
+    def test_matches_chained_des(self):
+        rng = random.Random(21)
+        for length in (16, 24):
+            key = bytes(rng.randrange(256) for _ in range(length))
+            des3 = TripleDES(key)
+            first, second = DES(key[:8]), DES(key[8:16])
+            third = DES(key[16:]) if length == 24 else first
+            for _ in range(5):
+                block = bytes(rng.randrange(256) for _ in range(8))
+                expected = third.encrypt_block(second.decrypt_block(first.encrypt_block(block)))
+                self.assertEqual(des3.engine.encrypt_block(block), expected)
+                self.assertEqual(des3.encrypt_block(block), expected)
+                self.assertEqual(des3.engine.decrypt_block(expected), block)
+                self.assertEqual(des3.decrypt_block(expected), block)
+
+    def test_single_key_is_des(self):
+        # Con K1 = K2 = K3, EDE equivale a un solo DES
+        des3 = TripleDES("MiClave1" * 3)
+        self.assertEqual(des3.encrypt("Por fin salio el cifradooo :D"), DES("MiClave1").encrypt("Por fin salio el cifradooo :D"))
+
+    def test_ctr(self):
+        des3 = TripleDES(self.KEY)
+        data = bytes(range(200))
+        counters = b"".join((0x12345678 << 32 | i).to_bytes(8, "big") for i in range(25))
+        keystream = des3.engine.encrypt(counters)
+        self.assertEqual(des3.ctr(bytes.fromhex("12345678")).update(data), bytes(a ^ b for a, b in zip(data, keystream)))
+
+    def test_buffers_and_files(self):
+        des3 = TripleDES(self.KEY)
+        data = os.urandom(1000)
+        out = bytearray(des3.output_size(len(data)))
+        des3.encrypt_into(data, out)
+        self.assertEqual(bytes(out), des3.engine.encrypt(des3.pad(data)))
+        self.assertEqual(bytes(out[:des3.decrypt_into(out, out)]), data)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain, cipher, back = (os.path.join(tmpdir, name) for name in ("claro", "cifrado", "descifrado"))
+            with open(plain, "wb") as f:
+                f.write(data)
+            des3.encrypt_file(plain, cipher)
+            des3.decrypt_file(cipher, back)
+            with open(back, "rb") as f:
+                self.assertEqual(f.read(), data)
+
+    def test_parallel(self):
+        from des_parallel import ParallelDES
+
+        des3 = TripleDES(self.KEY)
+        data = os.urandom(1000)
+        with ParallelDES(des3, processes=2, chunk_size=64) as parallel:
+            self.assertEqual(parallel.encrypt(data), des3.engine.encrypt(des3.pad(data)))
+            self.assertEqual(parallel.ctr(b"abcd", data), des3.ctr(b"abcd").update(data))
+
+    def test_invalid_keys(self):
+        for key in ("MiClave1", b"x" * 20):
+            with self.assertRaises(ValueError):
+                TripleDES(key)
+        with self.assertRaises(ValueError):
+            TripleDES(bytes.fromhex("0123456789abcdef0023456789abcdef"), check_parity=True)
+        TripleDES(self.KEY[:16], check_parity=True)
+
+
+@unittest.skipUnless(HAS_NUMPY, "El modo bitslice requiere NumPy.")
+class TestBitslice(unittest.TestCase):
+    def test_planes_round_trip(self):
+        rng = random.Random(17)
+        for n_blocks in (1, 63, 64, 65, 200):
+            data = bytes(rng.randrange(256) for _ in range(8 * n_blocks))
+            planes = to_planes(data, n_blocks)
+            self.assertEqual(planes.shape, (64, -(-n_blocks // 64)))
+            self.assertEqual(from_planes(planes, n_blocks), data)
+
+    def test_plane_bits(self):
+        # El plano i guarda el bit i + 1 de cada bloque; el bloque 0 va en el bit más significativo
+        data = bytes.fromhex("8000000000000001") + bytes(8) * 2 + bytes.fromhex("0100000000000000")
+        planes = to_planes(data, 4)
+        self.assertEqual(int(planes[0, 0]), 1 << 63)
+        self.assertEqual(int(planes[63, 0]), 1 << 63)
+        self.assertEqual(int(planes[7, 0]), 1 << 60)
+        self.assertEqual(int(np.count_nonzero(planes)), 3)
+
+    def test_matches_engine(self):
+        rng = random.Random(18)
+        for n_blocks in (1, 64, 130):
+            key = bytes(rng.randrange(256) for _ in range(8))
+            data = bytes(rng.randrange(256) for _ in range(8 * n_blocks))
+            engine = DESEngine(key)
+            expected = b"".join(engine.encrypt_block(data[i:i + 8]) for i in range(0, len(data), 8))
+            bitslice = BitsliceEngine(key)
+            self.assertEqual(bitslice.encrypt(data), expected)
+            self.assertEqual(bitslice.decrypt(expected), data)
+
+    def test_chunks(self):
+        old_chunk = des_bitslice.CHUNK_BLOCKS
+        des_bitslice.CHUNK_BLOCKS = 64
+        try:
+            key = b"abcdefgh"
+            data = bytes(range(256)) * 5
+            engine = DESEngine(key)
+            expected = b"".join(engine.encrypt_block(data[i:i + 8]) for i in range(0, len(data), 8))
+            self.assertEqual(BitsliceEngine(key).encrypt(data), expected)
+        finally:
+            des_bitslice.CHUNK_BLOCKS = old_chunk
+
+    def test_invalid_length(self):
+        with self.assertRaises(ValueError):
+            BitsliceEngine(b"abcdefgh").encrypt(b"12345")
+
+    def test_des_uses_bitslice_for_long_messages(self):
+        des = DES("MiClave1")
+        message = "Mensaje largo. " * 1000
+        self.assertGreaterEqual(len(message) // 8, des_module.BITSLICE_MIN_BLOCKS)
+        data = des.pad(message.encode("ascii"))
+        expected = b"".join(des.engine.encrypt_block(data[i:i + 8]) for i in range(0, len(data), 8))
+        self.assertEqual(des.encrypt(message), expected)
+        self.assertIsNotNone(des._bitslice)
+        self.assertEqual(des.decrypt(expected), message)
+
+    def test_encrypt_into_large(self):
+        des = DES("MiClave1")
+        data = os.urandom(8 * des_module.BITSLICE_MIN_BLOCKS + 5)
+        out = bytearray(des.output_size(len(data)))
+        des.encrypt_into(data, out)
+        self.assertEqual(bytes(out), des.engine.encrypt(des.pad(data)))
+        n = des.decrypt_into(out, out)
+        self.assertEqual(bytes(out[:n]), data)
+
+    def test_batched_modes(self):
+        # CTR, y CBC y CFB al descifrar, usan el modo bitslice con lotes grandes
+        des = DES("MiClave1")
+        iv = bytes(range(8))
+        data = bytes(range(256)) * 40
+        n_blocks = len(data) // 8
+        self.assertGreaterEqual(n_blocks, des_module.BITSLICE_MIN_BLOCKS)
+        engine = des.engine
+        counters = b"".join(i.to_bytes(8, "big") for i in range(n_blocks))
+        keystream = b"".join(engine.encrypt_block(counters[i:i + 8]) for i in range(0, len(counters), 8))
+        self.assertEqual(des.ctr(b"").update(data), bytes(a ^ b for a, b in zip(data, keystream)))
+        for make in (lambda d: des.cbc(iv, decrypt=d, padding=False), lambda d: des.cfb(iv, decrypt=d)):
+            cipher = make(False)
+            ciphertext = cipher.update(data) + cipher.finalize()
+            decipher = make(True)
+            self.assertEqual(decipher.update(ciphertext) + decipher.finalize(), data)
+
+    def test_triple_des(self):
+        des3 = TripleDES(bytes(range(24)))
+        data = os.urandom(8 * des_module.BITSLICE_MIN_BLOCKS)
+        engine = TripleDESEngine(bytes(range(24)))
+        self.assertEqual(des3.bitslice.encrypt(data), engine.encrypt(data))
+        self.assertEqual(des3.bitslice.decrypt(data), engine.decrypt(data))
+
+
+
+class TestCompiled(unittest.TestCase):
+    def test_matches_engine(self):
+        rng = random.Random(25)
+        for _ in range(5):
+            des = DES(bytes(rng.randrange(256) for _ in range(8)))
+            data = bytes(rng.randrange(256) for _ in range(8 * 50))
+            ciphertext = des.compiled.encrypt(data)
+            self.assertEqual(ciphertext, des.engine.encrypt(data))
+            self.assertEqual(des.compiled.decrypt(ciphertext), data)
+            self.assertEqual(des.compiled.encrypt_block(data[:8]), des.encrypt_block(data[:8]))
+            self.assertEqual(des.compiled.decrypt_block(ciphertext[:8]), data[:8])
+
+    def test_known_vector(self):
+        engine = CompiledEngine(bytes.fromhex("133457799BBCDFF1"))
+        self.assertEqual(engine.encrypt_block(bytes.fromhex("0123456789ABCDEF")).hex(), "85e813540f0ab405")
+
+    def test_lazy_tables(self):
+        des = DES("MiClave1")
+        engine = des.compiled
+        self.assertIs(des.compiled, engine)
+        self.assertFalse(engine.compiled)
+        self.assertEqual(engine.table_bytes, 0)
+        self.assertEqual(engine.round_keys, des.engine.round_keys)
+        self.assertFalse(engine.compiled, "round_keys no debe construir las tablas.")
+        buffer = bytearray(b"12345678" * 3)
+        engine.crypt_into(buffer, buffer, decrypt=True)
+        self.assertTrue(engine.compiled)
+        self.assertEqual(engine.table_bytes, 16 * 4 * 1024 * 4)
+        self.assertEqual(bytes(buffer), des.engine.decrypt(b"12345678" * 3))
+
+    def test_single_des_only(self):
+        with self.assertRaises(ValueError):
+            TripleDES(TestTripleDES.KEY).compiled
+
+
+@unittest.skipUnless(HAS_NUMPY, "encrypt_blocks requiere NumPy.")
+class TestVector(unittest.TestCase):
+    def test_matches_per_block(self):
+        rng = random.Random(22)
+        for _ in range(5):
+            des = DES(bytes(rng.randrange(256) for _ in range(8)))
+            data = bytes(rng.randrange(256) for _ in range(8 * 40))
+            blocks = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+            ciphertext = des.encrypt_blocks(blocks)
+            self.assertEqual(ciphertext.dtype, np.uint64)
+            for i in range(40):
+                block = data[8 * i:8 * i + 8]
+                self.assertEqual(int(ciphertext[i]).to_bytes(8, "big"), des.engine.encrypt_block(block))
+            # La implementación de referencia es lenta: se comparan solo algunos bloques
+            for i in (0, 39):
+                self.assertEqual(int(ciphertext[i]).to_bytes(8, "big"), des.encrypt_block(data[8 * i:8 * i + 8]))
+            self.assertTrue(np.array_equal(des.decrypt_blocks(ciphertext), blocks))
+
+    def test_known_vector(self):
+        des = DES(bytes.fromhex("133457799BBCDFF1"))
+        ciphertext = des.encrypt_blocks(np.array([0x0123456789ABCDEF], dtype=np.uint64))
+        self.assertEqual(int(ciphertext[0]), 0x85E813540F0AB405)
+
+    def test_triple_des(self):
+        des3 = TripleDES(TestTripleDES.KEY)
+        blocks = np.frombuffer(TestTripleDES.PLAINTEXT, dtype=">u8").astype(np.uint64)
+        ciphertext = des3.encrypt_blocks(blocks)
+        self.assertEqual(ciphertext.astype(">u8").tobytes().hex(), TestTripleDES.VECTORS[24]["ecb"])
+        self.assertTrue(np.array_equal(des3.decrypt_blocks(ciphertext), blocks))
+
+    def test_chunks_and_ctr(self):
+        # Contadores de CTR como arreglo; varios tramos de VECTOR_CHUNK
+        des = DES("MiClave1")
+        original = des_vector.VECTOR_CHUNK
+        des_vector.VECTOR_CHUNK = 64
+        try:
+            counters = np.arange(1000, dtype=np.uint64)
+            keystream = des.encrypt_blocks(counters).astype(">u8").tobytes()
+        finally:
+            des_vector.VECTOR_CHUNK = original
+        data = os.urandom(8000)
+        expected = des.ctr(b"").update(data)
+        self.assertEqual(bytes(a ^ b for a, b in zip(data, keystream)), expected)
+
+    def test_input_types(self):
+        des = DES("MiClave1")
+        expected = des.encrypt_blocks(np.arange(10, dtype=np.uint64))
+        self.assertTrue(np.array_equal(des.encrypt_blocks(list(range(10))), expected))
+        self.assertTrue(np.array_equal(des.encrypt_blocks(np.arange(10, dtype=np.int32)), expected))
+        self.assertEqual(len(des.encrypt_blocks(np.array([], dtype=np.uint64))), 0)
+        with self.assertRaises(ValueError):
+            des.encrypt_blocks(np.zeros((2, 2), dtype=np.uint64))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from DES import DES, TripleDES
+import des_service
+from des_service import OP_DECRYPT, OP_ENCRYPT, DESClient, DESService
+
+KEY = b"MiClave1"
+TRIPLE_KEY = bytes.fromhex("0123456789ABCDEF23456789ABCDEF01456789ABCDEF0123")
+
+
+class TestService(unittest.IsolatedAsyncioTestCase):
+    async def test_submit_matches_des(self):
+        service = DESService()
+        for key, cipher in ((KEY, DES(KEY)), (TRIPLE_KEY, TripleDES(TRIPLE_KEY)), (TRIPLE_KEY[:16], TripleDES(TRIPLE_KEY[:16]))):
+            for length in (0, 5, 8, 100):
+                data = os.urandom(length)
+                ciphertext = await service.submit(OP_ENCRYPT, key, data)
+                self.assertEqual(ciphertext, cipher._crypt_ecb(cipher.pad(data)))
+                self.assertEqual(await service.submit(OP_DECRYPT, key, ciphertext), data)
+
+    async def test_coalescing(self):
+        # Con una espera larga, las peticiones simultáneas de una misma llave van en un lote
+        service = DESService(max_batch=10000, linger=0.05)
+        messages = [os.urandom(n) for n in range(40)]
+        other = DES(b"OtraClav")
+        results = await asyncio.gather(*(service.submit(OP_ENCRYPT, KEY, m) for m in messages),
+                                       service.submit(OP_ENCRYPT, b"OtraClav", b"hola"))
+        des = DES(KEY)
+        self.assertEqual(results[:-1], [des._crypt_ecb(des.pad(m)) for m in messages])
+        self.assertEqual(results[-1], other._crypt_ecb(other.pad(b"hola")))
+        metrics = service.metrics()
+        self.assertEqual(metrics["requests"], 41)
+        self.assertEqual(metrics["batches"], 2)  # Uno por llave
+        self.assertAlmostEqual(metrics["requests_per_batch"], 20.5)
+
+    async def test_max_batch(self):
+        # Cada mensaje de 8 bytes ocupa 2 bloques con el relleno: lotes de 3 mensajes
+        service = DESService(max_batch=6, linger=10)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(service.submit(OP_ENCRYPT, KEY, b"12345678") for _ in range(9))), timeout=5)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(service.metrics()["batches"], 3)
+
+    async def test_errors_stay_per_request(self):
+        service = DESService(linger=0.01)
+        des = DES(KEY)
+        good = des._crypt_ecb(des.pad(b"bien"))
+        bad = des._crypt_ecb(b"12345\x03\x02\x03")  # Relleno inválido al descifrar
+        results = await asyncio.gather(service.submit(OP_DECRYPT, KEY, good), service.submit(OP_DECRYPT, KEY, bad),
+                                       return_exceptions=True)
+        self.assertEqual(results[0], b"bien")
+        self.assertIsInstance(results[1], ValueError)
+        for key, data in ((b"corta", b""), (KEY, b"1234567")):
+            with self.assertRaises(ValueError):
+                await service.submit(OP_DECRYPT, key, data)
+        self.assertEqual(service.metrics()["errors"], 3)
+
+    async def test_batch_failure_reaches_every_request(self):
+        # Si el cifrado del lote falla, cada petición recibe el error en lugar de quedarse esperando
+        def failing(cipher, data, decrypt):
+            raise RuntimeError("falla del lote")
+
+        original = des_service._crypt
+        des_service._crypt = failing
+        try:
+            service = DESService(linger=0.01)
+            results = await asyncio.wait_for(asyncio.gather(
+                *(service.submit(OP_ENCRYPT, KEY, b"hola") for _ in range(3)), return_exceptions=True), timeout=5)
+            self.assertTrue(all(isinstance(r, RuntimeError) for r in results), results)
+            self.assertEqual(service.metrics()["errors"], 3)
+            port = await service.start_tcp()
+            client = await DESClient.connect_tcp(port=port)
+            try:
+                with self.assertRaises(ValueError):
+                    await asyncio.wait_for(client.encrypt(KEY, b"hola"), timeout=5)
+            finally:
+                await client.close()
+                await service.close()
+        finally:
+            des_service._crypt = original
+
+    async def test_keys_are_reused(self):
+        service = DESService()
+        self.assertIs(service.cipher(KEY), service.cipher(bytearray(KEY)))
+        self.assertIsInstance(service.cipher(TRIPLE_KEY), TripleDES)
+        with self.assertRaises(ValueError):
+            DESService(max_batch=0)
+
+    async def test_tcp_client(self):
+        service = DESService(linger=0.01)
+        port = await service.start_tcp()
+        client = await DESClient.connect_tcp(port=port)
+        try:
+            messages = [os.urandom(n) for n in range(0, 200, 7)]
+            ciphertexts = await asyncio.gather(*(client.encrypt(TRIPLE_KEY, m) for m in messages))
+            cipher = TripleDES(TRIPLE_KEY)
+            self.assertEqual(ciphertexts, [cipher._crypt_ecb(cipher.pad(m)) for m in messages])
+            self.assertEqual(await asyncio.gather(*(client.decrypt(TRIPLE_KEY, c) for c in ciphertexts)), messages)
+            with self.assertRaises(ValueError):
+                await client.decrypt(TRIPLE_KEY, b"123")
+            metrics = await client.metrics()
+            self.assertEqual(metrics["requests"], 2 * len(messages) + 1)
+            self.assertLess(metrics["batches"], 2 * len(messages))
+            self.assertGreater(metrics["latency_p99_ms"], 0)
+        finally:
+            await client.close()
+            await service.close()
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Se requieren sockets Unix.")
+    async def test_unix_client(self):
+        service = DESService()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "des.sock")
+            await service.start_unix(path)
+            client = await DESClient.connect_unix(path)
+            try:
+                ciphertext = await client.encrypt(KEY, b"Por fin salio el cifradooo :D")
+                self.assertEqual(ciphertext, DES(KEY).encrypt("Por fin salio el cifradooo :D"))
+                self.assertEqual(await client.decrypt(KEY, ciphertext), b"Por fin salio el cifradooo :D")
+            finally:
+                await client.close()
+                await service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()